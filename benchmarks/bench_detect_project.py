@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.10"
+# ///
+"""
+Benchmark recursive project detection on a synthetic monorepo.
+
+Builds a throwaway tree with many sub-projects, each carrying sources and
+a node_modules or .venv full of dependency files, plus a .git directory
+of loose objects. Times detect_projects() serially and with a thread
+pool against a naive os.walk() that classifies every directory with no
+depth limit and no pruning.
+
+Usage:
+    python benchmarks/bench_detect_project.py
+    python benchmarks/bench_detect_project.py --projects 2000 --deps 200 --jobs 16
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "shared"))
+
+from detect_project import DEFAULT_MAX_DEPTH, detect_project, detect_projects  # noqa: E402
+
+MANIFESTS = ["package.json", "pyproject.toml", "go.mod", "Cargo.toml"]
+
+
+def _touch(path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.touch()
+
+
+def generate_tree(root: Path, projects: int, deps: int) -> int:
+    """Create the corpus under root; return the number of files written."""
+    files = 0
+    _touch(root / "package.json")
+    for i in range(256):
+        _touch(root / ".git" / "objects" / f"{i:02x}" / ("0" * 38))
+    files += 257
+    for i in range(projects):
+        group = ("packages", "services", "libs")[i % 3]
+        project = root / group / f"project-{i:05d}"
+        manifest = MANIFESTS[i % len(MANIFESTS)]
+        _touch(project / manifest)
+        for j in range(5):
+            _touch(project / "src" / f"module_{j}.txt")
+        # Dependency installs dwarf the project itself
+        installs = project / ("node_modules" if manifest == "package.json" else ".venv")
+        for j in range(deps):
+            # Every installed package is itself a project the walk should not report
+            name = "package.json" if j < 20 else f"file_{j}.txt"
+            _touch(installs / f"dep-{j % 20}" / name)
+        files += 6 + deps
+    return files
+
+
+def naive_walk(root: Path) -> list[dict]:
+    """Classify every directory in the tree, descending everywhere."""
+    results = []
+    for dirpath, _, _ in os.walk(root):
+        result = detect_project(Path(dirpath))
+        if result["type"] != "unknown":
+            results.append(result)
+    return results
+
+
+def timed(fn, repeat: int) -> tuple[float, list]:
+    """Best wall time over repeat calls, and the last result."""
+    best, result = float("inf"), []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark recursive project detection")
+    parser.add_argument("--projects", type=int, default=1000, help="Sub-projects in the tree")
+    parser.add_argument("--deps", type=int, default=100,
+                        help="Dependency files installed per sub-project")
+    parser.add_argument("--max-depth", type=int, default=DEFAULT_MAX_DEPTH,
+                        help="Depth limit for detect_projects()")
+    parser.add_argument("--jobs", type=int, default=8, help="Threads for the parallel walk")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions (best is kept)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        files = generate_tree(root, args.projects, args.deps)
+        print(f"{args.projects} sub-projects, {files:,} files")
+
+        naive, naive_found = timed(lambda: naive_walk(root), args.repeat)
+        serial, found = timed(lambda: detect_projects(root, args.max_depth), args.repeat)
+        parallel, parallel_found = timed(
+            lambda: detect_projects(root, args.max_depth, jobs=args.jobs), args.repeat
+        )
+        assert parallel_found == found
+
+        print(f"  naive walk      {naive * 1000:8.1f} ms  ({len(naive_found)} projects)")
+        print(f"  recursive       {serial * 1000:8.1f} ms  ({len(found)} projects, "
+              f"{naive / serial:.1f}x)")
+        print(f"  recursive -j{args.jobs:<2} {parallel * 1000:8.1f} ms  ({naive / parallel:.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.10"
+# ///
+"""
+Benchmark the frontmatter YAML parser against the legacy line-splitting parser.
+
+The legacy parser (kept here verbatim for comparison) handled one nesting
+level and no block scalars. The benchmark times both on frontmatter shaped
+like real skills and on the same frontmatter with a large metadata block,
+and checks that they agree wherever the legacy parser was correct.
+
+Usage:
+    python benchmarks/bench_frontmatter.py
+    python benchmarks/bench_frontmatter.py --documents 20000 --repeat 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "shared"))
+
+from frontmatter import parse_yaml  # noqa: E402
+
+SIMPLE = '''name: pdf-reader-{i}
+description: "Extracts text and tables from PDF files. Use when asked to read PDFs."
+license: MIT
+compatibility: Any environment
+argument-hint: "[path]"
+user-invocable: true
+metadata:
+  author: tester
+  version: "1.{i}.0"'''
+
+LARGE = SIMPLE + ''.join(f'\n  key{n}: "value {n} for {{i}}"' for n in range(40))
+
+
+def legacy_parse_simple_yaml(text: str) -> dict[str, Any]:
+    """The parser frontmatter.parse_yaml() replaced (one nesting level, no positions)."""
+    result: dict[str, Any] = {}
+    lines = text.split('\n')
+    current_key = None
+    nested_content: list[str] = []
+
+    for line in lines:
+        if not line.strip() or line.strip().startswith('#'):
+            continue
+
+        indent = len(line) - len(line.lstrip())
+        stripped = line.strip()
+
+        if indent == 0 and ':' in stripped:
+            if current_key and nested_content:
+                result[current_key] = legacy_parse_nested_yaml(nested_content)
+                nested_content = []
+
+            key, _, value = stripped.partition(':')
+            key = key.strip()
+            value = value.strip()
+
+            if value:
+                result[key] = legacy_parse_yaml_value(value)
+                current_key = None
+            else:
+                current_key = key
+        elif current_key and indent > 0:
+            nested_content.append(line)
+
+    if current_key and nested_content:
+        result[current_key] = legacy_parse_nested_yaml(nested_content)
+
+    return result
+
+
+def legacy_parse_nested_yaml(lines: list[str]) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    for line in lines:
+        stripped = line.strip()
+        if ':' in stripped and not stripped.startswith('#'):
+            key, _, value = stripped.partition(':')
+            key = key.strip()
+            value = value.strip()
+            if value:
+                result[key] = legacy_parse_yaml_value(value)
+    return result
+
+
+def legacy_parse_yaml_value(value: str) -> str:
+    value = value.strip()
+    if (value.startswith('"') and value.endswith('"')) or \
+       (value.startswith("'") and value.endswith("'")):
+        return value[1:-1]
+    return value
+
+
+def bench(parse, documents: list[str], repeat: int) -> float:
+    """Best-of-repeat seconds to parse every document once."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for document in documents:
+            parse(document)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark frontmatter YAML parsers")
+    parser.add_argument("--documents", type=int, default=5000, help="Documents per corpus")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions (best is kept)")
+    args = parser.parse_args()
+
+    status = 0
+    for label, template in (("simple", SIMPLE), ("large metadata", LARGE)):
+        documents = [template.format(i=i) for i in range(args.documents)]
+        mismatches = sum(
+            legacy_parse_simple_yaml(document) != parse_yaml(document)[0]
+            for document in documents[:100]
+        )
+        if mismatches:
+            status = 1
+
+        legacy = bench(legacy_parse_simple_yaml, documents, args.repeat)
+        current = bench(parse_yaml, documents, args.repeat)
+        per_doc = 1e6 / args.documents
+        print(f"{label} ({args.documents} documents, {len(template.splitlines())} lines each)")
+        print(f"  legacy      {legacy * per_doc:8.2f} us/doc")
+        print(f"  parse_yaml  {current * per_doc:8.2f} us/doc  ({current / legacy:.2f}x legacy)")
+        print(f"  mismatches  {mismatches}")
+
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.10"
+# ///
+"""
+Benchmark the token estimator on a synthetic corpus of skill files.
+
+Times estimating every file cold (empty cache), then again warm (every
+file a cache hit), and compares both against the chars/4 rule of thumb
+that the character budget stands in for. Files are SKILL.md-shaped
+Markdown: prose, lists, headings, links and fenced code.
+
+Usage:
+    python benchmarks/bench_token_estimate.py
+    python benchmarks/bench_token_estimate.py --files 10000 --lines 200 --repeat 5
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "shared"))
+
+from token_estimate import TokenEstimator  # noqa: E402
+
+WORDS = (
+    "skill file summary report parse extract render chart table index schema "
+    "config request response document module batch queue cache validate "
+    "references scripts output format markdown section example workflow"
+).split()
+
+CODE = '''```python
+def run(path: str) -> dict:
+    with open(path) as f:
+        return {"lines": len(f.readlines()), "path": path}
+```'''
+
+
+def generate_documents(files: int, lines: int, seed: int = 0) -> list[str]:
+    """Build files Markdown documents of roughly lines lines each."""
+    rng = random.Random(seed)
+    documents = []
+    for i in range(files):
+        parts = [f"---\nname: bench-{i:05d}\ndescription: Bench skill {i}.\n---\n"]
+        while sum(part.count("\n") + 1 for part in parts) < lines:
+            kind = rng.random()
+            if kind < 0.1:
+                parts.append(f"## {rng.choice(WORDS).capitalize()} {i}")
+            elif kind < 0.2:
+                parts.append(CODE)
+            elif kind < 0.35:
+                parts.append(f"- See [{rng.choice(WORDS)}](references/{rng.choice(WORDS)}.md)")
+            else:
+                parts.append(" ".join(rng.choice(WORDS) for _ in range(14)).capitalize() + ".")
+        documents.append("\n".join(parts) + "\n")
+    return documents
+
+
+def bench(estimator: TokenEstimator, documents: list[str]) -> tuple[float, int]:
+    """Seconds to estimate every document once, and the total estimate."""
+    start = time.perf_counter()
+    total = sum(estimator.estimate(document) for document in documents)
+    return time.perf_counter() - start, total
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the token estimator")
+    parser.add_argument("--files", type=int, default=10000, help="Documents in the corpus")
+    parser.add_argument("--lines", type=int, default=150, help="Approximate lines per document")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions (best is kept)")
+    args = parser.parse_args()
+
+    documents = generate_documents(args.files, args.lines)
+    chars = sum(len(document) for document in documents)
+
+    cold = warm = float("inf")
+    total = 0
+    for _ in range(args.repeat):
+        estimator = TokenEstimator(max_entries=args.files)
+        seconds, total = bench(estimator, documents)
+        cold = min(cold, seconds)
+        warm = min(warm, bench(estimator, documents)[0])
+
+    print(f"{args.files} files, {chars / 1e6:.1f} MB, ~{args.lines} lines each")
+    print(f"  cold   {cold * 1000:8.1f} ms  ({args.files / cold:,.0f} files/s, "
+          f"{chars / cold / 1e6:.1f} MB/s)")
+    print(f"  warm   {warm * 1000:8.1f} ms  ({args.files / warm:,.0f} files/s)")
+    print(f"  tokens {total:,} (~{chars / total:.2f} chars/token; "
+          f"chars/4 would say {chars // 4:,})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.10"
+# ///
+"""
+Benchmark the gitignore-aware tree walker on a synthetic repository.
+
+Builds a throwaway repository whose packages each carry sources alongside
+the usual ignored clutter: node_modules, build output, __pycache__ and log
+files. Times tree_walk.walk() against a naive os.walk() that descends
+everywhere and checks every path component against every pattern with
+fnmatch, and checks both against git ls-files when git is installed.
+
+Usage:
+    python benchmarks/bench_tree_walk.py
+    python benchmarks/bench_tree_walk.py --packages 500 --deps 400 --patterns 100
+"""
+
+import argparse
+import fnmatch
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "shared"))
+
+from tree_walk import walk  # noqa: E402
+
+GITIGNORE = ["node_modules/", "build/", "dist/", "__pycache__/", "*.pyc", "*.log", "!keep.log"]
+
+
+def _touch(path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.touch()
+
+
+def generate_tree(root: Path, packages: int, deps: int, patterns: int) -> tuple[int, list[str]]:
+    """Create the corpus under root; return the files written and the .gitignore lines."""
+    (root / ".git").mkdir()
+    # Padding patterns that never match, as a long-lived .gitignore accumulates
+    lines = GITIGNORE + [f"*.unused{i}" for i in range(patterns - len(GITIGNORE))]
+    (root / ".gitignore").write_text("\n".join(lines) + "\n")
+    files = 1
+    for i in range(packages):
+        package = root / "packages" / f"pkg-{i:05d}"
+        for j in range(5):
+            _touch(package / "src" / f"module_{j}.py")
+            _touch(package / "src" / "__pycache__" / f"module_{j}.cpython-312.pyc")
+        _touch(package / "keep.log")
+        _touch(package / "debug.log")
+        for j in range(deps):
+            _touch(package / "node_modules" / f"dep-{j % 20}" / f"file_{j}.js")
+        for j in range(deps // 4):
+            _touch(package / "build" / f"out_{j}.js")
+        files += 12 + deps + deps // 4
+    return files, lines
+
+
+def naive_walk(root: Path, lines: list[str]) -> list[str]:
+    """List non-ignored files by testing each path component against each pattern."""
+    patterns = []
+    for line in lines:
+        negated = line.startswith("!")
+        pattern = line.lstrip("!")
+        patterns.append((pattern.rstrip("/"), negated, pattern.endswith("/")))
+
+    def ignored(name: str, is_dir: bool) -> bool:
+        verdict = False
+        for pattern, negated, dir_only in patterns:
+            if (is_dir or not dir_only) and fnmatch.fnmatchcase(name, pattern):
+                verdict = not negated
+        return verdict
+
+    found = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [name for name in dirnames if name != ".git"]
+        rel = os.path.relpath(dirpath, root)
+        parts = [] if rel == "." else rel.split(os.sep)
+        if any(ignored(part, True) for part in parts):
+            continue
+        for name in filenames:
+            if not ignored(name, False):
+                found.append("/".join(parts + [name]))
+    return sorted(found)
+
+
+def tree_walk(root: Path) -> list[str]:
+    """List non-ignored files with tree_walk.walk()."""
+    return sorted(
+        os.path.relpath(entry.path, root).replace(os.sep, "/")
+        for _, _, files, _ in walk(root)
+        for entry in files
+    )
+
+
+def git_files(root: Path) -> list[str] | None:
+    """What git itself lists as not ignored, or None without git."""
+    if shutil.which("git") is None:
+        return None
+    subprocess.run(["git", "init", "-q"], cwd=root, check=True)
+    out = subprocess.run(
+        ["git", "ls-files", "--others", "--exclude-standard", "-z"],
+        cwd=root, check=True, capture_output=True, text=True
+    ).stdout
+    return sorted(path for path in out.split("\0") if path)
+
+
+def timed(fn, repeat: int) -> tuple[float, list]:
+    """Best wall time over repeat calls, and the last result."""
+    best, result = float("inf"), []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the gitignore-aware tree walker")
+    parser.add_argument("--packages", type=int, default=200, help="Packages in the repository")
+    parser.add_argument("--deps", type=int, default=200,
+                        help="Ignored dependency files per package")
+    parser.add_argument("--patterns", type=int, default=40, help="Lines in the .gitignore")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions (best is kept)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        files, lines = generate_tree(root, args.packages, args.deps, args.patterns)
+        print(f"{args.packages} packages, {files:,} files, {len(lines)} ignore patterns")
+
+        naive, naive_found = timed(lambda: naive_walk(root, lines), args.repeat)
+        fast, found = timed(lambda: tree_walk(root), args.repeat)
+        assert found == naive_found
+        expected = git_files(root)
+        if expected is not None:
+            assert found == expected
+
+        print(f"  naive walk  {naive * 1000:8.1f} ms  ({len(naive_found):,} files)")
+        print(f"  tree_walk   {fast * 1000:8.1f} ms  ({len(found):,} files, {naive / fast:.1f}x)")
+        if expected is not None:
+            print("  matches git ls-files --others --exclude-standard")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.10"
+# ///
+"""
+Throughput benchmark for shared/validate_skill.py on a synthetic corpus.
+
+Generates a throwaway marketplace with N plugin-bundled skills (optionally
+with large references/ and validation hooks), validates it end to end and
+with per-rule profiling, and compares the numbers against a JSON baseline.
+
+Baselines are machine-specific, so they are not committed: record one on
+the machine you optimise on, then compare every change against it.
+
+Usage:
+    python benchmarks/bench_validate_skill.py                          # small + medium
+    python benchmarks/bench_validate_skill.py --scale large            # 10k skills
+    python benchmarks/bench_validate_skill.py --save-baseline base.json
+    python benchmarks/bench_validate_skill.py --baseline base.json --threshold 0.15
+    python benchmarks/bench_validate_skill.py --skills 250 --references 8 --reference-lines 400
+
+Exit code is 1 when any metric regresses past the threshold.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "shared"))
+
+from validate_skill import (  # noqa: E402
+    VALIDATOR_VERSION,
+    RuleProfile,
+    discover_skills,
+    validate_skill,
+    validate_skills,
+)
+
+# name -> corpus parameters
+SCALES: dict[str, dict[str, int]] = {
+    "small": {"skills": 10, "references": 2, "reference_lines": 120, "hooks_every": 5},
+    "medium": {"skills": 1000, "references": 3, "reference_lines": 200, "hooks_every": 50},
+    "large": {"skills": 10000, "references": 3, "reference_lines": 200, "hooks_every": 500},
+}
+DEFAULT_SCALES = ["small", "medium"]
+DEFAULT_THRESHOLD = 0.20
+
+# Slowdowns smaller than this are timer noise and never count as regressions
+NOISE_FLOOR_MS = 5.0
+
+# metric -> milliseconds per unit
+TIMED_METRICS = {
+    "discover_s": 1000.0, "single_skill_ms": 1.0, "serial_s": 1000.0, "parallel_s": 1000.0,
+}
+
+WORDS = (
+    "parse validate render extract convert summarize document table chart report "
+    "config schema module request response cache index token stream batch queue"
+).split()
+
+# Works both warm (validate()) and as a subprocess (__main__)
+HOOK_SOURCE = '''\
+import json
+import sys
+from pathlib import Path
+
+
+def validate(skill_path, suggest):
+    return []
+
+
+if __name__ == "__main__":
+    print(json.dumps({"issues": validate(Path(sys.argv[1]), "--suggest" in sys.argv)}))
+'''
+
+
+def _sentence(rng: random.Random, words: int = 12) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _skill_body(rng: random.Random, name: str, references: int) -> str:
+    lines = [f"# {name.replace('-', ' ').title()}", "", _sentence(rng), ""]
+    for section in range(6):
+        lines += [f"## Step {section + 1}", "", _sentence(rng), _sentence(rng), ""]
+        command = f"python ${{CLAUDE_SKILL_DIR}}/scripts/run.py --step {section}"
+        lines += ["```bash", command, "```", ""]
+    if references:
+        lines += ["## References", ""]
+        lines += [f"- [Topic {i}](references/topic-{i}.md)" for i in range(references)]
+        lines.append("")
+    return "\n".join(lines)
+
+
+def _reference(rng: random.Random, line_count: int) -> str:
+    lines = ["# Contents", ""]
+    lines += [f"- [Part {part}](#part-{part})" for part in range(1, 4)]
+    lines.append("")
+    while len(lines) < line_count:
+        part = len(lines) // max(1, line_count // 3) + 1
+        if len(lines) % 40 == 0:
+            lines += [f"## Part {part}", ""]
+        lines.append(_sentence(rng, 16))
+    return "\n".join(lines) + "\n"
+
+
+def generate_corpus(
+    root: Path,
+    skills: int,
+    references: int = 3,
+    reference_lines: int = 200,
+    hooks_every: int = 0,
+    seed: int = 0
+) -> list[Path]:
+    """
+    Write a synthetic marketplace with one plugin-bundled skill per plugin.
+
+    Args:
+        root: Empty directory to populate
+        skills: Number of skills (and plugins)
+        references: references/*.md files per skill
+        reference_lines: Lines per reference file
+        hooks_every: Give every Nth skill a validation hook (0 = none)
+        seed: Seed for the deterministic text generator
+
+    Returns:
+        Skill directories, in creation order
+    """
+    rng = random.Random(seed)
+    marketplace = {"name": "bench", "plugins": []}
+    skill_paths = []
+
+    for i in range(skills):
+        name = f"bench-{rng.choice(WORDS)}-{i:05d}"
+        plugin_dir = root / "plugins" / name
+        skill_dir = plugin_dir / "skills" / name
+        (skill_dir / "scripts").mkdir(parents=True)
+        description = (f"Generates {name} reports from {rng.choice(WORDS)} data. "
+                       f"Use when asked to {rng.choice(WORDS)} {name}.")
+
+        (skill_dir / "SKILL.md").write_text(
+            f"---\nname: {name}\ndescription: {description}\n"
+            f"metadata:\n  version: \"1.0.0\"\n---\n\n{_skill_body(rng, name, references)}"
+        )
+        (skill_dir / "scripts" / "run.py").write_text("print('ok')\n")
+        if references:
+            (skill_dir / "references").mkdir()
+            for ref in range(references):
+                (skill_dir / "references" / f"topic-{ref}.md").write_text(
+                    _reference(rng, reference_lines)
+                )
+        if hooks_every and i % hooks_every == 0:
+            (skill_dir / "scripts" / "validate_hook.py").write_text(HOOK_SOURCE)
+
+        (plugin_dir / ".claude-plugin").mkdir()
+        (plugin_dir / ".claude-plugin" / "plugin.json").write_text(json.dumps({
+            "name": name, "description": description,
+            "version": "1.0.0", "author": {"name": "bench"},
+        }))
+        marketplace["plugins"].append(
+            {"name": name, "source": f"./plugins/{name}", "version": "1.0.0"}
+        )
+        skill_paths.append(skill_dir)
+
+    (root / ".claude-plugin").mkdir()
+    (root / ".claude-plugin" / "marketplace.json").write_text(json.dumps(marketplace))
+    return skill_paths
+
+
+def _timed(fn, repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def run_scenario(
+    name: str,
+    params: dict[str, int],
+    jobs: int | None = None,
+    repeat: int = 3,
+    warm_hooks: bool = False,
+    suggest: bool = True
+) -> dict[str, Any]:
+    """
+    Generate a corpus and measure it.
+
+    Metrics (lower is better unless noted):
+    - generate_s: corpus generation (informational, never compared)
+    - discover_s: discover_skills() over the corpus
+    - single_skill_ms: median in-process validate_skill() on one skill
+    - serial_s / parallel_s: best-of-repeat validate_skills() with jobs=1 / jobs
+    - skills_per_s: skills / parallel_s (higher is better)
+    - rules_ms: total in-process time per rule across the corpus
+    """
+    with tempfile.TemporaryDirectory(prefix=f"bench-{name}-") as tmpdir:
+        root = Path(tmpdir)
+        start = time.perf_counter()
+        skill_paths = generate_corpus(root, **params)
+        generate_s = time.perf_counter() - start
+
+        discover_s = min(_timed(lambda: discover_skills(root), repeat))
+        single = skill_paths[-1]
+        single_skill_ms = statistics.median(
+            _timed(lambda: validate_skill(single, suggest), max(repeat, 5))
+        ) * 1000
+
+        serial_s = min(_timed(lambda: validate_skills(
+            skill_paths, suggest, jobs=1, warm_hooks=warm_hooks
+        ), repeat))
+        parallel_s = min(_timed(lambda: validate_skills(
+            skill_paths, suggest, jobs=jobs, warm_hooks=warm_hooks
+        ), repeat))
+
+        profile = RuleProfile()
+        for result in validate_skills(skill_paths, suggest, jobs=1, profile=True):
+            profile.merge(result.profile)
+
+    return {
+        "params": params,
+        "generate_s": round(generate_s, 4),
+        "discover_s": round(discover_s, 4),
+        "single_skill_ms": round(single_skill_ms, 3),
+        "serial_s": round(serial_s, 4),
+        "parallel_s": round(parallel_s, 4),
+        "skills_per_s": round(params["skills"] / parallel_s, 1),
+        "rules_ms": {
+            rule: round(seconds * 1000, 3)
+            for rule, seconds in sorted(profile.seconds.items(), key=lambda kv: -kv[1])
+        },
+    }
+
+
+def environment() -> dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "validator_version": VALIDATOR_VERSION,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def _regressed(old: float | None, new: float | None, threshold: float,
+               ms_per_unit: float = 1.0) -> bool:
+    if not old or new is None:
+        return False
+    return new > old * (1 + threshold) and (new - old) * ms_per_unit >= NOISE_FLOOR_MS
+
+
+def compare_to_baseline(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD
+) -> list[str]:
+    """
+    List metrics that regressed by more than threshold (a fraction, 0.2 = 20%).
+
+    Only scenarios present in both runs are compared. Slowdowns smaller
+    than NOISE_FLOOR_MS in absolute terms are ignored.
+    """
+    regressions = []
+    for name, scenario in current.get("scenarios", {}).items():
+        base = baseline.get("scenarios", {}).get(name)
+        if base is None:
+            continue
+        if base.get("params") != scenario.get("params"):
+            regressions.append(f"{name}: corpus parameters differ from baseline; re-record it")
+            continue
+
+        for metric, ms_per_unit in TIMED_METRICS.items():
+            old, new = base.get(metric), scenario.get(metric)
+            if _regressed(old, new, threshold, ms_per_unit):
+                regressions.append(f"{name}: {metric} {old} -> {new} (+{new / old - 1:.0%})")
+
+        old, new = base.get("skills_per_s"), scenario.get("skills_per_s")
+        if old and new is not None and new < old * (1 - threshold):
+            regressions.append(f"{name}: skills_per_s {old} -> {new} ({new / old - 1:.0%})")
+
+        for rule, new in scenario.get("rules_ms", {}).items():
+            old = base.get("rules_ms", {}).get(rule)
+            if _regressed(old, new, threshold):
+                regressions.append(
+                    f"{name}: rule {rule} {old} ms -> {new} ms (+{new / old - 1:.0%})"
+                )
+
+    return regressions
+
+
+def format_report(results: dict[str, Any], top_rules: int = 8) -> str:
+    lines = []
+    for name, scenario in results["scenarios"].items():
+        params = scenario["params"]
+        lines.append(f"{name}: {params['skills']} skills, {params['references']} references "
+                     f"x {params['reference_lines']} lines, hooks every {params['hooks_every']}")
+        lines.append(f"  discover      {scenario['discover_s'] * 1000:10.1f} ms")
+        lines.append(f"  single skill  {scenario['single_skill_ms']:10.2f} ms")
+        lines.append(f"  serial        {scenario['serial_s']:10.3f} s")
+        lines.append(f"  parallel      {scenario['parallel_s']:10.3f} s  "
+                     f"({scenario['skills_per_s']} skills/s)")
+        for rule, ms in list(scenario["rules_ms"].items())[:top_rules]:
+            lines.append(f"    {rule:<22} {ms:10.2f} ms")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark validate_skill on a synthetic corpus")
+    parser.add_argument(
+        "--scale", action="append", choices=sorted(SCALES),
+        help=f"Preset corpus size; may be repeated (default: {', '.join(DEFAULT_SCALES)})"
+    )
+    parser.add_argument("--skills", type=int, help="Custom corpus: number of skills")
+    parser.add_argument("--references", type=int, default=3,
+                        help="Custom corpus: references per skill")
+    parser.add_argument("--reference-lines", type=int, default=200,
+                        help="Custom corpus: lines per reference")
+    parser.add_argument("--hooks-every", type=int, default=0,
+                        help="Custom corpus: hook on every Nth skill")
+    parser.add_argument("--jobs", "-j", type=int, default=None,
+                        help="Worker processes for the parallel run")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Repetitions per timing (best is kept)")
+    parser.add_argument("--warm-hooks", action="store_true", help="Run hooks in persistent workers")
+    parser.add_argument("--output", "-o", type=Path, help="Write results JSON here")
+    parser.add_argument("--save-baseline", type=Path, help="Write results JSON as the new baseline")
+    parser.add_argument("--baseline", type=Path, help="Compare against this baseline JSON")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help=f"Allowed slowdown before failing, as a fraction (default: {DEFAULT_THRESHOLD})"
+    )
+    args = parser.parse_args()
+
+    scenarios: dict[str, dict[str, int]] = {}
+    if args.skills:
+        scenarios["custom"] = {
+            "skills": args.skills, "references": args.references,
+            "reference_lines": args.reference_lines, "hooks_every": args.hooks_every,
+        }
+    for scale in args.scale or ([] if args.skills else DEFAULT_SCALES):
+        scenarios[scale] = SCALES[scale]
+
+    results: dict[str, Any] = {"environment": environment(), "scenarios": {}}
+    for name, params in scenarios.items():
+        print(f"Running {name} ({params['skills']} skills)...", file=sys.stderr)
+        results["scenarios"][name] = run_scenario(
+            name, params, jobs=args.jobs, repeat=args.repeat, warm_hooks=args.warm_hooks
+        )
+
+    print(format_report(results))
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            path.write_text(json.dumps(results, indent=2) + "\n")
+            print(f"Wrote {path}", file=sys.stderr)
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare_to_baseline(results, baseline, args.threshold)
+        if regressions:
+            print(f"\nREGRESSIONS (threshold {args.threshold:.0%}):")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"\nNo regressions against {args.baseline} (threshold {args.threshold:.0%})")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -30,6 +30,8 @@ import subprocess
 import sys
 from pathlib import Path
 
+from frontmatter import read_frontmatter
+
 
 def find_repo_root(start_path: Path) -> Path | None:
     """Find repository root by traversing upward to find .git or .claude-plugin/marketplace.json."""
@@ -79,23 +81,11 @@ def find_skill_md(plugin_dir: Path) -> Path | None:
 
 
 def extract_version_from_skill_md(skill_md_path: Path) -> str | None:
-    """Extract version from SKILL.md frontmatter."""
-    content = skill_md_path.read_text()
-
-    # Match YAML frontmatter between --- markers
-    match = re.search(r"^---\s*\n(.*?)\n---", content, re.DOTALL)
-    if not match:
+    """Extract version from SKILL.md frontmatter (the body is never read)."""
+    frontmatter = read_frontmatter(skill_md_path)
+    if frontmatter is None:
         return None
-
-    frontmatter = match.group(1)
-
-    # Find version in metadata section
-    # Look for: metadata:\n  ...\n  version: "X.Y.Z"
-    version_match = re.search(r'^\s*version:\s*["\']?([^"\'\n]+)["\']?', frontmatter, re.MULTILINE)
-    if version_match:
-        return version_match.group(1).strip()
-
-    return None
+    return frontmatter.version
 
 
 def check_uncommitted_version_change(skill_md_path: Path) -> bool:
@@ -119,23 +109,31 @@ def check_uncommitted_version_change(skill_md_path: Path) -> bool:
 
 def update_skill_md(skill_md_path: Path, new_version: str, dry_run: bool = False) -> bool:
     """Update the version in SKILL.md frontmatter."""
-    content = skill_md_path.read_text()
+    frontmatter = read_frontmatter(skill_md_path)
+    if frontmatter is None:
+        return False
+
+    # Only rewrite inside the frontmatter; `version:` lines in the body are left alone
+    content = skill_md_path.read_bytes()
+    head = content[frontmatter.start:frontmatter.end].decode('utf-8')
 
     # Match and replace version in frontmatter
     # Handle both quoted and unquoted versions
-    new_content = re.sub(
+    new_head = re.sub(
         r'(^\s*version:\s*)["\']?[^"\'\n]+["\']?',
         f'\\1"{new_version}"',
-        content,
+        head,
         count=1,
         flags=re.MULTILINE
     )
 
-    if new_content == content:
+    if new_head == head:
         return False
 
     if not dry_run:
-        skill_md_path.write_text(new_content)
+        skill_md_path.write_bytes(
+            content[:frontmatter.start] + new_head.encode('utf-8') + content[frontmatter.end:]
+        )
     return True
 
 
@@ -1,23 +1,46 @@
 #!/usr/bin/env python3
 # /// script
-# requires-python = ">=3.8"
+# requires-python = ">=3.10"
 # ///
 """
 Deterministically detect project type from file presence.
 
 Usage:
-    uv run shared/detect_project.py [--path <dir>] [--test]
+    uv run shared/detect_project.py [--path <dir>] [--cache] [--test]
+    uv run shared/detect_project.py --path <dir> --recursive [--max-depth 3] [--jobs 8]
+    uv run shared/detect_project.py --workspace <dir> [--recursive] [--jobs 32]
 
 Output:
-    JSON: {"type": "python", "confidence": "high", "files": ["pyproject.toml"]}
+    JSON: {"type": "python", "confidence": "high", "files": ["pyproject.toml"],
+           "details": {"manifest": "pyproject.toml", "framework": "fastapi",
+                       "package_manager": "uv", "lockfile": "uv.lock",
+                       "runtime": "python", "runtime_version": ">=3.10"}}
+    ("details" only for nodejs and python projects)
+    With --recursive, a list with one such object per sub-project, each with
+    a "path" relative to <dir> ("." for the root itself)
+    With --workspace, NDJSON: one object per git repository directly under
+    <dir>, written as each finishes, with "repo" and "path" added (and the
+    --recursive list under "projects")
+
+Caching is opt-in: --cache stores single-directory and --workspace results
+under $XDG_CACHE_HOME/claudeskillz/detect_project (~/.cache by default);
+--cache-dir picks another directory.
 """
 
 import argparse
+import hashlib
 import json
 import os
+import re
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from fs_snapshot import DirectorySnapshot
+from repo_utils import find_repos
+from tree_walk import IgnoreStack, walk
 
 # Detection rules: (file patterns, project type, confidence)
 # Order matters - first match wins for primary type
@@ -59,54 +82,583 @@ def glob_match(pattern: str, files: List[str]) -> List[str]:
     return [f for f in files if f == pattern]
 
 
-def detect_project(path: Path) -> Dict:
-    """Detect project type from files in the given directory."""
-    if not path.is_dir():
-        return {
-            "type": "unknown",
-            "confidence": "none",
-            "files": [],
-            "error": f"Path is not a directory: {path}"
-        }
+# (rule index, pattern index) within DETECTION_RULES
+Slot = Tuple[int, int]
 
-    # Get all files in root directory (not recursive for performance)
+
+class RuleIndex:
+    """
+    Detection rules compiled for a single pass over a directory listing.
+
+    Exact names go into a hash map and "*.ext" patterns into a suffix map,
+    both pointing at the (rule, pattern) slots a file name satisfies. Each
+    name then costs one hash lookup and one str.endswith() call, however
+    many rules there are; only names that pass are resolved to slots.
+    """
+
+    def __init__(self, rules: List[Tuple[List[str], str, str]]):
+        self.rules = rules
+        exact: Dict[str, List[Slot]] = {}
+        suffixes: Dict[str, List[Slot]] = {}
+        for r, (patterns, _, _) in enumerate(rules):
+            for p, pattern in enumerate(patterns):
+                if pattern.startswith("*."):
+                    suffixes.setdefault(pattern[1:], []).append((r, p))
+                else:
+                    exact.setdefault(pattern, []).append((r, p))
+        self.exact: Dict[str, Tuple[Slot, ...]] = {k: tuple(v) for k, v in exact.items()}
+        self.suffixes: Dict[str, Tuple[Slot, ...]] = {k: tuple(v) for k, v in suffixes.items()}
+        # "*.tar.gz" needs the last two dots of a name checked, "*.sln" one
+        self.suffix_dots = max((suffix.count(".") for suffix in suffixes), default=0)
+        # str.endswith() takes a tuple, so one C call prefilters every suffix
+        self._suffix_tuple = tuple(suffixes)
+
+    def slots(self, name: str) -> Tuple[Slot, ...]:
+        """Every (rule, pattern) slot that name matches, as glob_match() would."""
+        slots = self.exact.get(name, ())
+        end = len(name)
+        for _ in range(self.suffix_dots):
+            end = name.rfind(".", 0, end)
+            if end == -1:
+                break
+            found = self.suffixes.get(name[end:])
+            if found:
+                slots += found
+        return slots
+
+    def classify(
+        self, names: Iterable[str], is_file: Callable[[str], bool] = lambda name: True
+    ) -> Tuple[str, str, List[str]]:
+        """
+        Apply the rules to a directory listing.
+
+        is_file is only called for names that match some pattern. Results
+        are identical to checking every rule in order: the first rule with
+        a match sets the type and confidence, each rule contributes the
+        files of its first matching pattern, and files keep listing order.
+
+        Returns:
+            (type, confidence, matched files)
+        """
+        exact, suffixes = self.exact, self._suffix_tuple
+        matches: Dict[Slot, List[str]] = {}
+        for name in names:
+            if (name in exact or name.endswith(suffixes)) and is_file(name):
+                for slot in self.slots(name):
+                    matches.setdefault(slot, []).append(name)
+
+        detected_type, confidence = "unknown", "none"
+        files: Dict[str, None] = {}
+        for r, (patterns, proj_type, conf) in enumerate(self.rules):
+            for p in range(len(patterns)):
+                matched = matches.get((r, p))
+                if matched:
+                    files.update(dict.fromkeys(matched))
+                    if detected_type == "unknown":
+                        detected_type, confidence = proj_type, conf
+                    break  # Only the first matching pattern per rule
+        return detected_type, confidence, list(files)
+
+
+DETECTION_INDEX = RuleIndex(DETECTION_RULES)
+
+
+# Second stage: facts sniffed from a bounded prefix of the primary manifest.
+# Manifests up to SNIFF_BYTES are read whole, larger ones only that far.
+SNIFF_BYTES = 64 * 1024
+
+# type -> manifest to read, runtime, package manager when nothing says
+# otherwise, lockfiles (first present wins) and frameworks in priority
+# order (meta-frameworks before the libraries they build on)
+SNIFF_RULES: Dict[str, Dict] = {
+    "nodejs": {
+        "manifest": "package.json",
+        "runtime": "node",
+        "default_manager": "npm",
+        "lockfiles": [
+            ("pnpm-lock.yaml", "pnpm"), ("yarn.lock", "yarn"), ("bun.lock", "bun"),
+            ("bun.lockb", "bun"), ("package-lock.json", "npm"), ("npm-shrinkwrap.json", "npm"),
+        ],
+        "frameworks": [
+            "next", "nuxt", "@remix-run/react", "@sveltejs/kit", "astro", "gatsby",
+            "@nestjs/core", "@angular/core", "svelte", "vue", "react", "solid-js",
+            "fastify", "koa", "express", "electron",
+        ],
+    },
+    "python": {
+        "manifest": "pyproject.toml",
+        "runtime": "python",
+        "default_manager": "pip",
+        "lockfiles": [
+            ("uv.lock", "uv"), ("poetry.lock", "poetry"), ("pdm.lock", "pdm"),
+            ("Pipfile.lock", "pipenv"), ("pylock.toml", "pip"),
+        ],
+        "frameworks": [
+            "django", "fastapi", "flask", "litestar", "starlette", "sanic", "aiohttp",
+            "tornado", "streamlit", "gradio", "typer", "click",
+        ],
+        # Tables whose arrays hold requirement strings: the listed keys, or
+        # every array when None (Poetry's key-per-dependency tables aside)
+        "requirement_arrays": {
+            "project": ["dependencies"],
+            "project.optional-dependencies": None,
+            "dependency-groups": None,
+            "tool.uv": ["dev-dependencies"],
+            "tool.pdm.dev-dependencies": None,
+        },
+    },
+}
+
+
+def _alternation(names: List[str]) -> str:
+    return "|".join(re.escape(name) for name in names)
+
+
+# One pattern per manifest format; a single finditer() pass over the prefix
+# collects every fact, told apart by which named group matched
+SNIFF_PATTERNS: Dict[str, "re.Pattern[str]"] = {
+    "nodejs": re.compile(
+        r'"packageManager"\s*:\s*"(?P<manager>[^"@]+)'
+        r'|"engines"\s*:\s*\{[^}]*?"node"\s*:\s*"(?P<runtime>[^"]*)"'
+    ),
+    "python": re.compile(
+        r'^[ \t]*requires-python[ \t]*=[ \t]*["\'](?P<runtime>[^"\'\n]*)'
+        r'|^[ \t]*python[ \t]*=[ \t]*["\'](?P<poetry_runtime>[^"\'\n]*)'
+        r'|^[ \t]*\[tool\.(?P<manager>poetry|pdm|uv|hatch)[\].]',
+        re.MULTILINE | re.IGNORECASE
+    ),
+}
+
+# Frameworks count only where they are declared as dependencies, so a name
+# in a description, a script or a longer package name ("react-icons") does
+# not classify the project
+DEPENDENCY_PATTERNS: Dict[str, "re.Pattern[str]"] = {
+    # package.json: the bodies of the *dependencies objects, then their keys
+    "package.json block": re.compile(
+        r'"(?:dependencies|devDependencies|peerDependencies|optionalDependencies)"'
+        r'\s*:\s*\{(?P<deps>[^{}]*)\}'
+    ),
+    "package.json framework": re.compile(
+        r'"(?P<framework>' + _alternation(SNIFF_RULES["nodejs"]["frameworks"]) + r')"\s*:'
+    ),
+    # pyproject.toml: table headers, then arrays inside a table, then the
+    # requirement strings in an array ("django>=5", 'fastapi[all]')
+    "pyproject table": re.compile(
+        r'^[ \t]*\[\[?[ \t]*(?P<table>[^\[\]\n]+?)[ \t]*\]\]?[ \t]*(?:#.*)?$', re.MULTILINE
+    ),
+    "pyproject array": re.compile(
+        r'^[ \t]*["\']?(?P<key>[A-Za-z0-9_.-]+)["\']?[ \t]*=[ \t]*'
+        r'\[(?P<items>(?:"[^"\n]*"|\'[^\'\n]*\'|#[^\n]*|[^\]"\'#])*)\]',
+        re.MULTILINE
+    ),
+    "pyproject requirement": re.compile(
+        r'["\'][ \t]*(?P<framework>' + _alternation(SNIFF_RULES["python"]["frameworks"])
+        + r')[ \t]*(?=[<>=!~;\[,@ "\'])',
+        re.IGNORECASE
+    ),
+    # Poetry: [tool.poetry.dependencies], [tool.poetry.dev-dependencies] and
+    # [tool.poetry.group.<name>.dependencies] have one key per dependency
+    "poetry table": re.compile(
+        r'tool\.poetry\.(?:(?:group\.[^.]+\.)?dependencies|dev-dependencies)$'
+    ),
+    "poetry framework": re.compile(
+        r'^[ \t]*["\']?(?P<framework>' + _alternation(SNIFF_RULES["python"]["frameworks"])
+        + r')["\']?[ \t]*=',
+        re.MULTILINE | re.IGNORECASE
+    ),
+}
+
+
+def declared_frameworks(project_type: str, text: str) -> List[str]:
+    """
+    Frameworks a manifest declares as dependencies, lowercased, in file order.
+
+    Args:
+        project_type: "nodejs" (package.json text) or "python" (pyproject.toml text)
+        text: Manifest contents (or a prefix of them)
+    """
+    patterns = DEPENDENCY_PATTERNS
+    # (pattern, text it runs over) for every dependency declaration
+    spans: List[Tuple["re.Pattern[str]", str]] = []
+    if project_type == "nodejs":
+        framework = patterns["package.json framework"]
+        spans = [
+            (framework, block.group("deps"))
+            for block in patterns["package.json block"].finditer(text)
+        ]
+    elif project_type == "python":
+        arrays = SNIFF_RULES["python"]["requirement_arrays"]
+        headers = list(patterns["pyproject table"].finditer(text))
+        for header, following in zip(headers, headers[1:] + [None]):
+            table = header.group("table")
+            body = text[header.end():following.start() if following else len(text)]
+            if patterns["poetry table"].match(table):
+                spans.append((patterns["poetry framework"], body))
+            elif table in arrays:
+                keys = arrays[table]
+                spans.extend(
+                    (patterns["pyproject requirement"], array.group("items"))
+                    for array in patterns["pyproject array"].finditer(body)
+                    if keys is None or array.group("key") in keys
+                )
+    return [
+        match.group("framework").lower()
+        for pattern, span in spans for match in pattern.finditer(span)
+    ]
+
+
+def read_prefix(path: Path, limit: int = SNIFF_BYTES) -> str:
+    """Decode at most limit bytes from the start of path ("" if unreadable)."""
     try:
-        root_files = [f.name for f in path.iterdir() if f.is_file()]
-    except PermissionError:
+        with open(path, "rb") as f:
+            return f.read(limit).decode("utf-8", errors="replace")
+    except OSError:
+        return ""
+
+
+def sniff_project(
+    path: Path, project_type: str, entries: Dict[str, os.DirEntry]
+) -> Optional[Dict]:
+    """
+    Read framework, package manager, lockfile and runtime facts for a project.
+
+    The primary manifest (package.json or pyproject.toml) is read up to
+    SNIFF_BYTES, scanned once for tooling facts and searched for frameworks
+    declared as dependencies (see declared_frameworks()); lockfiles are
+    looked up in the existing listing without being opened.
+
+    Args:
+        path: Project directory
+        project_type: Type from the first detection stage
+        entries: That directory's listing, as DirectorySnapshot.listdir() returns
+
+    Returns:
+        Details dict, or None for types without sniffing rules
+    """
+    rules = SNIFF_RULES.get(project_type)
+    if rules is None:
+        return None
+
+    lockfile = manager = None
+    for name, lock_manager in rules["lockfiles"]:
+        if os.path.normcase(name) in entries:
+            lockfile, manager = name, lock_manager
+            break
+
+    manifest = rules["manifest"]
+    entry = entries.get(os.path.normcase(manifest))
+    found: Dict[str, str] = {}
+    frameworks: List[str] = []
+    if entry is not None and entry.is_file():
+        text = read_prefix(path / entry.name)
+        for match in SNIFF_PATTERNS[project_type].finditer(text):
+            group = match.lastgroup
+            if group not in found:
+                found[group] = match.group(group)
+        frameworks = declared_frameworks(project_type, text)
+    else:
+        manifest = None
+
+    priority = {name: i for i, name in enumerate(rules["frameworks"])}
+    framework = min(frameworks, key=priority.__getitem__) if frameworks else None
+    if "manager" in found and (project_type == "nodejs" or manager is None):
+        # packageManager is explicit; a [tool.*] table only when no lockfile says otherwise
+        manager = found["manager"].strip()
+
+    return {
+        "manifest": manifest,
+        "framework": framework,
+        "package_manager": manager or rules["default_manager"],
+        "lockfile": lockfile,
+        "runtime": rules["runtime"],
+        "runtime_version": found.get("runtime") or found.get("poetry_runtime"),
+    }
+
+
+def detect_project(path: Path, snapshot: Optional[DirectorySnapshot] = None) -> Dict:
+    """
+    Detect project type from files in the given directory.
+
+    The directory is listed once through snapshot; pass a shared one to
+    reuse listings across calls. Node.js and Python projects also get
+    "details" from sniff_project().
+    """
+    snapshot = snapshot or DirectorySnapshot()
+
+    # Get all files in root directory (not recursive for performance)
+    entries = snapshot.listdir(path)
+    if entries is None:
+        # Only a failed listing pays for telling the two errors apart
+        error = (
+            f"Permission denied: {path}" if path.is_dir()
+            else f"Path is not a directory: {path}"
+        )
         return {
             "type": "unknown",
             "confidence": "none",
             "files": [],
-            "error": f"Permission denied: {path}"
+            "error": error
         }
+    # Classify in one pass over the listing; only candidate names are stat'ed
+    detected_type, confidence, detected_files = DETECTION_INDEX.classify(
+        (entry.name for entry in entries.values()),
+        lambda name: entries[os.path.normcase(name)].is_file()
+    )
 
-    detected_files = []
-    detected_type = "unknown"
-    confidence = "none"
-
-    for patterns, proj_type, conf in DETECTION_RULES:
-        for pattern in patterns:
-            matches = glob_match(pattern, root_files)
-            if matches:
-                detected_files.extend(matches)
-                if detected_type == "unknown":
-                    detected_type = proj_type
-                    confidence = conf
-                break  # Only check first matching pattern per rule
-
-    # Deduplicate while preserving order
-    seen = set()
-    unique_files = []
-    for f in detected_files:
-        if f not in seen:
-            seen.add(f)
-            unique_files.append(f)
-
-    return {
+    result = {
         "type": detected_type,
         "confidence": confidence,
-        "files": unique_files
+        "files": detected_files
     }
+    details = sniff_project(path, detected_type, entries)
+    if details is not None:
+        result["details"] = details
+    return result
+
+
+DEFAULT_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "claudeskillz" / "detect_project"
+)
+
+# Directories changed this recently are not cached: on filesystems with
+# coarse timestamps, another change could land within the same mtime tick
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def _rules_key(
+    detection_rules: List[Tuple[List[str], str, str]],
+    sniff_rules: Dict[str, Dict],
+    sniff_bytes: int,
+    sniff_patterns: Dict[str, "re.Pattern[str]"],
+) -> str:
+    """Hash the detection rules; patterns contribute their source and flags."""
+    patterns = {name: [p.pattern, int(p.flags)] for name, p in sniff_patterns.items()}
+    text = json.dumps([detection_rules, sniff_rules, sniff_bytes, patterns], sort_keys=True)
+    return hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
+
+
+# Cache entries record the rules they were computed with, so editing
+# DETECTION_RULES, SNIFF_RULES or the patterns invalidates them without a
+# version bump
+_RULES_KEY = _rules_key(
+    DETECTION_RULES, SNIFF_RULES, SNIFF_BYTES, {**SNIFF_PATTERNS, **DEPENDENCY_PATTERNS}
+)
+
+
+def _file_stamp(path: Path) -> Optional[List[int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def detect_project_cached(path: Path, cache_dir: Path = DEFAULT_CACHE_DIR) -> Dict:
+    """
+    detect_project() behind an on-disk cache keyed by path, inode and mtime.
+
+    File-presence detection depends only on which files a directory
+    contains, and adding, removing or renaming one updates the directory's
+    mtime. The sniffed manifest can change in place, so its mtime and size
+    are recorded too. A repeat call on an unchanged project therefore costs
+    two stats and one small read, with no listing. Entries live at
+    {cache_dir}/{hash of path}.json; unreadable or stale entries are misses
+    and are rewritten. Error results and projects modified within
+    RACY_WINDOW_NS are not stored.
+    """
+    path = Path(os.path.abspath(path))
+    try:
+        st = os.stat(path)
+    except OSError:
+        return detect_project(path)
+    key = {
+        "path": str(path), "device": st.st_dev, "inode": st.st_ino,
+        "mtime_ns": st.st_mtime_ns, "rules": _RULES_KEY,
+    }
+    digest = hashlib.blake2b(str(path).encode(errors="surrogateescape"), digest_size=16)
+    cache_file = Path(cache_dir) / f"{digest.hexdigest()}.json"
+
+    try:
+        data = json.loads(cache_file.read_text())
+        if data["key"] == key and all(
+            _file_stamp(path / name) == stamp for name, stamp in data["inputs"].items()
+        ):
+            return data["result"]
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        pass
+
+    result = detect_project(path)
+    if "error" in result:
+        return result
+    manifest = result.get("details", {}).get("manifest")
+    inputs = {manifest: _file_stamp(path / manifest)} if manifest else {}
+    newest = max([st.st_mtime_ns] + [stamp[0] for stamp in inputs.values() if stamp])
+    if time.time_ns() - newest < RACY_WINDOW_NS:
+        return result
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_text(json.dumps({"key": key, "inputs": inputs, "result": result}))
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass  # Caching is best-effort
+    return result
+
+
+# Directories never searched for sub-projects: dependency installs,
+# virtualenvs, caches and build output (hidden directories are skipped too)
+PRUNED_DIRS = frozenset({
+    "node_modules", "bower_components", "venv", "env", "__pycache__", "site-packages",
+    "vendor", "dist", "build", "target", "out",
+})
+DEFAULT_MAX_DEPTH = 3
+
+
+def _subdirectories(entries: Dict[str, os.DirEntry]) -> List[str]:
+    """Names of the directories in a listing worth descending into, sorted."""
+    names = []
+    for entry in entries.values():
+        name = entry.name
+        if name.startswith(".") or name in PRUNED_DIRS:
+            continue
+        try:
+            # Symlinked directories are not followed, so cycles cannot occur
+            if entry.is_dir(follow_symlinks=False):
+                names.append(name)
+        except OSError:
+            continue
+    return sorted(names)
+
+
+def _detect_subtree(
+    root: Path,
+    start: str,
+    max_depth: int,
+    snapshot: DirectorySnapshot,
+    ignore: Optional[IgnoreStack]
+) -> List[Dict]:
+    """Depth-first detection of root/start and below, in sorted path order."""
+    results = []
+    for directory, dirs, _, _ in walk(root / start, snapshot, ignore, gitignore=ignore is not None):
+        rel = Path(directory).relative_to(root).as_posix()
+        result = detect_project(Path(directory), snapshot)
+        if result["type"] != "unknown":
+            results.append({"path": rel, **result})
+        if rel.count("/") + 1 >= max_depth:
+            dirs.clear()
+        else:
+            dirs[:] = [
+                entry for entry in dirs
+                if not entry.name.startswith(".") and entry.name not in PRUNED_DIRS
+            ]
+    return results
+
+
+def detect_projects(
+    path: Path,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    jobs: int = 1,
+    snapshot: Optional[DirectorySnapshot] = None,
+    gitignore: bool = True
+) -> List[Dict]:
+    """
+    Detect every project in a directory tree, for monorepos.
+
+    Walks at most max_depth levels below path with tree_walk.walk()
+    (through snapshot), skipping hidden directories, PRUNED_DIRS, symlinks
+    and whatever .gitignore ignores. Every directory is listed once and
+    classified from that listing.
+
+    Args:
+        path: Root of the tree
+        max_depth: Levels below path to search (0 = path only)
+        jobs: Threads walking the root's subdirectories in parallel
+        snapshot: Shared directory snapshot (a fresh one by default)
+        gitignore: Prune directories ignored by .gitignore files
+
+    Returns:
+        One detect_project() result per directory with a detected type, with
+        a "path" relative to path ("." for path itself), in sorted path
+        order. If path cannot be listed, a single error result.
+    """
+    snapshot = snapshot or DirectorySnapshot()
+    root_result = {"path": ".", **detect_project(path, snapshot)}
+    if "error" in root_result:
+        return [root_result]
+    results = [root_result] if root_result["type"] != "unknown" else []
+    if max_depth < 1:
+        return results
+
+    children = _subdirectories(snapshot.listdir(path) or {})
+    ignore = IgnoreStack.for_directory(path) if gitignore else None
+    if ignore is not None:
+        children = [name for name in children if not ignore.ignored(str(path / name), True)]
+    if jobs > 1 and len(children) > 1:
+        # scandir releases the GIL, so subtrees on slow disks overlap
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            subtrees = list(pool.map(
+                lambda name: _detect_subtree(path, name, max_depth, snapshot, ignore), children
+            ))
+    else:
+        subtrees = [
+            _detect_subtree(path, name, max_depth, snapshot, ignore) for name in children
+        ]
+    for subtree in subtrees:
+        results.extend(subtree)
+    return results
+
+
+def _detect_repo(
+    repo: Path, recursive: bool, max_depth: int, cache_dir: Optional[Path]
+) -> Dict:
+    if recursive:
+        return {"repo": repo.name, "path": str(repo), "projects": detect_projects(repo, max_depth)}
+    if cache_dir is not None:
+        return {"repo": repo.name, "path": str(repo), **detect_project_cached(repo, cache_dir)}
+    return {"repo": repo.name, "path": str(repo), **detect_project(repo)}
+
+
+def detect_workspace(
+    workspace: Path,
+    jobs: Optional[int] = None,
+    recursive: bool = False,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    cache_dir: Optional[Path] = None
+) -> Iterator[Dict]:
+    """
+    Detect every git repository directly under workspace, in one process.
+
+    Repositories are found with find_repos() and classified on a thread
+    pool; results are yielded as each finishes, so callers can stream
+    them. Closing the iterator early cancels repositories not yet started.
+
+    Args:
+        workspace: Directory of checkouts
+        jobs: Worker threads (default: ThreadPoolExecutor's default)
+        recursive: Run detect_projects() per repository instead of
+            detect_project(), with results under "projects"
+        max_depth: Depth limit for recursive detection
+        cache_dir: Use detect_project_cached() with this cache (not
+            applied to recursive detection)
+
+    Yields:
+        detect_project() results with "repo" (directory name) and "path"
+        added, in completion order
+    """
+    repos = find_repos(workspace)
+    if not repos:
+        return
+    pool = ThreadPoolExecutor(max_workers=jobs)
+    try:
+        futures = [
+            pool.submit(_detect_repo, repo, recursive, max_depth, cache_dir) for repo in repos
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
 
 
 def run_tests() -> bool:
@@ -148,6 +700,24 @@ def run_tests() -> bool:
 def main():
     parser = argparse.ArgumentParser(description="Detect project type from file presence")
     parser.add_argument("--path", default=".", help="Directory to analyze (default: current)")
+    parser.add_argument("--recursive", "-r", action="store_true",
+                        help="Detect every sub-project (monorepos)")
+    parser.add_argument("--max-depth", type=int, default=DEFAULT_MAX_DEPTH,
+                        help=f"Levels searched below --path with --recursive "
+                             f"(default: {DEFAULT_MAX_DEPTH})")
+    parser.add_argument("--no-gitignore", action="store_true",
+                        help="With --recursive, also search directories .gitignore ignores")
+    parser.add_argument("--workspace", default=None,
+                        help="Detect every git repository in this directory, as NDJSON")
+    parser.add_argument("--jobs", "-j", type=int, default=None,
+                        help="Threads: per repository with --workspace (default: automatic), "
+                             "else per subtree with --recursive (default: 1)")
+    parser.add_argument("--cache", action="store_true",
+                        help=f"Reuse results for unchanged directories from {DEFAULT_CACHE_DIR}")
+    parser.add_argument("--cache-dir", default=None,
+                        help="Detection cache directory; implies --cache")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Disable the cache even when --cache or --cache-dir is given")
     parser.add_argument("--test", action="store_true", help="Run self-tests")
     args = parser.parse_args()
 
@@ -155,7 +725,37 @@ def main():
         success = run_tests()
         sys.exit(0 if success else 1)
 
-    result = detect_project(Path(args.path).resolve())
+    if args.max_depth < 0:
+        parser.error("--max-depth must be at least 0")
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    cache_dir = None
+    if (args.cache or args.cache_dir) and not args.no_cache:
+        cache_dir = Path(args.cache_dir) if args.cache_dir else DEFAULT_CACHE_DIR
+
+    if args.workspace:
+        workspace = Path(args.workspace).resolve()
+        found = False
+        for result in detect_workspace(
+            workspace, args.jobs, args.recursive, args.max_depth, cache_dir
+        ):
+            found = True
+            print(json.dumps(result), flush=True)
+        if not found:
+            print(f"No repositories found in {workspace}", file=sys.stderr)
+            sys.exit(1)
+        return
+
+    if args.recursive:
+        result = detect_projects(
+            Path(args.path).resolve(), args.max_depth, args.jobs or 1,
+            gitignore=not args.no_gitignore
+        )
+    elif cache_dir is not None:
+        result = detect_project_cached(Path(args.path).resolve(), cache_dir)
+    else:
+        result = detect_project(Path(args.path).resolve())
     print(json.dumps(result, indent=2))
 
 
@@ -0,0 +1,515 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.10"
+# ///
+"""
+SKILL.md frontmatter reading and parsing (no PyYAML dependency).
+
+read_frontmatter() streams a file only up to the closing `---` delimiter,
+so metadata consumers (version checks, marketplace scans) touch a few
+hundred bytes per skill instead of the whole document.
+
+Usage:
+    python shared/frontmatter.py <SKILL.md> [<SKILL.md> ...]   # Print frontmatter as JSON
+    python shared/frontmatter.py --field metadata.version <SKILL.md>
+    python shared/frontmatter.py --test                        # Run self-tests
+"""
+
+import argparse
+import json
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO
+
+DELIMITER = b'---'
+
+# Frontmatter larger than this is treated as missing rather than read in full
+MAX_FRONTMATTER_BYTES = 64 * 1024
+
+
+@dataclass
+class Frontmatter:
+    """
+    Parsed frontmatter plus where it sits in the file.
+
+    Offsets are byte offsets into the file:
+    - start: first byte of the YAML text (just after the opening `---` line)
+    - end: first byte of the closing `---` line
+    - body_start: first byte after the closing `---` line
+
+    lines maps each key's dotted path to its 1-based line in the file.
+    """
+    data: dict[str, Any]
+    text: str
+    start: int
+    end: int
+    body_start: int
+    lines: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def version(self) -> str | None:
+        """metadata.version, falling back to a top-level version key."""
+        metadata = self.data.get('metadata')
+        if isinstance(metadata, dict) and isinstance(metadata.get('version'), str) \
+                and metadata['version']:
+            return metadata['version']
+        version = self.data.get('version')
+        return version if isinstance(version, str) and version else None
+
+
+def read_frontmatter_stream(
+    stream: BinaryIO,
+    max_bytes: int = MAX_FRONTMATTER_BYTES
+) -> Frontmatter | None:
+    """
+    Read frontmatter from a binary stream, stopping at the closing delimiter.
+
+    The stream is left positioned just after the closing `---` line; nothing
+    past it is read (beyond the stream's own buffering).
+
+    Args:
+        stream: Binary stream positioned at the start of the document
+        max_bytes: Give up once this many bytes have been read without a
+            closing delimiter
+
+    Returns:
+        Frontmatter, or None if the document has none (or it is unterminated)
+
+    Raises:
+        YAMLError: The frontmatter is not valid YAML (see parse_yaml())
+    """
+    first = stream.readline(max_bytes)
+    if first.rstrip() != DELIMITER or not first.endswith(b'\n'):
+        return None
+
+    start = offset = len(first)
+    lines: list[bytes] = []
+    while offset - start < max_bytes:
+        line = stream.readline(max_bytes)
+        if not line:
+            return None
+        if line.rstrip() == DELIMITER:
+            text = b''.join(lines).decode('utf-8', errors='replace')
+            # The newline before the closing delimiter belongs to the delimiter
+            if text.endswith('\n'):
+                text = text[:-1]
+            data, key_lines = parse_yaml(text, first_line=2)
+            return Frontmatter(
+                data=data,
+                text=text,
+                start=start,
+                end=offset,
+                body_start=offset + len(line),
+                lines=key_lines,
+            )
+        lines.append(line)
+        offset += len(line)
+    return None
+
+
+def read_frontmatter(path: Path, max_bytes: int = MAX_FRONTMATTER_BYTES) -> Frontmatter | None:
+    """
+    Read only the frontmatter of a file.
+
+    Returns:
+        Frontmatter, or None if the file is missing, unreadable, has none or
+        has frontmatter that cannot be parsed
+    """
+    try:
+        with open(path, 'rb') as f:
+            return read_frontmatter_stream(f, max_bytes)
+    except (OSError, YAMLError):
+        return None
+
+
+def read_version(path: Path) -> str | None:
+    """Return metadata.version from a SKILL.md without reading its body."""
+    frontmatter = read_frontmatter(path)
+    return frontmatter.version if frontmatter else None
+
+
+# =============================================================================
+# YAML Parser (no PyYAML dependency)
+# =============================================================================
+
+# A quoted key followed by ':' and then whitespace or end of line
+KEY_PATTERN = re.compile(r"""^("[^"]*"|'[^']*')\s*:(?:\s+(.*))?$""")
+BLOCK_SCALAR_PATTERN = re.compile(r'^([|>])([+-]?)([1-9]?)([+-]?)\s*(?:#.*)?$')
+DOUBLE_QUOTE_ESCAPES = {'n': '\n', 't': '\t', '"': '"', '\\': '\\', '/': '/', '0': '\0'}
+
+# plain_indent while no plain scalar is open: no line is indented past it
+NO_INDENT = sys.maxsize
+
+
+class YAMLError(ValueError):
+    """Frontmatter YAML that cannot be parsed, e.g. indented with tabs."""
+
+
+@dataclass
+class _BlockScalar:
+    """A `|` or `>` scalar whose lines are still being collected."""
+    container: dict[str, Any] | list[Any]
+    key: str | int
+    style: str
+    chomp: str
+    parent_indent: int
+    indent: int | None
+    lines: list[str] = field(default_factory=list)
+
+    def finish(self) -> None:
+        indent = self.indent
+        if indent is None:
+            first = next((line for line in self.lines if line.strip()), '')
+            indent = len(first) - len(first.lstrip(' '))
+        content = [line[indent:] if line.strip() else '' for line in self.lines]
+        trailing = 0
+        while content and content[-1] == '':
+            content.pop()
+            trailing += 1
+
+        if self.style == '|':
+            value = '\n'.join(content)
+        else:
+            value = ''
+            previous = None
+            for line in content:
+                if previous is None:
+                    value = line
+                elif line == '':
+                    value += '\n'
+                elif previous == '':
+                    value += line
+                elif line.startswith((' ', '\t')) or previous.startswith((' ', '\t')):
+                    value += '\n' + line  # More-indented lines are not folded
+                else:
+                    value += ' ' + line
+                previous = line
+
+        if content and self.chomp != '-':
+            value += '\n' * (1 + trailing if self.chomp == '+' else 1)
+        self.container[self.key] = value
+
+
+def parse_yaml(text: str, first_line: int = 1) -> tuple[dict[str, Any], dict[str, int]]:
+    """
+    Parse frontmatter YAML in a single pass over its lines.
+
+    Supports the subset skills use: nested block mappings, block sequences
+    (of scalars or mappings), plain and quoted scalars, multi-line plain
+    scalars, literal (|) and folded (>) block scalars with chomping and
+    indentation indicators, and comments. Scalars are kept as strings;
+    flow collections, anchors and tags are kept as literal text. Lines
+    that don't fit the structure are skipped rather than raising.
+
+    Raises:
+        YAMLError: A line is indented with tabs, which YAML forbids
+
+    Args:
+        text: YAML text (frontmatter without the --- delimiters)
+        first_line: Line number of text's first line in the source file
+
+    Returns:
+        (data, key_lines) where key_lines maps the dotted path of every key
+        and list item ("metadata.version", "tags.0") to its 1-based line
+    """
+    data: dict[str, Any] = {}
+    key_lines: dict[str, int] = {}
+    # Open collections, innermost last: (indent of their entries, container, dotted path)
+    stack: list[tuple[int, Any, str]] = [(0, data, '')]
+    frame_indent, container, path = stack[-1]
+    in_list = False
+    # A key with no inline value; the next line decides between mapping, list or null
+    pending: tuple[Any, str | int, str, int] | None = None
+    # The last plain scalar, which lines indented past plain_indent continue
+    plain: tuple[Any, str | int] | None = None
+    plain_indent = NO_INDENT
+    block: _BlockScalar | None = None
+
+    for lineno, line in enumerate(text.split('\n'), first_line):
+        stripped = line.lstrip(' ')
+        indent = len(line) - len(stripped)
+        stripped = stripped.rstrip()
+
+        if block is not None:
+            if not stripped or indent > block.parent_indent:
+                block.lines.append(line)
+                continue
+            block.finish()
+            block = None
+
+        if not stripped:
+            continue
+        first = stripped[0]
+        if first == '#':
+            continue
+        if first == '\t':
+            if stripped.lstrip()[0] == '#':
+                continue
+            raise YAMLError(f"line {lineno}: tabs are not allowed in indentation")
+
+        if indent > plain_indent:
+            plain[0][plain[1]] = f"{plain[0][plain[1]]} {parse_yaml_value(stripped)}"
+            continue
+        plain_indent = NO_INDENT
+
+        is_item = first == '-' and (len(stripped) == 1 or stripped[1] == ' ')
+        if pending is not None:
+            parent, key, key_path, key_indent = pending
+            pending = None
+            # A list may sit at its key's own indent, but not at an empty item's
+            if indent > key_indent or (
+                    is_item and indent == key_indent and parent.__class__ is not list):
+                child: Any = [] if is_item else {}
+                parent[key] = child
+                stack.append((indent, child, key_path))
+                frame_indent, container, path = indent, child, key_path
+                in_list = is_item
+
+        # Close collections this line is outdented from (or a list it ends)
+        if indent != frame_indent or (in_list and not is_item):
+            while len(stack) > 1 and (indent < frame_indent or (
+                    indent == frame_indent and in_list and not is_item)):
+                stack.pop()
+                frame_indent, container, path = stack[-1]
+                in_list = container.__class__ is list
+            if indent != frame_indent:
+                continue
+
+        if in_list:
+            rest = stripped[1:].lstrip()
+            key = len(container)
+            entry_path = f"{path}.{key}"
+            container.append(None)
+            entry = _split_key(rest) if rest else None
+            if entry is None:
+                target, value, entry_indent = container, rest, indent
+            else:
+                # "- key: value" opens a mapping whose keys align with "key"
+                item: dict[str, Any] = {}
+                container[key] = item
+                key_lines[entry_path] = lineno
+                entry_indent = indent + len(stripped) - len(rest)
+                stack.append((entry_indent, item, entry_path))
+                frame_indent, container, path = stack[-1]
+                in_list = False
+                key, value = entry
+                target, entry_path = item, f"{entry_path}.{key}"
+        elif is_item:
+            continue
+        else:
+            # Inline fast path for the common unquoted "key: value"
+            key, sep, value = stripped.partition(': ')
+            if sep and ':' not in key and first not in '"\'':
+                key = key.rstrip()
+                value = value.lstrip()
+            elif stripped[-1] == ':' and ':' not in stripped[:-1] and first not in '"\'':
+                key, value = stripped[:-1].rstrip(), ''
+            else:
+                entry = _split_key(stripped, loose=True)
+                if entry is None:
+                    continue
+                key, value = entry
+            target, entry_indent = container, indent
+            entry_path = f"{path}.{key}" if path else key
+
+        key_lines[entry_path] = lineno
+        if not value:
+            target[key] = None
+            pending = (target, key, entry_path, entry_indent)
+            continue
+        first = value[0]
+        if first == '"' and '\\' not in value:
+            # Inline fast path for double quotes without escapes
+            end = value.find('"', 1)
+            target[key] = value[1:end] if end != -1 else value
+        elif first in '|>' and (match := BLOCK_SCALAR_PATTERN.match(value)):
+            style, chomp1, explicit, chomp2 = match.groups()
+            target[key] = ''
+            block = _BlockScalar(
+                target, key, style, chomp1 or chomp2, entry_indent,
+                entry_indent + int(explicit) if explicit else None
+            )
+        elif first in '"\'':
+            target[key] = parse_yaml_value(value)
+        else:
+            target[key] = value if ' #' not in value else parse_yaml_value(value)
+            plain, plain_indent = (target, key), entry_indent
+
+    if block is not None:
+        block.finish()
+
+    return data, key_lines
+
+
+def parse_simple_yaml(text: str) -> dict[str, Any]:
+    """Parse frontmatter YAML without PyYAML (see parse_yaml())."""
+    return parse_yaml(text)[0]
+
+
+def _split_key(line: str, loose: bool = False) -> tuple[str, str] | None:
+    """
+    Split "key: value" into (key, value); None if line is not a mapping entry.
+
+    With loose, a mapping line without ': ' splits at its first ':' the way
+    the original parser did, so "version:1.0" stays a key. List items are
+    split strictly so "- https://example.com" stays a scalar.
+    """
+    if line[0] not in '"\'':
+        first = line.find(':')
+        colon = first
+        # Plain keys end at the first ': ' (or a trailing ':')
+        while colon != -1 and colon + 1 < len(line) and line[colon + 1] not in ' \t':
+            colon = line.find(':', colon + 1)
+        if colon == -1 and loose:
+            colon = first
+        if colon <= 0:
+            return None
+        return line[:colon].rstrip(), line[colon + 1:].strip()
+    match = KEY_PATTERN.match(line)
+    if match is None:
+        return None
+    return match.group(1)[1:-1], (match.group(2) or '').strip()
+
+
+def parse_yaml_value(value: str) -> str:
+    """Parse a scalar: unquote and unescape quoted strings, drop trailing comments."""
+    value = value.strip()
+    if not value:
+        return value
+    first = value[0]
+    if first not in '"\'':
+        # Plain scalar
+        comment = value.find(' #')
+        return value[:comment].rstrip() if comment != -1 else value
+    if first == '"' and '\\' not in value:
+        end = value.find('"', 1)
+        if end != -1:
+            return value[1:end]
+    if first == "'":
+        end = value.find("'", 1)
+        while end != -1 and value[end + 1:end + 2] == "'":
+            end = value.find("'", end + 2)
+        if end != -1:
+            return value[1:end].replace("''", "'")
+    elif first == '"':
+        chars = []
+        i = 1
+        while i < len(value):
+            char = value[i]
+            if char == '\\' and i + 1 < len(value):
+                chars.append(DOUBLE_QUOTE_ESCAPES.get(value[i + 1], '\\' + value[i + 1]))
+                i += 2
+                continue
+            if char == '"':
+                return ''.join(chars)
+            chars.append(char)
+            i += 1
+    # Unterminated quote, kept as written
+    return value
+
+
+def lookup(data: dict[str, Any], dotted: str) -> Any:
+    """Look up a dotted key such as "metadata.version" (None if absent)."""
+    value: Any = data
+    for part in dotted.split('.'):
+        if isinstance(value, dict):
+            value = value.get(part)
+        elif isinstance(value, list) and part.isdigit() and int(part) < len(value):
+            value = value[int(part)]
+        else:
+            return None
+    return value
+
+
+def run_tests() -> bool:
+    """Self-test the head-only reader and YAML parser."""
+    import io
+
+    all_passed = True
+    document = (
+        b'---\nname: demo\nmetadata:\n  version: "1.2.3"\n---\n'
+        b'# Body\n\nversion: 9.9.9\n'
+    )
+
+    # Test 1: Parses and stops at the closing delimiter
+    stream = io.BytesIO(document)
+    frontmatter = read_frontmatter_stream(stream)
+    if frontmatter is None or frontmatter.version != "1.2.3":
+        print(f"FAIL: version - got {frontmatter}", file=sys.stderr)
+        all_passed = False
+    elif stream.tell() != frontmatter.body_start or \
+            not document[frontmatter.body_start:].startswith(b'# Body'):
+        print(f"FAIL: offsets - body_start={frontmatter.body_start}", file=sys.stderr)
+        all_passed = False
+    else:
+        print("PASS: Reads frontmatter and stops at closing delimiter")
+
+    # Test 2: No frontmatter
+    if read_frontmatter_stream(io.BytesIO(b'# Just a body\n')) is not None:
+        print("FAIL: document without frontmatter", file=sys.stderr)
+        all_passed = False
+    else:
+        print("PASS: Document without frontmatter")
+
+    # Test 3: Block scalars and key lines
+    frontmatter = read_frontmatter_stream(io.BytesIO(
+        b'---\nname: demo\ndescription: |\n  Line one.\n  Line two.\nlicense: MIT\n---\n'
+    ))
+    if frontmatter is None or frontmatter.data.get('description') != "Line one.\nLine two.\n" \
+            or frontmatter.lines.get('license') != 6:
+        print(f"FAIL: block scalar - got {frontmatter}", file=sys.stderr)
+        all_passed = False
+    else:
+        print("PASS: Block scalar and key lines")
+
+    # Test 4: Unterminated frontmatter is bounded by max_bytes
+    endless = io.BytesIO(b'---\n' + b'key: value\n' * 1000)
+    if read_frontmatter_stream(endless, max_bytes=100) is not None or endless.tell() > 200:
+        print(f"FAIL: unterminated - read {endless.tell()} bytes", file=sys.stderr)
+        all_passed = False
+    else:
+        print("PASS: Unterminated frontmatter stops at max_bytes")
+
+    return all_passed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Print SKILL.md frontmatter without reading bodies"
+    )
+    parser.add_argument("paths", nargs="*", type=Path, help="SKILL.md files")
+    parser.add_argument("--field", help="Print only this dotted key (e.g. metadata.version)")
+    parser.add_argument("--test", action="store_true", help="Run self-tests")
+    args = parser.parse_args()
+
+    if args.test:
+        success = run_tests()
+        sys.exit(0 if success else 1)
+
+    if not args.paths:
+        parser.error("at least one path is required")
+
+    status = 0
+    for path in args.paths:
+        frontmatter = read_frontmatter(path)
+        if frontmatter is None:
+            print(f"{path}: no frontmatter", file=sys.stderr)
+            status = 1
+        elif args.field:
+            value = lookup(frontmatter.data, args.field)
+            print(f"{path}\t{'' if value is None else value}")
+        else:
+            print(json.dumps({
+                "path": str(path),
+                "frontmatter": frontmatter.data,
+                "start": frontmatter.start,
+                "end": frontmatter.end,
+                "body_start": frontmatter.body_start,
+            }))
+    sys.exit(status)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.8"
+# ///
+"""
+In-memory directory snapshots for repeated existence checks.
+
+Each directory is listed once with os.scandir and every later exists,
+is_file, is_dir or size lookup inside it is answered from that listing.
+On network filesystems this turns one round trip per checked path into
+one per directory.
+
+Usage:
+    python shared/fs_snapshot.py <path> [<path> ...]   # Print what the snapshot knows
+    python shared/fs_snapshot.py --test                # Run self-tests
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+class DirectorySnapshot:
+    """
+    Lazily populated cache of directory listings.
+
+    A snapshot reflects the filesystem as it was when each directory was
+    first listed; call invalidate() after changing files, or use a fresh
+    snapshot per run. Paths are made absolute and normalized lexically, so
+    "a/../b" is looked up as "b" even if "a" is a symlink. Names are
+    compared with os.path.normcase (case-insensitive on Windows).
+    """
+
+    def __init__(self):
+        # Directory -> normcase(name) -> entry, or None if it could not be listed
+        self._listings: Dict[str, Optional[Dict[str, os.DirEntry]]] = {}
+        self.scans = 0
+
+    @staticmethod
+    def _key(path: PathLike) -> str:
+        return os.path.normcase(os.path.abspath(os.fspath(path)))
+
+    def listdir(self, directory: PathLike) -> Optional[Dict[str, os.DirEntry]]:
+        """
+        Return the entries of directory, listing it on first use.
+
+        Returns:
+            Mapping of normcase'd name to os.DirEntry, or None if the
+            directory is missing, not a directory or unreadable
+        """
+        key = self._key(directory)
+        if key not in self._listings:
+            self.scans += 1
+            try:
+                with os.scandir(key) as it:
+                    listing = {os.path.normcase(entry.name): entry for entry in it}
+            except OSError:
+                listing = None
+            self._listings[key] = listing
+        return self._listings[key]
+
+    def entry(self, path: PathLike) -> Optional[os.DirEntry]:
+        """Return the os.DirEntry for path from its parent's listing, or None."""
+        parent, name = os.path.split(self._key(path))
+        if not name:
+            return None
+        listing = self.listdir(parent)
+        return listing.get(name) if listing is not None else None
+
+    def exists(self, path: PathLike) -> bool:
+        """Path.exists() from the snapshot (broken symlinks do not exist)."""
+        key = self._key(path)
+        if not os.path.basename(key):
+            # The filesystem root has no parent listing to be found in
+            return self.listdir(key) is not None
+        entry = self.entry(key)
+        if entry is None:
+            return False
+        if entry.is_symlink():
+            try:
+                entry.stat()
+            except OSError:
+                return False
+        return True
+
+    def is_file(self, path: PathLike) -> bool:
+        """Path.is_file() from the snapshot (follows symlinks)."""
+        entry = self.entry(path)
+        try:
+            return entry is not None and entry.is_file()
+        except OSError:
+            return False
+
+    def is_dir(self, path: PathLike) -> bool:
+        """Path.is_dir() from the snapshot (follows symlinks)."""
+        key = self._key(path)
+        if not os.path.basename(key):
+            return self.listdir(key) is not None
+        entry = self.entry(key)
+        try:
+            return entry is not None and entry.is_dir()
+        except OSError:
+            return False
+
+    def size(self, path: PathLike) -> Optional[int]:
+        """File size in bytes, or None if path does not exist."""
+        entry = self.entry(path)
+        if entry is None:
+            return None
+        try:
+            # DirEntry caches its stat result, so this costs at most one call
+            return entry.stat().st_size
+        except OSError:
+            return None
+
+    def invalidate(self, path: Optional[PathLike] = None) -> None:
+        """
+        Forget cached listings.
+
+        Args:
+            path: Drop the listings of path and its parent (what a change to
+                path affects); drop everything if None
+        """
+        if path is None:
+            self._listings.clear()
+            return
+        key = self._key(path)
+        self._listings.pop(key, None)
+        self._listings.pop(os.path.dirname(key), None)
+
+
+def run_tests() -> bool:
+    """Self-test lookups against the real filesystem."""
+    import tempfile
+
+    all_passed = True
+
+    def check(label: str, actual, expected) -> None:
+        nonlocal all_passed
+        if actual != expected:
+            print(f"FAIL: {label} - expected {expected!r}, got {actual!r}", file=sys.stderr)
+            all_passed = False
+        else:
+            print(f"PASS: {label}")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        (root / "scripts").mkdir()
+        (root / "scripts" / "run.py").write_text("print()\n")
+        (root / "README.md").write_text("# Readme\n")
+
+        snapshot = DirectorySnapshot()
+        check("file exists", snapshot.is_file(root / "README.md"), True)
+        check("directory", snapshot.is_dir(root / "scripts"), True)
+        check("nested file", snapshot.exists(root / "scripts" / "run.py"), True)
+        check("missing file", snapshot.exists(root / "missing.md"), False)
+        check("missing parent", snapshot.exists(root / "nope" / "file.md"), False)
+        check("size", snapshot.size(root / "README.md"), 9)
+        check("one scan per directory", snapshot.scans, 3)
+
+        (root / "new.md").write_text("")
+        check("stale until invalidated", snapshot.exists(root / "new.md"), False)
+        snapshot.invalidate(root / "new.md")
+        check("fresh after invalidate", snapshot.exists(root / "new.md"), True)
+
+    return all_passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Look up paths through a directory snapshot")
+    parser.add_argument("paths", nargs="*", type=Path, help="Paths to look up")
+    parser.add_argument("--test", action="store_true", help="Run self-tests")
+    args = parser.parse_args()
+
+    if args.test:
+        success = run_tests()
+        sys.exit(0 if success else 1)
+
+    if not args.paths:
+        parser.error("at least one path is required")
+
+    snapshot = DirectorySnapshot()
+    result = {
+        str(path): {
+            "exists": snapshot.exists(path),
+            "is_file": snapshot.is_file(path),
+            "is_dir": snapshot.is_dir(path),
+            "size": snapshot.size(path),
+        }
+        for path in args.paths
+    }
+    result["scans"] = snapshot.scans
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.10"
+# ///
+"""
+File system change notification.
+
+Uses Linux inotify (through ctypes, no dependencies) when available and
+falls back to polling mtimes everywhere else. Bursts of events, such as an
+editor's write-rename-chmod sequence, are debounced into a single batch.
+
+Usage:
+    python shared/fs_watch.py <path> [<path> ...]     # Print batches of changed files
+    python shared/fs_watch.py --poll <path>           # Force the polling backend
+    python shared/fs_watch.py --test                  # Run self-tests
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Iterator
+
+DEFAULT_DEBOUNCE = 0.05
+DEFAULT_POLL_INTERVAL = 0.25
+
+# Editor scratch files that should never trigger work
+IGNORED_SUFFIXES = ('~', '.swp', '.swx', '.swo', '.tmp')
+IGNORED_PREFIXES = ('.#',)
+IGNORED_DIRS = {'.git', '__pycache__', '.cache', 'node_modules'}
+
+
+def is_ignored(path: Path) -> bool:
+    """Return True for editor temp files and paths inside ignored directories."""
+    name = path.name
+    if name.endswith(IGNORED_SUFFIXES) or name.startswith(IGNORED_PREFIXES) or name == "4913":
+        return True
+    return any(part in IGNORED_DIRS for part in path.parts)
+
+
+class PollingWatcher:
+    """
+    Portable watcher that re-stats every watched file.
+
+    Directories are walked recursively; file roots are stat'ed directly.
+    Cost is proportional to the number of watched files per interval, which
+    is fine for skill-sized trees.
+    """
+
+    def __init__(self, roots: list[Path], interval: float = DEFAULT_POLL_INTERVAL):
+        self.roots = [Path(root) for root in roots]
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        snapshot: dict[Path, tuple[int, int]] = {}
+        for root in self.roots:
+            if root.is_dir():
+                self._scan_dir(root, snapshot)
+            else:
+                try:
+                    st = root.stat()
+                except OSError:
+                    continue
+                snapshot[root] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def _scan_dir(self, directory: Path, snapshot: dict[Path, tuple[int, int]]) -> None:
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            return
+        for entry in entries:
+            if entry.name in IGNORED_DIRS:
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    self._scan_dir(Path(entry.path), snapshot)
+                    continue
+                st = entry.stat()
+            except OSError:
+                continue
+            snapshot[Path(entry.path)] = (st.st_mtime_ns, st.st_size)
+
+    def read(self, timeout: float | None = None) -> set[Path]:
+        """
+        Wait up to timeout seconds (forever if None) for changes.
+
+        Returns:
+            Paths created, modified or deleted since the last call (may be empty)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            current = self._scan()
+            changed = {
+                path for path in current.keys() | self._snapshot.keys()
+                if current.get(path) != self._snapshot.get(path) and not is_ignored(path)
+            }
+            self._snapshot = current
+            if changed:
+                return changed
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return set()
+            time.sleep(self.interval if remaining is None else min(self.interval, remaining))
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "PollingWatcher":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+# inotify(7) constants
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = getattr(os, 'O_CLOEXEC', 0o2000000)
+
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+              | IN_CREATE | IN_DELETE | IN_DELETE_SELF)
+EVENT_HEADER = struct.Struct('iIII')
+
+
+def _load_libc():
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1  # Probe for the symbol (missing on some libcs)
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+class InotifyWatcher:
+    """
+    Linux watcher backed by inotify.
+
+    Every directory under a directory root gets its own watch, and new
+    subdirectories are picked up as they are created. A directory created
+    or moved in is reported along with the files already inside it; one
+    deleted or moved out is reported as the directory itself. File roots
+    are watched through their parent directory and filtered by name. On
+    queue overflow every root is reported as changed so callers re-check.
+    """
+
+    def __init__(self, roots: list[Path], libc=None):
+        self.roots = [Path(root) for root in roots]
+        self._libc = libc or _load_libc()
+        if self._libc is None:
+            raise OSError(errno.ENOSYS, "inotify is not available")
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: dict[int, Path] = {}
+        self._recursive: set[Path] = set()
+        # Parent directory -> file names watched inside it (file roots only)
+        self._files: dict[Path, set[str]] = {}
+        for root in self.roots:
+            if root.is_dir():
+                self._recursive.add(root)
+                self._add_tree(root)
+            else:
+                self._files.setdefault(root.parent, set()).add(root.name)
+                self._add_watch(root.parent)
+
+    def _add_watch(self, directory: Path) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if wd >= 0:
+            self._dirs[wd] = directory
+
+    def _add_tree(self, directory: Path, found: set[Path] | None = None) -> None:
+        """Watch directory and its subdirectories, adding the files seen to found."""
+        self._add_watch(directory)
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            return
+        for entry in entries:
+            if entry.name in IGNORED_DIRS:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                self._add_tree(Path(entry.path), found)
+            elif found is not None:
+                found.add(Path(entry.path))
+
+    def _remove_tree(self, directory: Path) -> None:
+        """Drop the watches of a directory that moved out of the tree."""
+        for wd, path in list(self._dirs.items()):
+            if path == directory or directory in path.parents:
+                self._libc.inotify_rm_watch(self._fd, wd)
+                del self._dirs[wd]
+
+    def _in_recursive_root(self, directory: Path) -> bool:
+        return any(directory == root or root in directory.parents for root in self._recursive)
+
+    def _drain(self) -> set[Path]:
+        changed: set[Path] = set()
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+                if mask & IN_Q_OVERFLOW:
+                    changed.update(self.roots)
+                    continue
+                directory = self._dirs.get(wd)
+                if directory is None:
+                    continue
+                if mask & IN_IGNORED:
+                    del self._dirs[wd]
+                    continue
+                path = directory / os.fsdecode(name) if name else directory
+                if mask & IN_ISDIR:
+                    if not self._in_recursive_root(directory) or is_ignored(path):
+                        continue
+                    # The files inside never get events of their own
+                    changed.add(path)
+                    if mask & (IN_CREATE | IN_MOVED_TO):
+                        found: set[Path] = set()
+                        self._add_tree(path, found)
+                        changed.update(p for p in found if not is_ignored(p))
+                    elif mask & IN_MOVED_FROM:
+                        self._remove_tree(path)
+                    continue
+                watched_files = self._files.get(directory)
+                if not self._in_recursive_root(directory) and (
+                        watched_files is None or path.name not in watched_files):
+                    continue
+                if not is_ignored(path):
+                    changed.add(path)
+
+    def read(self, timeout: float | None = None) -> set[Path]:
+        """
+        Wait up to timeout seconds (forever if None) for changes.
+
+        Returns:
+            Paths created, modified or deleted since the last call (may be empty)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            ready, _, _ = select.select([self._fd], [], [], remaining)
+            if not ready:
+                return set()
+            changed = self._drain()
+            # Events on unwatched names or ignored files count for nothing; keep waiting
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def __enter__(self) -> "InotifyWatcher":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def open_watcher(roots: list[Path], force_polling: bool = False):
+    """
+    Create the best available watcher for roots.
+
+    Args:
+        roots: Directories (watched recursively) and individual files
+        force_polling: Skip inotify even where it is available
+
+    Returns:
+        An InotifyWatcher or PollingWatcher; both expose read(timeout) and close()
+    """
+    if not force_polling:
+        try:
+            return InotifyWatcher(roots)
+        except OSError:
+            pass
+    return PollingWatcher(roots)
+
+
+def debounced(watcher, debounce: float = DEFAULT_DEBOUNCE,
+              timeout: float | None = None) -> set[Path]:
+    """
+    Wait for a change, then keep collecting until debounce seconds pass quietly.
+
+    Args:
+        watcher: Watcher returned by open_watcher()
+        debounce: Quiet period that ends a burst
+        timeout: Give up waiting for the first change after this many seconds
+
+    Returns:
+        Every path changed during the burst (empty on timeout)
+    """
+    changed = watcher.read(timeout)
+    while changed:
+        more = watcher.read(debounce)
+        if not more:
+            break
+        changed |= more
+    return changed
+
+
+def watch(roots: list[Path], debounce: float = DEFAULT_DEBOUNCE,
+          force_polling: bool = False) -> Iterator[set[Path]]:
+    """Yield debounced batches of changed paths under roots until the caller stops."""
+    with open_watcher(roots, force_polling) as watcher:
+        while True:
+            changed = debounced(watcher, debounce)
+            if changed:
+                yield changed
+
+
+def run_tests() -> bool:
+    """Self-test both watcher backends."""
+    import tempfile
+
+    all_passed = True
+    backends = [("polling", lambda roots: PollingWatcher(roots, interval=0.01))]
+    if _load_libc() is not None:
+        backends.append(("inotify", InotifyWatcher))
+
+    for label, factory in backends:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "sub").mkdir()
+            target = root / "sub" / "file.md"
+            target.write_text("one")
+            with factory([root]) as watcher:
+                time.sleep(0.02)
+                target.write_text("two!")
+                (root / "file.md.swp").write_text("noise")
+                changed = debounced(watcher, 0.05, timeout=2)
+            if changed != {target}:
+                print(f"FAIL: {label} - expected {{{target}}}, got {changed}", file=sys.stderr)
+                all_passed = False
+            else:
+                print(f"PASS: {label} reports modified file")
+
+    return all_passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print batches of changed files")
+    parser.add_argument("paths", nargs="*", type=Path, help="Directories or files to watch")
+    parser.add_argument("--poll", action="store_true", help="Force the polling backend")
+    parser.add_argument(
+        "--debounce", type=float, default=DEFAULT_DEBOUNCE,
+        help=f"Quiet period in seconds that ends a burst (default: {DEFAULT_DEBOUNCE})"
+    )
+    parser.add_argument("--test", action="store_true", help="Run self-tests")
+    args = parser.parse_args()
+
+    if args.test:
+        success = run_tests()
+        sys.exit(0 if success else 1)
+
+    if not args.paths:
+        parser.error("at least one path is required")
+
+    try:
+        for changed in watch(args.paths, args.debounce, args.poll):
+            for path in sorted(changed):
+                print(path)
+            print(flush=True)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
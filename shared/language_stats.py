@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.10"
+# ///
+"""
+Language composition of a source tree, by file count and bytes.
+
+Files are classified by name and extension tables (programming and markup
+languages only; data, prose and unknown files are not counted) during an
+os.scandir walk that skips hidden directories and detect_project's
+PRUNED_DIRS. Trees too large to walk within the time budget are estimated
+instead: random root-to-leaf walks, each weighted by the product of the
+branching factors along its path (Knuth's tree-size estimator), averaged
+over as many walks as the remaining budget allows. Every walk reuses the
+directory listings already made, so later samples get cheaper.
+
+Usage:
+    python shared/language_stats.py [--path <dir>] [--time-budget 2.0]
+    python shared/language_stats.py --test
+
+Output:
+    JSON: {"root": "...", "sampled": false, "files": 120, "bytes": 480213,
+           "languages": [{"language": "Python", "files": 90, "bytes": 400100,
+                          "percent": 83.3}, ...]}
+    Sampled results also report "samples"; their counts are estimates.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+from detect_project import PRUNED_DIRS
+from fs_snapshot import DirectorySnapshot
+
+DEFAULT_TIME_BUDGET = 2.0
+
+# The exact walk gives up after this many entries or half the time budget
+DEFAULT_MAX_FILES = 200_000
+
+# Sampling always takes at least this many walks, however tight the budget
+MIN_SAMPLES = 32
+
+FILENAME_LANGUAGES = {
+    "Makefile": "Makefile", "GNUmakefile": "Makefile", "makefile": "Makefile",
+    "Dockerfile": "Dockerfile", "CMakeLists.txt": "CMake", "Rakefile": "Ruby",
+    "Gemfile": "Ruby", "Jenkinsfile": "Groovy", "Vagrantfile": "Ruby",
+}
+
+EXTENSION_LANGUAGES = {
+    ".py": "Python", ".pyi": "Python", ".pyx": "Cython",
+    ".js": "JavaScript", ".mjs": "JavaScript", ".cjs": "JavaScript", ".jsx": "JavaScript",
+    ".ts": "TypeScript", ".mts": "TypeScript", ".cts": "TypeScript", ".tsx": "TSX",
+    ".vue": "Vue", ".svelte": "Svelte", ".astro": "Astro",
+    ".html": "HTML", ".htm": "HTML", ".css": "CSS", ".scss": "SCSS", ".sass": "Sass",
+    ".less": "Less",
+    ".go": "Go", ".rs": "Rust", ".java": "Java", ".kt": "Kotlin", ".kts": "Kotlin",
+    ".scala": "Scala", ".groovy": "Groovy", ".gradle": "Groovy", ".clj": "Clojure",
+    ".c": "C", ".h": "C", ".cc": "C++", ".cpp": "C++", ".cxx": "C++", ".hpp": "C++",
+    ".hh": "C++", ".hxx": "C++", ".m": "Objective-C", ".mm": "Objective-C++",
+    ".cs": "C#", ".fs": "F#", ".fsx": "F#", ".vb": "Visual Basic .NET",
+    ".swift": "Swift", ".dart": "Dart", ".rb": "Ruby", ".php": "PHP", ".pl": "Perl",
+    ".pm": "Perl", ".lua": "Lua", ".r": "R", ".jl": "Julia", ".ex": "Elixir",
+    ".exs": "Elixir", ".erl": "Erlang", ".hs": "Haskell", ".ml": "OCaml", ".elm": "Elm",
+    ".zig": "Zig", ".nim": "Nim", ".sol": "Solidity",
+    ".sh": "Shell", ".bash": "Shell", ".zsh": "Shell", ".fish": "fish", ".ps1": "PowerShell",
+    ".bat": "Batchfile", ".cmd": "Batchfile",
+    ".sql": "SQL", ".graphql": "GraphQL", ".proto": "Protocol Buffer",
+    ".tf": "HCL", ".hcl": "HCL", ".nix": "Nix", ".cmake": "CMake", ".mk": "Makefile",
+}
+
+
+def classify_file(name: str) -> str | None:
+    """Language of a file name, or None if it is not counted."""
+    language = FILENAME_LANGUAGES.get(name)
+    if language is not None:
+        return language
+    dot = name.rfind(".")
+    if dot <= 0:
+        return None
+    return EXTENSION_LANGUAGES.get(name[dot:].lower())
+
+
+def _scan(
+    snapshot: DirectorySnapshot, directory: str
+) -> tuple[list[tuple[str, int]], list[str], int]:
+    """
+    Classify one directory's listing.
+
+    Returns:
+        ([(language, size)] for counted files, subdirectories to descend
+        into (sorted), number of entries seen)
+    """
+    entries = snapshot.listdir(directory)
+    if entries is None:
+        return [], [], 0
+    files, subdirs = [], []
+    for entry in entries.values():
+        name = entry.name
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if not name.startswith(".") and name not in PRUNED_DIRS:
+                    subdirs.append(entry.path)
+                continue
+            language = classify_file(name)
+            if language is not None and entry.is_file(follow_symlinks=False):
+                files.append((language, entry.stat(follow_symlinks=False).st_size))
+        except OSError:
+            continue
+    subdirs.sort()
+    return files, subdirs, len(entries)
+
+
+def _exact_walk(
+    snapshot: DirectorySnapshot, root: str, deadline: float, max_files: int
+) -> dict[str, list[float]] | None:
+    """Totals per language from a full walk, or None if it ran out of budget."""
+    totals: dict[str, list[float]] = {}
+    stack, seen = [root], 0
+    while stack:
+        files, subdirs, count = _scan(snapshot, stack.pop())
+        for language, size in files:
+            total = totals.setdefault(language, [0, 0])
+            total[0] += 1
+            total[1] += size
+        stack.extend(subdirs)
+        seen += count
+        if seen > max_files or time.perf_counter() > deadline:
+            return None
+    return totals
+
+
+def _sampled_walk(
+    snapshot: DirectorySnapshot, root: str, deadline: float, rng: random.Random
+) -> tuple[dict[str, list[float]], int]:
+    """
+    Estimated totals per language from random root-to-leaf walks.
+
+    Each walk counts the files it passes weighted by the product of the
+    branching factors above them, which is an unbiased estimate of the
+    tree's totals; the mean over walks is returned.
+    """
+    sums: dict[str, list[float]] = {}
+    samples = 0
+    while samples < MIN_SAMPLES or time.perf_counter() < deadline:
+        directory, weight = root, 1
+        while True:
+            files, subdirs, _ = _scan(snapshot, directory)
+            for language, size in files:
+                total = sums.setdefault(language, [0.0, 0.0])
+                total[0] += weight
+                total[1] += weight * size
+            if not subdirs:
+                break
+            weight *= len(subdirs)
+            directory = rng.choice(subdirs)
+        samples += 1
+    estimates = {lang: [files / samples, size / samples] for lang, (files, size) in sums.items()}
+    return estimates, samples
+
+
+def language_stats(
+    path: Path,
+    time_budget: float = DEFAULT_TIME_BUDGET,
+    max_files: int = DEFAULT_MAX_FILES,
+    seed: int = 0,
+    snapshot: DirectorySnapshot | None = None
+) -> dict:
+    """
+    Break a tree down by language, exactly if it is small enough.
+
+    The exact walk stops after max_files entries or half of time_budget
+    (seconds); the rest of the budget then goes to sampling. Sampled
+    counts are rounded estimates. Walks are drawn from seed, but how many
+    fit in the budget depends on timing.
+
+    Returns:
+        Result dict as described in the module docstring; languages are
+        sorted by bytes, largest first, with percent of counted bytes
+    """
+    snapshot = snapshot or DirectorySnapshot()
+    root = os.path.abspath(path)
+    start = time.perf_counter()
+    totals = _exact_walk(snapshot, root, start + time_budget / 2, max_files)
+    samples = None
+    if totals is None:
+        totals, samples = _sampled_walk(
+            snapshot, root, start + time_budget, random.Random(seed)
+        )
+
+    all_bytes = sum(size for _, size in totals.values())
+    languages = [
+        {
+            "language": language,
+            "files": round(files),
+            "bytes": round(size),
+            "percent": round(100 * size / all_bytes, 1) if all_bytes else 0.0,
+        }
+        for language, (files, size) in sorted(totals.items(), key=lambda item: -item[1][1])
+    ]
+    result = {
+        "root": root,
+        "sampled": samples is not None,
+        "files": sum(language["files"] for language in languages),
+        "bytes": round(all_bytes),
+        "languages": languages,
+    }
+    if samples is not None:
+        result["samples"] = samples
+    return result
+
+
+def run_tests() -> bool:
+    """Self-test exact and sampled breakdowns on a generated tree."""
+    import tempfile
+
+    all_passed = True
+
+    def check(label: str, actual, expected) -> None:
+        nonlocal all_passed
+        if actual != expected:
+            print(f"FAIL: {label} - expected {expected!r}, got {actual!r}", file=sys.stderr)
+            all_passed = False
+        else:
+            print(f"PASS: {label}")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        for i in range(4):
+            package = root / f"pkg{i}"
+            package.mkdir()
+            (package / "main.py").write_text("x" * 300)
+            (package / "app.ts").write_text("x" * 100)
+            (package / "notes.txt").write_text("not counted")
+        (root / "node_modules").mkdir()
+        (root / "node_modules" / "dep.js").write_text("pruned")
+
+        exact = language_stats(root)
+        check("exact is not sampled", exact["sampled"], False)
+        check("languages by bytes",
+              [(lang["language"], lang["files"], lang["bytes"]) for lang in exact["languages"]],
+              [("Python", 4, 1200), ("TypeScript", 4, 400)])
+        check("percent", exact["languages"][0]["percent"], 75.0)
+
+        # A uniform tree is estimated exactly by every walk
+        sampled = language_stats(root, max_files=0)
+        check("sampled", sampled["sampled"], True)
+        check("uniform estimate", sampled["languages"], exact["languages"])
+
+    return all_passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Break a source tree down by language")
+    parser.add_argument("--path", default=".", help="Directory to analyze (default: current)")
+    parser.add_argument("--time-budget", type=float, default=DEFAULT_TIME_BUDGET,
+                        help=f"Seconds to spend before settling for an estimate "
+                             f"(default: {DEFAULT_TIME_BUDGET})")
+    parser.add_argument("--max-files", type=int, default=DEFAULT_MAX_FILES,
+                        help=f"Entries walked exactly before sampling "
+                             f"(default: {DEFAULT_MAX_FILES})")
+    parser.add_argument("--seed", type=int, default=0, help="Sampling seed (default: 0)")
+    parser.add_argument("--test", action="store_true", help="Run self-tests")
+    args = parser.parse_args()
+
+    if args.test:
+        success = run_tests()
+        sys.exit(0 if success else 1)
+
+    if args.time_budget <= 0:
+        parser.error("--time-budget must be positive")
+
+    path = Path(args.path).resolve()
+    if not path.is_dir():
+        print(f"ERROR: Path is not a directory: {path}", file=sys.stderr)
+        sys.exit(1)
+
+    result = language_stats(path, args.time_budget, args.max_files, args.seed)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,13 +5,17 @@
 """
 Repository discovery utilities.
 
-Provides functions for finding git repositories in a directory.
+Provides functions for finding git repositories in a directory and for
+listing the files in one that git would not ignore.
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
+from tree_walk import walk
+
 
 def find_repos(repos_dir: Path) -> list[Path]:
     """
@@ -36,6 +40,29 @@ def find_repos(repos_dir: Path) -> list[Path]:
     return sorted(repos, key=lambda p: p.name.lower())
 
 
+def list_repo_files(repo_dir: Path) -> list[Path]:
+    """
+    List the files in a repository that .gitignore does not exclude.
+
+    Like `git ls-files --cached --others --exclude-standard` without
+    running git: ignored directories are pruned rather than walked, and
+    .git is skipped. Ignored files that are tracked anyway are not listed.
+
+    Args:
+        repo_dir: Repository (or any directory) to list
+
+    Returns:
+        Paths relative to repo_dir, sorted
+    """
+    repo_dir = Path(repo_dir).resolve()
+    files = [
+        Path(os.path.relpath(entry.path, repo_dir))
+        for _, _, entries, _ in walk(repo_dir)
+        for entry in entries
+    ]
+    return sorted(files)
+
+
 def run_tests() -> bool:
     """Self-test the repo discovery logic."""
     import tempfile
@@ -117,6 +144,11 @@ def main():
         default=Path.cwd(),
         help="Directory to search (default: current directory)",
     )
+    parser.add_argument(
+        "--list-files",
+        action="store_true",
+        help="List the files in --path that .gitignore does not exclude",
+    )
     parser.add_argument(
         "--test",
         action="store_true",
@@ -129,6 +161,11 @@ def main():
         success = run_tests()
         sys.exit(0 if success else 1)
 
+    if args.list_files:
+        for path in list_repo_files(args.path):
+            print(path)
+        return
+
     repos = find_repos(args.path)
 
     if not repos:
@@ -20,6 +20,8 @@ import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from fs_snapshot import DirectorySnapshot
+
 # Skill-specific operation rules
 # Format: skill_name -> {
 #   "operations": [list of valid operations],
@@ -108,12 +110,17 @@ def parse_keywords(args: str, keywords: Dict[str, str]) -> Optional[str]:
     return None
 
 
-def check_files_exist(file_list: List[str], base_path: Path) -> Dict[str, bool]:
-    """Check which files exist."""
+def check_files_exist(
+    file_list: List[str],
+    base_path: Path,
+    snapshot: Optional[DirectorySnapshot] = None
+) -> Dict[str, bool]:
+    """Check which files exist, listing each directory involved only once."""
+    snapshot = snapshot or DirectorySnapshot()
     result = {}
     for file_name in file_list:
         file_path = base_path / file_name
-        result[file_name] = file_path.exists()
+        result[file_name] = snapshot.exists(file_path)
     return result
 
 
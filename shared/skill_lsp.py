@@ -0,0 +1,527 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.10"
+# ///
+"""
+Language server publishing validate_skill diagnostics for SKILL.md files.
+
+Speaks the Language Server Protocol over stdio. Open SKILL.md buffers are
+kept parsed in memory; each edit re-runs only the rules that read the part
+of the document that changed (frontmatter or body), against the unsaved
+buffer. references/, plugin.json and the validation hook are read from
+disk when the file is opened or saved. Hooks run on a background thread,
+so a slow hook never holds up the message loop; their diagnostics are
+published separately when they finish.
+
+Usage:
+    python shared/skill_lsp.py                  # Serve over stdin/stdout
+    python shared/skill_lsp.py --suggest        # Also publish suggestions
+    python shared/skill_lsp.py --test           # Run self-tests
+
+initializationOptions may set {"suggest": bool, "disable": [rule, ...]}.
+"""
+
+import argparse
+import json
+import queue
+import sys
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Callable
+from urllib.parse import unquote, urlparse
+from urllib.request import url2pathname
+
+from validate_skill import (
+    RULES_BY_NAME,
+    Severity,
+    SkillDocument,
+    ValidationIssue,
+    ValidationResult,
+    detect_skill_type,
+    merge_revalidation,
+    run_validation_hook,
+    select_rules,
+    validate_skill,
+)
+
+SERVER_NAME = "skill-lsp"
+
+# LSP constants
+SYNC_INCREMENTAL = 2
+DIAGNOSTIC_SEVERITY = {
+    Severity.ERROR: 1,
+    Severity.WARNING: 2,
+    Severity.SUGGESTION: 3,  # Information
+}
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+
+# =============================================================================
+# Transport
+# =============================================================================
+
+def read_message(stream: BinaryIO) -> dict[str, Any] | None:
+    """
+    Read one Content-Length framed JSON-RPC message.
+
+    Returns:
+        The decoded message, or None at end of input
+    """
+    length = None
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            break
+        name, _, value = line.decode("ascii").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    if length is None:
+        return None
+    return json.loads(stream.read(length))
+
+
+def write_message(stream: BinaryIO, message: dict[str, Any]) -> None:
+    """Write one JSON-RPC message with its Content-Length header."""
+    body = json.dumps(message, separators=(",", ":")).encode()
+    stream.write(f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+    stream.flush()
+
+
+def uri_to_path(uri: str) -> Path:
+    parsed = urlparse(uri)
+    return Path(url2pathname(unquote(parsed.path)))
+
+
+# =============================================================================
+# Buffers
+# =============================================================================
+
+def _utf16_offset(line: str, character: int) -> int:
+    """Convert an LSP character offset (UTF-16 code units) to a str index."""
+    units = 0
+    for index, char in enumerate(line):
+        if units >= character:
+            return index
+        units += 2 if ord(char) > 0xFFFF else 1
+    return len(line)
+
+
+def _utf16_length(line: str) -> int:
+    return sum(2 if ord(char) > 0xFFFF else 1 for char in line)
+
+
+def apply_change(text: str, change: dict[str, Any]) -> str:
+    """Apply one TextDocumentContentChangeEvent (ranged or full) to text."""
+    if "range" not in change:
+        return change["text"]
+    lines = text.split("\n")
+
+    def offset(position: dict[str, int]) -> int:
+        line = min(position["line"], len(lines) - 1)
+        start = sum(len(lines[i]) + 1 for i in range(line))
+        return start + _utf16_offset(lines[line], position["character"])
+
+    start, end = change["range"]["start"], change["range"]["end"]
+    return text[:offset(start)] + change["text"] + text[offset(end):]
+
+
+def changed_inputs(previous: SkillDocument, current: SkillDocument) -> set[str]:
+    """
+    Rule inputs that differ between two parses of the same SKILL.md.
+
+    A part also counts as changed when its text moved, since the line
+    numbers of its issues change with it.
+    """
+    inputs = set()
+    if (previous.frontmatter != current.frontmatter
+            or previous.frontmatter_lines != current.frontmatter_lines):
+        inputs.add("frontmatter")
+    if previous.body != current.body or previous.body_start_line != current.body_start_line:
+        inputs.add("body")
+    return inputs
+
+
+# =============================================================================
+# Server
+# =============================================================================
+
+@dataclass
+class OpenSkill:
+    """An open SKILL.md buffer, its last parse and its last result."""
+    uri: str
+    skill_path: Path
+    text: str
+    plugin: bool
+    doc: SkillDocument | None = None
+    result: ValidationResult | None = None
+    # Bumped by every full validation; a hook run for an older one is stale
+    generation: int = 0
+
+
+def to_diagnostic(issue: ValidationIssue, lines: list[str], rel_path: str) -> dict[str, Any]:
+    """Convert a ValidationIssue to an LSP Diagnostic spanning its whole line."""
+    line = max(issue.line - 1, 0) if issue.line else 0
+    line = min(line, len(lines) - 1)
+    message = f"[{issue.field}] {issue.message}"
+    if issue.file_path not in (rel_path, ""):
+        message = f"{issue.file_path}: {message}"
+    diagnostic: dict[str, Any] = {
+        "range": {
+            "start": {"line": line, "character": 0},
+            "end": {"line": line, "character": _utf16_length(lines[line])},
+        },
+        "severity": DIAGNOSTIC_SEVERITY[issue.severity],
+        "source": SERVER_NAME,
+        "message": message,
+    }
+    if issue.rule:
+        diagnostic["code"] = issue.rule
+    return diagnostic
+
+
+class SkillLanguageServer:
+    """
+    JSON-RPC dispatcher for SKILL.md diagnostics.
+
+    handle() takes one decoded message and returns the messages to send
+    back (responses and publishDiagnostics notifications), which keeps the
+    server testable without a transport. A message that cannot be handled
+    gets an error response (requests) or is logged to stderr
+    (notifications); it never stops the server.
+
+    With notify set, validation hooks run on a background thread and
+    notify is called with their publishDiagnostics once they finish;
+    without it they run inline, before handle() returns. State is guarded
+    by lock, which notify is called under.
+    """
+
+    def __init__(
+        self,
+        suggest: bool = False,
+        disabled: frozenset[str] = frozenset(),
+        notify: Callable[[dict[str, Any]], None] | None = None
+    ):
+        self.suggest = suggest
+        self.disabled = disabled
+        self.notify = notify
+        self.skills: dict[str, OpenSkill] = {}
+        self.shutting_down = False
+        self.exited = False
+        self.lock = threading.RLock()
+        self._hooks: queue.Queue[tuple[OpenSkill, int]] | None = None
+
+    # -- validation ----------------------------------------------------------
+
+    def _validate(self, skill: OpenSkill, full: bool) -> None:
+        """
+        Re-validate skill from its buffer.
+
+        A full run re-reads references/ and runs every rule including the
+        hook; otherwise the previous references are reused and only rules
+        reading a changed part of SKILL.md run.
+        """
+        rel_path = f"{skill.skill_path.name}/SKILL.md"
+        previous_doc = skill.doc
+        full = full or previous_doc is None or skill.result is None
+        try:
+            skill.doc = SkillDocument.from_text(skill.skill_path, skill.text, full)
+        except Exception as e:
+            skill.doc = None
+            skill.result = ValidationResult(skill.skill_path, skill.skill_path.name, [
+                ValidationIssue(Severity.ERROR, rel_path, "parse", f"Failed to parse SKILL.md: {e}")
+            ])
+            return
+        if not full:
+            skill.doc.references = previous_doc.references
+            skill.doc.has_references_content = previous_doc.has_references_content
+
+        if full:
+            previous = skill.result
+            skill.generation += 1
+            result = validate_skill(
+                skill.skill_path, self.suggest, run_hooks=self.notify is None,
+                disabled=self.disabled, doc=skill.doc
+            )
+            if result.hooks_deferred:
+                if previous is not None:
+                    # Keep the last hook issues until the new run replaces them
+                    result = merge_revalidation(
+                        previous, result, set(RULES_BY_NAME) - {"hook"}
+                    )
+                self._queue_hook(skill)
+            skill.result = result
+            return
+
+        inputs = changed_inputs(previous_doc, skill.doc)
+        if not inputs:
+            return
+        rerun = {
+            rule.name for rule in select_rules(self.suggest, skill.plugin, self.disabled, inputs)
+        }
+        partial = validate_skill(
+            skill.skill_path, self.suggest, run_hooks=False, disabled=self.disabled,
+            inputs=inputs, doc=skill.doc
+        )
+        skill.result = merge_revalidation(skill.result, partial, rerun)
+
+    def _queue_hook(self, skill: OpenSkill) -> None:
+        if self._hooks is None:
+            self._hooks = queue.Queue()
+            threading.Thread(target=self._hook_worker, daemon=True).start()
+        self._hooks.put((skill, skill.generation))
+
+    def _hook_worker(self) -> None:
+        """Run queued hooks one at a time, publishing each result that is still current."""
+        while True:
+            skill, generation = self._hooks.get()
+            if self.skills.get(skill.uri) is not skill or skill.generation != generation:
+                continue  # Closed or re-validated since it was queued
+            try:
+                issues = run_validation_hook(skill.skill_path, self.suggest)
+            except Exception as e:
+                _log(f"validation hook failed for {skill.skill_path}: {e!r}")
+                continue
+            for issue in issues:
+                issue.rule = "hook"
+            with self.lock:
+                if self.skills.get(skill.uri) is not skill or skill.generation != generation:
+                    continue
+                skill.result = merge_revalidation(skill.result, ValidationResult(
+                    skill.skill_path, skill.skill_path.name, issues
+                ), {"hook"})
+                self.notify(self._publish(skill))
+
+    def _publish(self, skill: OpenSkill) -> dict[str, Any]:
+        lines = skill.text.split("\n")
+        rel_path = f"{skill.skill_path.name}/SKILL.md"
+        return {
+            "jsonrpc": "2.0",
+            "method": "textDocument/publishDiagnostics",
+            "params": {
+                "uri": skill.uri,
+                "diagnostics": [
+                    to_diagnostic(issue, lines, rel_path) for issue in skill.result.issues
+                ],
+            },
+        }
+
+    # -- protocol ------------------------------------------------------------
+
+    def handle(self, message: dict[str, Any]) -> list[dict[str, Any]]:
+        """Process one message; return the messages to send in reply."""
+        if not isinstance(message, dict):
+            return [self._error(None, INVALID_REQUEST, "Message is not a JSON object")]
+        with self.lock:
+            return self._dispatch(message)
+
+    def _dispatch(self, message: dict[str, Any]) -> list[dict[str, Any]]:
+        method = message.get("method")
+        params = message.get("params") or {}
+        is_request = "id" in message
+
+        handler = getattr(self, "on_" + (method or "").replace("/", "_").replace("$", "_"), None)
+        if handler is None:
+            if is_request:
+                return [self._error(message["id"], METHOD_NOT_FOUND, f"Unknown method: {method}")]
+            return []  # Unknown notifications are ignored
+        if self.shutting_down and method not in ("exit", "shutdown"):
+            if is_request:
+                return [self._error(message["id"], INVALID_REQUEST, "Server is shutting down")]
+            return []
+
+        try:
+            reply, notifications = handler(params)
+        except Exception as e:
+            # Malformed params surface as lookups on missing or mistyped fields
+            invalid = isinstance(e, (KeyError, TypeError, AttributeError))
+            text = f"{'Invalid params' if invalid else 'Internal error'}: {e!r}"
+            if is_request:
+                return [self._error(
+                    message["id"], INVALID_PARAMS if invalid else INTERNAL_ERROR, text
+                )]
+            _log(f"{method}: {text}")
+            return []
+        if is_request:
+            return [{"jsonrpc": "2.0", "id": message["id"], "result": reply}] + notifications
+        return notifications
+
+    @staticmethod
+    def _error(request_id: Any, code: int, text: str) -> dict[str, Any]:
+        return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": text}}
+
+    def on_initialize(self, params: dict[str, Any]):
+        options = params.get("initializationOptions") or {}
+        self.suggest = bool(options.get("suggest", self.suggest))
+        self.disabled = self.disabled | frozenset(options.get("disable", []))
+        return {
+            "capabilities": {
+                "textDocumentSync": {
+                    "openClose": True,
+                    "change": SYNC_INCREMENTAL,
+                    "save": {"includeText": False},
+                },
+            },
+            "serverInfo": {"name": SERVER_NAME},
+        }, []
+
+    def on_initialized(self, params: dict[str, Any]):
+        return None, []
+
+    def on_shutdown(self, params: dict[str, Any]):
+        self.shutting_down = True
+        return None, []
+
+    def on_exit(self, params: dict[str, Any]):
+        self.exited = True
+        return None, []
+
+    def on_textDocument_didOpen(self, params: dict[str, Any]):
+        document = params["textDocument"]
+        path = uri_to_path(document["uri"])
+        if path.name != "SKILL.md":
+            return None, []
+        skill_path = path.parent.resolve()
+        skill = OpenSkill(
+            document["uri"], skill_path, document["text"],
+            plugin=detect_skill_type(skill_path)[0] == "plugin"
+        )
+        self.skills[skill.uri] = skill
+        self._validate(skill, full=True)
+        return None, [self._publish(skill)]
+
+    def on_textDocument_didChange(self, params: dict[str, Any]):
+        skill = self.skills.get(params["textDocument"]["uri"])
+        if skill is None:
+            return None, []
+        for change in params["contentChanges"]:
+            skill.text = apply_change(skill.text, change)
+        self._validate(skill, full=False)
+        return None, [self._publish(skill)]
+
+    def on_textDocument_didSave(self, params: dict[str, Any]):
+        skill = self.skills.get(params["textDocument"]["uri"])
+        if skill is None:
+            return None, []
+        # Saved content matches disk, so references/ and the hook can be re-checked
+        self._validate(skill, full=True)
+        return None, [self._publish(skill)]
+
+    def on_textDocument_didClose(self, params: dict[str, Any]):
+        skill = self.skills.pop(params["textDocument"]["uri"], None)
+        if skill is None:
+            return None, []
+        skill.result = ValidationResult(skill.skill_path, skill.skill_path.name)
+        return None, [self._publish(skill)]
+
+
+def _log(text: str) -> None:
+    print(f"{SERVER_NAME}: {text}", file=sys.stderr)
+
+
+def serve(server: SkillLanguageServer, reader: BinaryIO, writer: BinaryIO) -> int:
+    """
+    Run the message loop until exit or end of input.
+
+    Hook diagnostics are written from the server's hook thread, under the
+    same lock as replies, so messages never interleave or go out of order.
+
+    Returns:
+        Process exit code: 0 after shutdown then exit, 1 otherwise
+    """
+    server.notify = lambda message: write_message(writer, message)
+    while not server.exited:
+        try:
+            message = read_message(reader)
+        except ValueError as e:
+            # Undecodable header or body: report it and keep reading
+            with server.lock:
+                write_message(writer, server._error(None, PARSE_ERROR, f"Parse error: {e}"))
+            continue
+        if message is None:
+            break
+        with server.lock:
+            for reply in server.handle(message):
+                write_message(writer, reply)
+    return 0 if server.shutting_down else 1
+
+
+def run_tests() -> bool:
+    """Self-test a session: open, edit, close."""
+    import tempfile
+
+    all_passed = True
+
+    def check(label: str, condition: bool, detail: Any = "") -> None:
+        nonlocal all_passed
+        if condition:
+            print(f"PASS: {label}")
+        else:
+            print(f"FAIL: {label} {detail}", file=sys.stderr)
+            all_passed = False
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        skill_dir = Path(tmpdir) / "demo-skill"
+        skill_dir.mkdir()
+        text = "---\nname: demo-skill\ndescription: Use when testing the server.\n---\n\nBody\n"
+        (skill_dir / "SKILL.md").write_text(text)
+        uri = (skill_dir / "SKILL.md").as_uri()
+
+        server = SkillLanguageServer()
+        replies = server.handle({"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}})
+        check("initialize", replies[0]["result"]["serverInfo"]["name"] == SERVER_NAME)
+
+        replies = server.handle({"jsonrpc": "2.0", "method": "textDocument/didOpen", "params": {
+            "textDocument": {"uri": uri, "languageId": "markdown", "version": 1, "text": text}
+        }})
+        check("clean buffer has no errors", not any(
+            d["severity"] == 1 for d in replies[0]["params"]["diagnostics"]
+        ), replies)
+
+        replies = server.handle({"jsonrpc": "2.0", "method": "textDocument/didChange", "params": {
+            "textDocument": {"uri": uri, "version": 2},
+            "contentChanges": [{
+                "range": {"start": {"line": 1, "character": 6},
+                          "end": {"line": 1, "character": 16}},
+                "text": "Demo_Skill",
+            }],
+        }})
+        codes = [d.get("code") for d in replies[0]["params"]["diagnostics"]]
+        check("unsaved edit reports name error", "name" in codes, codes)
+
+        replies = server.handle({"jsonrpc": "2.0", "id": 2, "method": "shutdown"})
+        check("shutdown", replies == [{"jsonrpc": "2.0", "id": 2, "result": None}], replies)
+
+    return all_passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve SKILL.md diagnostics over LSP (stdio)")
+    parser.add_argument("--suggest", action="store_true", help="Also publish suggestions")
+    parser.add_argument(
+        "--disable", action="append", default=[], metavar="RULE[,RULE]",
+        help="Skip the named rules; may be repeated"
+    )
+    parser.add_argument("--test", action="store_true", help="Run self-tests")
+    args = parser.parse_args()
+
+    if args.test:
+        success = run_tests()
+        sys.exit(0 if success else 1)
+
+    disabled = frozenset(
+        name.strip() for value in args.disable for name in value.split(",") if name.strip()
+    )
+    server = SkillLanguageServer(args.suggest, disabled)
+    sys.exit(serve(server, sys.stdin.buffer, sys.stdout.buffer))
+
+
+if __name__ == "__main__":
+    main()
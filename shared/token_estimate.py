@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.10"
+# ///
+"""
+Dependency-free token count estimates for skill files.
+
+Context cost is measured in tokens, not characters, but a real BPE
+tokenizer is a large dependency. This module estimates token counts from
+a handful of byte-class counts (whitespace-separated words, letters,
+punctuation, digits, non-ASCII bytes, newlines, indentation), each taken
+in one C-level pass. The weights are set so that English prose lands near
+the usual ~4 characters per token, while punctuation-heavy text, numbers,
+code and non-ASCII text cost more, as they do under BPE.
+
+Estimates are cached per content hash, so unchanged files are never
+re-scanned within a process.
+
+Usage:
+    python shared/token_estimate.py <file> [<file> ...]   # Print token estimates
+    python shared/token_estimate.py --test                # Run self-tests
+"""
+
+import argparse
+import hashlib
+import string
+import sys
+from pathlib import Path
+
+DEFAULT_CACHE_SIZE = 65536
+
+_WHITESPACE = b' \t\r\n\x0b\x0c'
+_LETTERS = string.ascii_letters.encode()
+_DIGITS = string.digits.encode()
+# bytes.translate(None, delete) keeps what is not deleted, so each class is
+# counted by deleting its complement
+_ALL_BYTES = bytes(range(256))
+_NOT_WHITESPACE = bytes(b for b in _ALL_BYTES if b not in _WHITESPACE)
+_NOT_DIGITS = bytes(b for b in _ALL_BYTES if b not in _DIGITS)
+_NOT_PUNCTUATION_OR_NON_ASCII = _LETTERS + _DIGITS + _WHITESPACE
+_ASCII = bytes(range(128))
+
+# Weights per counted unit (see estimate_tokens_uncached)
+LETTERS_PER_EXTRA_TOKEN = 4
+LETTERS_PER_WORD_TOKEN = 6
+PUNCTUATION_WEIGHT = 0.8
+DIGITS_PER_TOKEN = 3
+NON_ASCII_BYTES_PER_TOKEN = 2
+NEWLINE_WEIGHT = 0.5
+INDENT_WEIGHT = 0.5
+
+
+def estimate_tokens_uncached(data: bytes) -> int:
+    """
+    Estimate the token count of UTF-8 encoded text.
+
+    Each whitespace-separated word is one token, plus one per
+    LETTERS_PER_EXTRA_TOKEN letters beyond LETTERS_PER_WORD_TOKEN per word
+    on average (long identifiers and rare words split). Punctuation,
+    digits, non-ASCII bytes, newlines and four-space indents add their own
+    weighted counts.
+    """
+    if not data:
+        return 0
+    non_ascii = len(data.translate(None, _ASCII))
+    whitespace = len(data.translate(None, _NOT_WHITESPACE))
+    punctuation = len(data.translate(None, _NOT_PUNCTUATION_OR_NON_ASCII)) - non_ascii
+    digits = len(data.translate(None, _NOT_DIGITS))
+    letters = len(data) - whitespace - punctuation - digits - non_ascii
+    words = len(data.split())
+
+    extra_letters = max(0, letters - LETTERS_PER_WORD_TOKEN * words)
+    estimate = (
+        words
+        + extra_letters / LETTERS_PER_EXTRA_TOKEN
+        + punctuation * PUNCTUATION_WEIGHT
+        + digits / DIGITS_PER_TOKEN
+        + non_ascii / NON_ASCII_BYTES_PER_TOKEN
+        + data.count(b'\n') * NEWLINE_WEIGHT
+        + data.count(b'    ') * INDENT_WEIGHT
+    )
+    return max(1, round(estimate))
+
+
+class TokenEstimator:
+    """
+    estimate_tokens_uncached() behind a cache keyed by content hash.
+
+    The cache holds at most max_entries counts; the oldest are evicted
+    first. hits and misses count lookups since construction.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._counts: dict[bytes, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def estimate(self, text: str | bytes) -> int:
+        """Return the estimated token count of text, from the cache when seen before."""
+        data = text.encode() if isinstance(text, str) else text
+        key = hashlib.blake2b(data, digest_size=16).digest()
+        count = self._counts.get(key)
+        if count is not None:
+            self.hits += 1
+            return count
+        self.misses += 1
+        count = estimate_tokens_uncached(data)
+        if len(self._counts) >= self.max_entries:
+            del self._counts[next(iter(self._counts))]
+        self._counts[key] = count
+        return count
+
+    def clear(self) -> None:
+        self._counts.clear()
+        self.hits = self.misses = 0
+
+
+_ESTIMATOR = TokenEstimator()
+
+
+def estimate_tokens(text: str | bytes) -> int:
+    """Estimate the token count of text using the process-wide cache."""
+    return _ESTIMATOR.estimate(text)
+
+
+def run_tests() -> bool:
+    """Self-test estimates and caching."""
+    all_passed = True
+
+    def check(label: str, condition: bool, detail: object = "") -> None:
+        nonlocal all_passed
+        if condition:
+            print(f"PASS: {label}")
+        else:
+            print(f"FAIL: {label} {detail}", file=sys.stderr)
+            all_passed = False
+
+    prose = (
+        "Use this skill when the user asks for a summary of a long document. "
+        "Read the file, find the main points and write them as a short list.\n"
+    ) * 20
+    tokens = estimate_tokens_uncached(prose.encode())
+    check("prose near 4 chars/token", 3.5 <= len(prose) / tokens <= 6, len(prose) / tokens)
+
+    code = "def f(x):\n    return {'k': [x[0], x[1:]], 'n': 12345}\n" * 20
+    code_ratio = len(code) / estimate_tokens_uncached(code.encode())
+    check("code costs more than prose", code_ratio < len(prose) / tokens, code_ratio)
+
+    check("empty text", estimate_tokens_uncached(b"") == 0)
+
+    estimator = TokenEstimator(max_entries=2)
+    estimator.estimate("a b c")
+    estimator.estimate("a b c")
+    check("repeat is a cache hit", (estimator.hits, estimator.misses) == (1, 1))
+    estimator.estimate("x")
+    estimator.estimate("y")
+    check("cache is bounded", len(estimator._counts) == 2)
+
+    return all_passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Estimate token counts of files")
+    parser.add_argument("files", nargs="*", type=Path, help="Files to estimate")
+    parser.add_argument("--test", action="store_true", help="Run self-tests")
+    args = parser.parse_args()
+
+    if args.test:
+        success = run_tests()
+        sys.exit(0 if success else 1)
+
+    if not args.files:
+        parser.error("at least one file is required")
+
+    total = 0
+    for path in args.files:
+        try:
+            tokens = estimate_tokens(path.read_bytes())
+        except OSError as e:
+            print(f"{path}: {e}", file=sys.stderr)
+            continue
+        total += tokens
+        print(f"{tokens:>8,}  {path}")
+    if len(args.files) > 1:
+        print(f"{total:>8,}  total")
+
+
+if __name__ == "__main__":
+    main()
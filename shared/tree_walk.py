@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.10"
+# ///
+"""
+Directory tree walking that honours .gitignore.
+
+Each directory's .gitignore is compiled once, when the walk enters that
+directory, into a few combined regular expressions: one per run of
+same-polarity patterns, split into basename patterns and path patterns,
+each with a directories-only variant. Deciding whether an entry is
+ignored then costs a handful of regex matches per .gitignore level
+rather than one per pattern. Ignored directories are pruned before they
+are listed.
+
+The repository's .git/info/exclude and the .gitignore files between the
+repository root and the walk's starting directory apply as well, as they
+do for git. The global core.excludesFile is not read.
+
+Usage:
+    python shared/tree_walk.py [--path <dir>]   # Print non-ignored files
+    python shared/tree_walk.py --test           # Run self-tests
+"""
+
+import argparse
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from fs_snapshot import DirectorySnapshot
+
+IGNORE_FILE = ".gitignore"
+
+
+def translate(pattern: str) -> str:
+    """
+    Translate a gitignore glob (without !, leading / or trailing /) to a regex.
+
+    * and ? do not match "/"; "**/" matches any number of directories and
+    a trailing "/**" everything inside a directory.
+    """
+    i, n, out = 0, len(pattern), []
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern.startswith("**", i) and (i == 0 or pattern[i - 1] == "/"):
+                if i + 2 == n:
+                    out.append(".*")
+                    i += 2
+                    continue
+                if pattern[i + 2] == "/":
+                    out.append("(?:.*/)?")
+                    i += 3
+                    continue
+            while i < n and pattern[i] == "*":
+                i += 1
+            out.append("[^/]*")
+            continue
+        if c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = i + 1
+            if j < n and pattern[j] in "!^":
+                j += 1
+            if j < n and pattern[j] == "]":
+                j += 1
+            while j < n and pattern[j] != "]":
+                j += 1
+            if j >= n:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1:j].replace("\\", "\\\\")
+                if body[0] in "!^":
+                    body = "^/" + body[1:]
+                out.append(f"[{body}]")
+                i = j
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+def parse_pattern(line: str) -> tuple[str, bool, bool, bool] | None:
+    """
+    Parse one .gitignore line.
+
+    Returns:
+        (regex, negated, directories only, matched against the basename), or
+        None for blank lines and comments
+    """
+    line = line.rstrip("\r\n")
+    stripped = line.rstrip(" ")
+    if stripped.endswith("\\") and len(stripped) < len(line):
+        stripped += " "  # "\ " keeps one trailing space
+    line = stripped
+    if not line or line.startswith("#"):
+        return None
+    negated = line.startswith("!")
+    if negated or line.startswith(("\\!", "\\#")):
+        line = line[1:]
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line:
+        return None
+    # A slash anywhere but the end anchors the pattern to its .gitignore
+    basename = "/" not in line
+    return translate(line.lstrip("/")), negated, dir_only, basename
+
+
+class IgnoreRules:
+    """
+    The patterns of one ignore file, compiled into combined matchers.
+
+    Consecutive patterns with the same polarity are joined into one
+    alternation, since among them any match gives the same verdict. The
+    last matching group decides, as the last matching pattern does in git.
+    """
+
+    def __init__(self, lines: Iterable[str]):
+        self.groups: list[tuple[bool, list[re.Pattern | None]]] = []
+        run: list[tuple[str, bool, bool]] = []
+        negated_run = False
+        for line in lines:
+            parsed = parse_pattern(line)
+            if parsed is None:
+                continue
+            regex, negated, dir_only, basename = parsed
+            if run and negated != negated_run:
+                self.groups.append((negated_run, self._compile(run)))
+                run = []
+            negated_run = negated
+            run.append((regex, dir_only, basename))
+        if run:
+            self.groups.append((negated_run, self._compile(run)))
+
+    @staticmethod
+    def _compile(run: list[tuple[str, bool, bool]]) -> list[re.Pattern | None]:
+        # [basename any, basename dirs only, path any, path dirs only]
+        buckets: list[list[str]] = [[], [], [], []]
+        for regex, dir_only, basename in run:
+            buckets[(0 if basename else 2) + dir_only].append(regex)
+        return [
+            re.compile("|".join(f"(?:{regex})" for regex in bucket)) if bucket else None
+            for bucket in buckets
+        ]
+
+    def __bool__(self) -> bool:
+        return bool(self.groups)
+
+    def match(self, rel: str, name: str, is_dir: bool) -> bool | None:
+        """
+        Verdict for a path relative to this file's directory.
+
+        Returns:
+            True if ignored, False if re-included by a negation, None if no
+            pattern matches
+        """
+        for negated, (name_any, name_dir, path_any, path_dir) in reversed(self.groups):
+            if (
+                (name_any is not None and name_any.fullmatch(name))
+                or (path_any is not None and path_any.fullmatch(rel))
+                or (is_dir and name_dir is not None and name_dir.fullmatch(name))
+                or (is_dir and path_dir is not None and path_dir.fullmatch(rel))
+            ):
+                return not negated
+        return None
+
+
+def _read_rules(path: str) -> IgnoreRules | None:
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            rules = IgnoreRules(f)
+    except OSError:
+        return None
+    return rules or None
+
+
+class IgnoreStack:
+    """
+    The ignore rules in effect in one directory: its own .gitignore on top
+    of those of every ancestor up to the repository root.
+
+    Stacks are immutable and share their parents, so sibling subtrees can
+    be walked independently (and concurrently) from the same parent.
+    """
+
+    def __init__(self, levels: tuple[tuple[str, IgnoreRules], ...] = ()):
+        # (directory with a trailing separator, rules), outermost first
+        self.levels = levels
+
+    @classmethod
+    def for_directory(cls, directory: str | os.PathLike) -> "IgnoreStack":
+        """
+        The rules that apply inside directory: .git/info/exclude and every
+        .gitignore from the enclosing repository's root down to directory.
+        """
+        directory = os.path.abspath(directory)
+        top = directory
+        while not os.path.exists(os.path.join(top, ".git")):
+            parent = os.path.dirname(top)
+            if parent == top:
+                top = directory  # Not in a repository: only directory's own rules
+                break
+            top = parent
+
+        stack = cls()
+        exclude = _read_rules(os.path.join(top, ".git", "info", "exclude"))
+        if exclude is not None:
+            stack = IgnoreStack(((os.path.join(top, ""), exclude),))
+        chain = [directory]
+        while chain[-1] != top:
+            chain.append(os.path.dirname(chain[-1]))
+        for level in reversed(chain):
+            stack = stack.child(level)
+        return stack
+
+    def child(self, directory: str, entries: dict[str, os.DirEntry] | None = None) -> "IgnoreStack":
+        """
+        The stack inside directory, adding its .gitignore if it has one.
+
+        Pass directory's listing as entries to skip opening a .gitignore
+        that is not there.
+        """
+        if entries is not None and os.path.normcase(IGNORE_FILE) not in entries:
+            return self
+        rules = _read_rules(os.path.join(directory, IGNORE_FILE))
+        if rules is None:
+            return self
+        return IgnoreStack(self.levels + ((os.path.join(directory, ""), rules),))
+
+    def ignored(self, path: str, is_dir: bool) -> bool:
+        """Whether git would ignore path (absolute, inside the walked tree)."""
+        name = os.path.basename(path)
+        for base, rules in reversed(self.levels):
+            if not path.startswith(base):
+                continue
+            rel = path[len(base):]
+            if os.sep != "/":
+                rel = rel.replace(os.sep, "/")
+            verdict = rules.match(rel, name, is_dir)
+            if verdict is not None:
+                return verdict
+        return False
+
+
+def walk(
+    root: str | os.PathLike,
+    snapshot: DirectorySnapshot | None = None,
+    ignore: IgnoreStack | None = None,
+    gitignore: bool = True
+) -> Iterator[tuple[str, list[os.DirEntry], list[os.DirEntry], IgnoreStack]]:
+    """
+    Walk a tree top-down like os.walk(), skipping what .gitignore ignores.
+
+    Yields (directory, subdirectories, files, ignore stack) with DirEntry
+    objects, sorted by name. Removing entries from the subdirectories list
+    prunes them, as with os.walk(). .git directories and symlinked
+    directories are never descended into; symlinks are reported as files.
+
+    Args:
+        root: Directory to walk
+        snapshot: List directories through this snapshot (a fresh one by
+            default), so callers can reuse the listings
+        ignore: Rules in effect above root, e.g. the stack yielded for its
+            parent (by default IgnoreStack.for_directory(root))
+        gitignore: Read no ignore files and walk everything but .git
+    """
+    snapshot = snapshot or DirectorySnapshot()
+    root = os.path.abspath(root)
+    if not gitignore:
+        parent_rules = IgnoreStack()
+    elif ignore is not None:
+        parent_rules = ignore
+    else:
+        parent_rules = IgnoreStack.for_directory(root)
+    # Whether each stack item's rules already include its own .gitignore
+    stack = [(root, parent_rules, not gitignore or ignore is None)]
+    while stack:
+        directory, rules, has_own = stack.pop()
+        entries = snapshot.listdir(directory)
+        if entries is None:
+            continue
+        if not has_own:
+            rules = rules.child(directory, entries)
+        dirs, files = [], []
+        for entry in sorted(entries.values(), key=lambda entry: entry.name):
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if is_dir and entry.name == ".git":
+                continue
+            if rules.levels and rules.ignored(entry.path, is_dir):
+                continue
+            (dirs if is_dir else files).append(entry)
+        yield directory, dirs, files, rules
+        stack.extend((entry.path, rules, not gitignore) for entry in reversed(dirs))
+
+
+def run_tests() -> bool:
+    """Self-test pattern semantics and pruning."""
+    import tempfile
+
+    all_passed = True
+
+    def check(label: str, actual, expected) -> None:
+        nonlocal all_passed
+        if actual != expected:
+            print(f"FAIL: {label} - expected {expected!r}, got {actual!r}", file=sys.stderr)
+            all_passed = False
+        else:
+            print(f"PASS: {label}")
+
+    rules = IgnoreRules(["*.log", "!keep.log", "/build/", "docs/**/*.tmp", "cache/"])
+    check("basename glob", rules.match("a/b/x.log", "x.log", False), True)
+    check("negation", rules.match("keep.log", "keep.log", False), False)
+    check("anchored dir", rules.match("build", "build", True), True)
+    check("anchored dir not nested", rules.match("src/build", "build", True), None)
+    check("dir-only pattern skips files", rules.match("cache", "cache", False), None)
+    check("double star", rules.match("docs/a/b/x.tmp", "x.tmp", False), True)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        (root / ".git" / "info").mkdir(parents=True)
+        (root / ".git" / "info" / "exclude").write_text("secret.txt\n")
+        (root / ".gitignore").write_text("build/\n*.pyc\n")
+        for rel in ["src/app.py", "src/app.pyc", "build/out.js", "secret.txt", "src/.gitignore"]:
+            (root / rel).parent.mkdir(parents=True, exist_ok=True)
+            (root / rel).write_text("x")
+        (root / "src" / ".gitignore").write_text("!app.pyc\n")
+        found = sorted(
+            os.path.relpath(entry.path, root)
+            for _, _, files, _ in walk(root)
+            for entry in files
+        )
+        check("walk", found, [".gitignore", "src/.gitignore", "src/app.py", "src/app.pyc"])
+
+    return all_passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="List files git would not ignore")
+    parser.add_argument("--path", default=".", help="Directory to walk (default: current)")
+    parser.add_argument("--test", action="store_true", help="Run self-tests")
+    args = parser.parse_args()
+
+    if args.test:
+        success = run_tests()
+        sys.exit(0 if success else 1)
+
+    root = Path(args.path).resolve()
+    for _, _, files, _ in walk(root):
+        for entry in files:
+            print(os.path.relpath(entry.path, root))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,27 +1,62 @@
 #!/usr/bin/env python3
 """
-Validate a single skill against the Agent Skills specification.
+Validate skills against the Agent Skills specification.
 
 Usage:
     python shared/validate_skill.py /path/to/skill-dir           # Validate skill at path
     python shared/validate_skill.py /path/to/skill-dir --verbose # Show all details
     python shared/validate_skill.py /path/to/skill-dir --suggest # Include optimization hints
+    python shared/validate_skill.py skill-a/ skill-b/            # Validate several skills
+    python shared/validate_skill.py --all [--root .] [--jobs 8]  # Validate every skill in a repo
+    python shared/validate_skill.py --all --profile              # Time each rule
+    python shared/validate_skill.py --all --cache                # Reuse unchanged skills' results
+    python shared/validate_skill.py --changed-since origin/main  # Only skills touched by a diff
+    python shared/validate_skill.py --all --format ndjson        # Stream machine-readable results
+    python shared/validate_skill.py --watch <skill_path>         # Re-validate on every save
+    python shared/validate_skill.py --list-rules                 # Show registered rules
 
 For plugin-bundled skills, also validates plugin.json and version sync.
 For project-level skills (.claude/skills/), skips plugin-specific checks.
 
-Exit codes: 0 = passed, 1 = failed
+Caching is opt-in: --cache stores built-in validator results in
+<root>/.cache/validate_skill (--cache-dir picks another directory), keyed
+by a hash of the skill's files. Hook output is never cached.
+
+Exit codes: 0 = passed, 1 = failed (any skill, in multi-skill mode)
 """
 
+import abc
 import argparse
+import asyncio
+import bisect
+import concurrent.futures
+import contextlib
+import functools
+import glob
+import hashlib
+import importlib.util
 import json
+import multiprocessing
+import os
+import posixpath
 import re
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator, TextIO
+
+from frontmatter import parse_simple_yaml, parse_yaml, parse_yaml_value  # noqa: F401
+from fs_snapshot import DirectorySnapshot
+from token_estimate import estimate_tokens
+
+# Bump whenever validator behaviour changes so cached results are invalidated
+VALIDATOR_VERSION = "12"
 
 
 class Severity(Enum):
@@ -38,9 +73,38 @@ class ValidationIssue:
     file_path: str
     field: str
     message: str
+    line: int | None = None
+    rule: str | None = None
 
     def __str__(self) -> str:
-        return f"{self.severity.value}: {self.file_path} [{self.field}]: {self.message}"
+        location = f"{self.file_path}:{self.line}" if self.line else self.file_path
+        return f"{self.severity.value}: {location} [{self.field}]: {self.message}"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to the same shape validation hooks emit."""
+        data: dict[str, Any] = {
+            "severity": self.severity.value,
+            "file_path": self.file_path,
+            "field": self.field,
+            "message": self.message,
+        }
+        if self.line is not None:
+            data["line"] = self.line
+        if self.rule is not None:
+            data["rule"] = self.rule
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ValidationIssue":
+        """Deserialize from a to_dict() / hook output mapping."""
+        return cls(
+            Severity[data["severity"]],
+            data["file_path"],
+            data["field"],
+            data["message"],
+            data.get("line"),
+            data.get("rule")
+        )
 
 
 @dataclass
@@ -49,6 +113,13 @@ class ValidationResult:
     skill_path: Path
     skill_name: str
     issues: list[ValidationIssue] = field(default_factory=list)
+    # True when validate_skill(run_hooks=False) skipped a hook that should still run
+    hooks_deferred: bool = False
+    # Where in issues a deferred hook's issues belong (after validators, before suggesters)
+    hook_position: int = 0
+    profile: "RuleProfile | None" = None
+    # Estimated tokens per skill-relative file, when the token-budget rule ran
+    token_counts: dict[str, int] = field(default_factory=dict)
 
     @property
     def has_errors(self) -> bool:
@@ -64,7 +135,7 @@ class ValidationResult:
 
 
 # =============================================================================
-# YAML Frontmatter Parser (regex-based, no PyYAML dependency)
+# YAML Frontmatter Parser (see frontmatter.py)
 # =============================================================================
 
 def parse_skill_md(skill_md_path: Path) -> tuple[dict[str, Any], str, int]:
@@ -74,86 +145,436 @@ def parse_skill_md(skill_md_path: Path) -> tuple[dict[str, Any], str, int]:
     Returns:
         (frontmatter_dict, body_text, body_line_count)
     """
-    content = skill_md_path.read_text()
+    frontmatter, body, body_line_count, _ = parse_skill_md_text(skill_md_path.read_text())
+    return frontmatter, body, body_line_count
+
+
+def parse_skill_md_text(
+    content: str,
+    key_lines: dict[str, int] | None = None
+) -> tuple[dict[str, Any], str, int, int]:
+    """
+    Parse SKILL.md content and extract frontmatter and body.
 
+    Args:
+        content: SKILL.md text
+        key_lines: If given, filled with the SKILL.md line of every
+            frontmatter key, by dotted path (e.g. "metadata.version")
+
+    Returns:
+        (frontmatter_dict, body_text, body_line_count, body_start_line)
+        where body_start_line is the 1-based SKILL.md line the body starts on
+    """
     # Match YAML frontmatter between --- markers
     match = re.search(r"^---\s*\n(.*?)\n---\s*\n?", content, re.DOTALL)
     if not match:
-        return {}, content, content.count('\n') + 1
+        return {}, content, content.count('\n') + 1, 1
 
     frontmatter_text = match.group(1)
     body = content[match.end():]
     body_line_count = body.count('\n') + 1 if body.strip() else 0
+    body_start_line = content.count('\n', 0, match.end()) + 1
 
-    frontmatter = parse_simple_yaml(frontmatter_text)
+    frontmatter, lines = parse_yaml(frontmatter_text, content.count('\n', 0, match.start(1)) + 1)
+    if key_lines is not None:
+        key_lines.update(lines)
+
+    return frontmatter, body, body_line_count, body_start_line
 
-    return frontmatter, body, body_line_count
 
+# =============================================================================
+# Markdown Lexer (single pass over the body, shared by body validators)
+# =============================================================================
 
-def parse_simple_yaml(text: str) -> dict[str, Any]:
+@dataclass
+class MarkdownToken:
     """
-    Parse simple YAML frontmatter without PyYAML.
-    Handles:
-    - Top-level scalar values: key: value
-    - Nested objects: key:\n  subkey: value
-    - Quoted strings
+    A span of a SKILL.md body.
+
+    kind is one of:
+    - "code": fenced code block; text is the block content, info the fence language
+    - "heading": ATX heading; text is the heading title, level its depth
+    - "prose": any other non-blank line
+    - "link": inline [text](target) found in a heading or prose line; info is the target
     """
-    result: dict[str, Any] = {}
-    lines = text.split('\n')
-    current_key = None
-    nested_content: list[str] = []
+    kind: str
+    text: str
+    line: int
+    info: str = ""
+    level: int = 0
+
+    @cached_property
+    def lower(self) -> str:
+        """text lowercased, computed once however many rules search it."""
+        return self.text.lower()
 
-    for line in lines:
-        if not line.strip() or line.strip().startswith('#'):
-            continue
 
-        indent = len(line) - len(line.lstrip())
-        stripped = line.strip()
+FENCE_PATTERN = re.compile(r'^\s*(`{3,}|~{3,})\s*([^\s`]*)')
+HEADING_PATTERN = re.compile(r'^\s{0,3}(#{1,6})\s+(.*?)\s*#*\s*$')
+LINK_PATTERN = re.compile(r'\[([^\]]*)\]\(([^)]+)\)')
 
-        if indent == 0 and ':' in stripped:
-            if current_key and nested_content:
-                result[current_key] = parse_nested_yaml(nested_content)
-                nested_content = []
 
-            key, _, value = stripped.partition(':')
-            key = key.strip()
-            value = value.strip()
+def lex_markdown(body: str, start_line: int = 1) -> list[MarkdownToken]:
+    """
+    Tokenize a Markdown body in one pass.
+
+    Args:
+        body: Markdown text (SKILL.md without frontmatter)
+        start_line: SKILL.md line number of the first body line
 
-            if value:
-                result[key] = parse_yaml_value(value)
-                current_key = None
+    Returns:
+        Tokens in document order; each carries its SKILL.md line number
+    """
+    tokens: list[MarkdownToken] = []
+    fence: str | None = None
+    fence_info = ""
+    fence_line = 0
+    code_lines: list[str] = []
+
+    for line_number, line in enumerate(body.split('\n'), start=start_line):
+        if fence is not None:
+            stripped = line.strip()
+            if stripped.startswith(fence) and not stripped.lstrip(fence[0]):
+                tokens.append(MarkdownToken("code", '\n'.join(code_lines), fence_line, fence_info))
+                fence = None
             else:
-                current_key = key
-        elif current_key and indent > 0:
-            nested_content.append(line)
+                code_lines.append(line)
+            continue
 
-    if current_key and nested_content:
-        result[current_key] = parse_nested_yaml(nested_content)
+        fence_match = FENCE_PATTERN.match(line)
+        if fence_match:
+            fence = fence_match.group(1)
+            fence_info = fence_match.group(2).lower()
+            fence_line = line_number + 1
+            code_lines = []
+            continue
 
-    return result
+        if not line.strip():
+            continue
 
+        heading_match = HEADING_PATTERN.match(line)
+        if heading_match:
+            tokens.append(MarkdownToken(
+                "heading", heading_match.group(2), line_number,
+                level=len(heading_match.group(1))
+            ))
+        else:
+            tokens.append(MarkdownToken("prose", line, line_number))
+
+        for link_match in LINK_PATTERN.finditer(line):
+            tokens.append(MarkdownToken(
+                "link", link_match.group(1), line_number, link_match.group(2)
+            ))
+
+    # Unterminated fence runs to the end of the body
+    if fence is not None:
+        tokens.append(MarkdownToken("code", '\n'.join(code_lines), fence_line, fence_info))
+
+    return tokens
+
+
+def _first_match_line(
+    tokens: list[MarkdownToken],
+    pattern: str | re.Pattern,
+    kinds: tuple[str, ...] = ("code", "heading", "prose"),
+    lowercase: bool = False
+) -> int | None:
+    """Return the SKILL.md line of the first token span matching a regex."""
+    for token in tokens:
+        if token.kind not in kinds:
+            continue
+        text = token.lower if lowercase else token.text
+        match = re.search(pattern, text)
+        if match:
+            return token.line + text.count('\n', 0, match.start())
+    return None
+
+
+class TokenPatterns:
+    """
+    Several regexes searched over body tokens together.
+
+    The patterns are joined into one compiled alternation that screens each
+    token; only tokens it matches are searched pattern by pattern. A body
+    without hits costs one regex scan per token however many patterns a
+    rule has, and the result is the same as searching each pattern alone.
+    """
+
+    def __init__(
+        self,
+        patterns: list[str],
+        kinds: tuple[str, ...] = ("code", "heading", "prose"),
+        lowercase: bool = False
+    ):
+        self.patterns = [re.compile(pattern) for pattern in patterns]
+        self.combined = re.compile('|'.join(f'(?:{pattern})' for pattern in patterns))
+        self.kinds = kinds
+        self.lowercase = lowercase
+
+    def first_lines(self, tokens: list[MarkdownToken]) -> list[int | None]:
+        """SKILL.md line of each pattern's first match (None if it never matches)."""
+        lines: list[int | None] = [None] * len(self.patterns)
+        pending = list(range(len(self.patterns)))
+        for token in tokens:
+            if token.kind not in self.kinds:
+                continue
+            text = token.lower if self.lowercase else token.text
+            if not self.combined.search(text):
+                continue
+            for i in list(pending):
+                match = self.patterns[i].search(text)
+                if match:
+                    lines[i] = token.line + text.count('\n', 0, match.start())
+                    pending.remove(i)
+            if not pending:
+                break
+        return lines
+
+
+# =============================================================================
+# Reference Index (references/ summarized once, shared by reference checks)
+# =============================================================================
+
+TOC_INDICATORS = (
+    '## table of contents',
+    '## contents',
+    '## toc',
+    '- [',  # Markdown link list (common TOC format)
+)
+
+
+@dataclass
+class ReferenceFile:
+    """
+    A references/*.md file, summarized on demand.
+
+    Each summary is computed from content the first time it is read, so a
+    rule that only needs line_count never pays for the Markdown scan.
+    """
+    path: str
+    content: str
+
+    @cached_property
+    def size(self) -> int:
+        return len(self.content.encode())
+
+    @cached_property
+    def line_count(self) -> int:
+        return self.content.count('\n') + 1
+
+    @cached_property
+    def tokens(self) -> list[MarkdownToken]:
+        return lex_markdown(self.content)
+
+    @cached_property
+    def headings(self) -> list[MarkdownToken]:
+        return [t for t in self.tokens if t.kind == "heading"]
+
+    @cached_property
+    def links(self) -> list[MarkdownToken]:
+        return [t for t in self.tokens if t.kind == "link"]
+
+    @cached_property
+    def has_toc(self) -> bool:
+        content_lower = self.content.lower()
+        return any(indicator in content_lower for indicator in TOC_INDICATORS)
 
-def parse_nested_yaml(lines: list[str]) -> dict[str, Any]:
-    """Parse nested YAML content (one level deep)."""
-    result: dict[str, Any] = {}
-    for line in lines:
-        stripped = line.strip()
-        if ':' in stripped and not stripped.startswith('#'):
-            key, _, value = stripped.partition(':')
-            key = key.strip()
-            value = value.strip()
-            if value:
-                result[key] = parse_yaml_value(value)
-    return result
 
+def resolve_link(source: str, target: str) -> str | None:
+    """
+    Resolve a Markdown link target against the skill-relative file it appears in.
+
+    Returns:
+        Skill-relative posix path without any #fragment, or None for
+        external URLs, absolute paths and pure in-page anchors
+    """
+    target = target.strip().split('#', 1)[0]
+    if not target or target.startswith(('http://', 'https://', 'mailto:', '/')):
+        return None
+    return posixpath.normpath(posixpath.join(posixpath.dirname(source), target))
+
+
+@dataclass
+class ReferenceIndex:
+    """
+    Per-skill index of references/: file stats, headings, links and a link graph.
+
+    graph maps each source file ("SKILL.md" or a reference path) to the
+    skill-relative files it links to, in link order without duplicates.
+    Both the per-file summaries and the graph are computed on first use.
+    """
+    files: dict[str, ReferenceFile] = field(default_factory=dict)
+    skill_links: list[MarkdownToken] | None = None
+
+    @classmethod
+    def build(
+        cls,
+        references: dict[str, str],
+        skill_links: list[MarkdownToken] | None = None
+    ) -> "ReferenceIndex":
+        """
+        Index reference contents (skill-relative path -> text).
+
+        Args:
+            references: Contents as loaded into SkillDocument.references
+            skill_links: SKILL.md link tokens, added to the graph as "SKILL.md"
+        """
+        return cls(
+            files={
+                rel_path: ReferenceFile(rel_path, content)
+                for rel_path, content in references.items()
+            },
+            skill_links=skill_links,
+        )
+
+    @cached_property
+    def graph(self) -> dict[str, list[str]]:
+        graph: dict[str, list[str]] = {}
+        if self.skill_links is not None:
+            graph["SKILL.md"] = _link_targets("SKILL.md", self.skill_links)
+        for rel_path, ref in self.files.items():
+            graph[rel_path] = _link_targets(rel_path, ref.links)
+        return graph
+
+    def inbound(self, path: str) -> list[str]:
+        """Files that link to path."""
+        return [source for source, targets in self.graph.items() if path in targets]
+
+    def reachable(self, start: str = "SKILL.md") -> set[str]:
+        """Every file reachable from start by following links (start excluded)."""
+        seen: set[str] = set()
+        stack = list(self.graph.get(start, []))
+        while stack:
+            path = stack.pop()
+            if path in seen:
+                continue
+            seen.add(path)
+            stack.extend(self.graph.get(path, []))
+        seen.discard(start)
+        return seen
+
+
+def _link_targets(source: str, links: list[MarkdownToken]) -> list[str]:
+    targets: dict[str, None] = {}
+    for link in links:
+        resolved = resolve_link(source, link.info)
+        if resolved is not None and resolved != source:
+            targets[resolved] = None
+    return list(targets)
+
+
+# =============================================================================
+# Skill Document (read once, shared by all validators)
+# =============================================================================
+
+@dataclass
+class SkillDocument:
+    """
+    A skill's SKILL.md and references/ loaded into memory once.
+
+    Every validator and suggester reads from this instead of the filesystem,
+    so a skill costs one read of SKILL.md and one read per reference file.
+    """
+    skill_path: Path
+    raw: bytes
+    text: str
+    frontmatter: dict[str, Any]
+    body: str
+    body_line_count: int
+    body_start_line: int
+    line_offsets: list[int]
+    references: dict[str, str] = field(default_factory=dict)
+    has_references_content: bool = False
+    frontmatter_lines: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def char_count(self) -> int:
+        return len(self.text)
+
+    @cached_property
+    def token_counts(self) -> dict[str, int]:
+        """Estimated tokens of SKILL.md and each reference, computed on first use."""
+        counts = {"SKILL.md": estimate_tokens(self.raw)}
+        for rel_path, content in self.references.items():
+            counts[rel_path] = estimate_tokens(content)
+        return counts
+
+    @cached_property
+    def tokens(self) -> list[MarkdownToken]:
+        """Body tokens from lex_markdown(), computed on first use."""
+        return lex_markdown(self.body, self.body_start_line)
+
+    @cached_property
+    def reference_index(self) -> ReferenceIndex:
+        """Index of references/ and the skill's link graph, computed on first use."""
+        return ReferenceIndex.build(
+            self.references, [t for t in self.tokens if t.kind == "link"]
+        )
+
+    def line_at(self, offset: int) -> int:
+        """Return the 1-based SKILL.md line containing a character offset."""
+        return bisect.bisect_right(self.line_offsets, offset)
+
+    def key_line(self, key: str) -> int | None:
+        """Return the SKILL.md line of a frontmatter key, also trying metadata.<key>."""
+        return self.frontmatter_lines.get(key) or self.frontmatter_lines.get(f"metadata.{key}")
+
+    @classmethod
+    def from_text(
+        cls,
+        skill_path: Path,
+        text: str,
+        read_references: bool = True
+    ) -> "SkillDocument":
+        """Build a document from SKILL.md content already in memory."""
+        frontmatter_lines: dict[str, int] = {}
+        frontmatter, body, body_line_count, body_start_line = parse_skill_md_text(
+            text, frontmatter_lines
+        )
+
+        line_offsets = [0]
+        line_offsets.extend(m.end() for m in re.finditer('\n', text))
+
+        references: dict[str, str] = {}
+        has_references_content = False
+        references_dir = skill_path / "references"
+        if read_references and references_dir.is_dir():
+            for ref_file in sorted(references_dir.iterdir()):
+                has_references_content = True
+                if ref_file.suffix != ".md" or not ref_file.is_file():
+                    continue
+                try:
+                    references[ref_file.relative_to(skill_path).as_posix()] = ref_file.read_text()
+                except (OSError, UnicodeDecodeError):
+                    pass
+
+        return cls(
+            skill_path=skill_path,
+            raw=text.encode(),
+            text=text,
+            frontmatter=frontmatter,
+            body=body,
+            body_line_count=body_line_count,
+            body_start_line=body_start_line,
+            line_offsets=line_offsets,
+            references=references,
+            has_references_content=has_references_content,
+            frontmatter_lines=frontmatter_lines,
+        )
+
+
+def load_skill_document(skill_path: Path) -> SkillDocument:
+    """
+    Read a skill directory into a SkillDocument.
 
-def parse_yaml_value(value: str) -> str:
-    """Parse a YAML value, handling quotes."""
-    value = value.strip()
-    if (value.startswith('"') and value.endswith('"')) or \
-       (value.startswith("'") and value.endswith("'")):
-        return value[1:-1]
-    return value
+    Raises:
+        OSError: If SKILL.md cannot be read
+        UnicodeDecodeError: If SKILL.md is not valid UTF-8
+    """
+    raw = (skill_path / "SKILL.md").read_bytes()
+    doc = SkillDocument.from_text(skill_path, raw.decode("utf-8"))
+    doc.raw = raw
+    return doc
 
 
 # =============================================================================
@@ -161,7 +582,7 @@ def parse_yaml_value(value: str) -> str:
 # =============================================================================
 
 def validate_name(
-    name: str | None,
+    name: Any,
     skill_dir_name: str,
     file_path: str
 ) -> list[ValidationIssue]:
@@ -185,6 +606,13 @@ def validate_name(
         ))
         return issues
 
+    if not isinstance(name, str):
+        issues.append(ValidationIssue(
+            Severity.ERROR, file_path, "name",
+            f"'name' must be a string, got {type(name).__name__}"
+        ))
+        return issues
+
     if len(name) > 64:
         issues.append(ValidationIssue(
             Severity.ERROR, file_path, "name",
@@ -235,7 +663,7 @@ def validate_name(
     return issues
 
 
-def validate_description(description: str | None, file_path: str) -> list[ValidationIssue]:
+def validate_description(description: Any, file_path: str) -> list[ValidationIssue]:
     """
     Validate the 'description' field.
 
@@ -252,6 +680,13 @@ def validate_description(description: str | None, file_path: str) -> list[Valida
         ))
         return issues
 
+    if not isinstance(description, str):
+        issues.append(ValidationIssue(
+            Severity.ERROR, file_path, "description",
+            f"'description' must be a string, got {type(description).__name__}"
+        ))
+        return issues
+
     if not description.strip():
         issues.append(ValidationIssue(
             Severity.ERROR, file_path, "description",
@@ -273,7 +708,12 @@ def validate_optional_fields(frontmatter: dict[str, Any], file_path: str) -> lis
     issues = []
 
     compatibility = frontmatter.get('compatibility')
-    if compatibility and len(str(compatibility)) > 500:
+    if compatibility is not None and not isinstance(compatibility, str):
+        issues.append(ValidationIssue(
+            Severity.ERROR, file_path, "compatibility",
+            f"'compatibility' must be a string, got {type(compatibility).__name__}"
+        ))
+    elif compatibility and len(str(compatibility)) > 500:
         issues.append(ValidationIssue(
             Severity.ERROR, file_path, "compatibility",
             f"'compatibility' exceeds 500 characters ({len(str(compatibility))} chars)"
@@ -322,10 +762,11 @@ def validate_body(body_line_count: int, file_path: str) -> list[ValidationIssue]
     return issues
 
 
-def validate_character_budget(
-    skill_md_path: Path,
-    file_path: str
-) -> list[ValidationIssue]:
+CHARACTER_BUDGET_WARN = 8000
+CHARACTER_BUDGET_ERROR = 12000
+
+
+def validate_character_budget(char_count: int, file_path: str) -> list[ValidationIssue]:
     """
     Validate skill file size is within context budget.
 
@@ -335,41 +776,99 @@ def validate_character_budget(
     """
     issues = []
 
-    warn_threshold = 8000
-    error_threshold = 12000
+    warn_threshold = CHARACTER_BUDGET_WARN
+    error_threshold = CHARACTER_BUDGET_ERROR
 
-    try:
-        content = skill_md_path.read_text()
-        char_count = len(content)
+    if char_count > error_threshold:
+        issues.append(ValidationIssue(
+            Severity.ERROR, file_path, "character-budget",
+            f"SKILL.md exceeds {error_threshold:,} character limit ({char_count:,} chars). "
+            f"Must compress or move content to references/."
+        ))
+    elif char_count > warn_threshold:
+        issues.append(ValidationIssue(
+            Severity.WARNING, file_path, "character-budget",
+            f"SKILL.md exceeds {warn_threshold:,} characters ({char_count:,} chars). "
+            f"Consider compressing content or moving detailed sections to references/."
+        ))
+
+    return issues
+
+
+@dataclass(frozen=True)
+class TokenBudget:
+    """
+    Token thresholds for validate_token_budget().
+
+    The SKILL.md defaults match the character budget at the ~3.5
+    characters per token typical of SKILL.md Markdown, so both usually
+    trip together; validate_token_budget() reports only what the character
+    budget missed. References load on demand, so they only get a warning
+    threshold.
+    """
+    skill_warn: int = 2500
+    skill_error: int = 3500
+    reference_warn: int = 10000
+
+
+DEFAULT_TOKEN_BUDGET = TokenBudget()
+
+
+def validate_token_budget(
+    token_counts: dict[str, int],
+    file_path: str,
+    budget: TokenBudget = DEFAULT_TOKEN_BUDGET,
+    char_count: int | None = None
+) -> list[ValidationIssue]:
+    """
+    Validate estimated token counts against the budget.
+
+    Limits:
+    - SKILL.md > skill_warn tokens: WARNING - consider compressing
+    - SKILL.md > skill_error tokens: ERROR - must compress or use references
+    - A reference > reference_warn tokens: WARNING - consider splitting
+
+    Pass char_count when validate_character_budget() also runs. An oversize
+    SKILL.md is one problem, so no SKILL.md issue is reported at or below
+    the severity the character budget already reported.
+    """
+    issues = []
+
+    # Highest SKILL.md size issue validate_character_budget() reported
+    if char_count is None or char_count <= CHARACTER_BUDGET_WARN:
+        reported = None
+    elif char_count > CHARACTER_BUDGET_ERROR:
+        reported = Severity.ERROR
+    else:
+        reported = Severity.WARNING
 
-        if char_count > error_threshold:
+    tokens = token_counts.get("SKILL.md", 0)
+    if tokens > budget.skill_error:
+        if reported != Severity.ERROR:
             issues.append(ValidationIssue(
-                Severity.ERROR, file_path, "character-budget",
-                f"SKILL.md exceeds {error_threshold:,} character limit ({char_count:,} chars). "
+                Severity.ERROR, file_path, "token-budget",
+                f"SKILL.md exceeds {budget.skill_error:,} token limit (~{tokens:,} tokens). "
                 f"Must compress or move content to references/."
             ))
-        elif char_count > warn_threshold:
-            issues.append(ValidationIssue(
-                Severity.WARNING, file_path, "character-budget",
-                f"SKILL.md exceeds {warn_threshold:,} characters ({char_count:,} chars). "
-                f"Consider compressing content or moving detailed sections to references/."
-            ))
-    except Exception as e:
+    elif tokens > budget.skill_warn and reported is None:
         issues.append(ValidationIssue(
-            Severity.ERROR, file_path, "character-budget",
-            f"Could not read file: {e}"
+            Severity.WARNING, file_path, "token-budget",
+            f"SKILL.md exceeds {budget.skill_warn:,} tokens (~{tokens:,} tokens). "
+            f"Consider compressing content or moving detailed sections to references/."
         ))
 
+    for rel_path, tokens in token_counts.items():
+        if rel_path != "SKILL.md" and tokens > budget.reference_warn:
+            issues.append(ValidationIssue(
+                Severity.WARNING, file_path, "token-budget",
+                f"Reference file '{rel_path}' exceeds {budget.reference_warn:,} tokens "
+                f"(~{tokens:,} tokens). Consider splitting it so agents load only what they need."
+            ))
+
     return issues
 
 
-def validate_references_usage(
-    skill_path: Path,
-    body: str,
-    body_line_count: int,
-    char_count: int,
-    file_path: str
-) -> list[ValidationIssue]:
+def validate_references_usage(doc: SkillDocument, file_path: str) -> list[ValidationIssue]:
     """
     Validate that large skills use references/ for progressive disclosure.
 
@@ -378,15 +877,11 @@ def validate_references_usage(
     - >6,000 chars without references mentioned in body: WARNING
     """
     issues = []
+    body_line_count = doc.body_line_count
+    char_count = doc.char_count
 
-    # Check if references are mentioned in body
-    has_references_mention = 'references/' in body
-
-    # Check if references directory exists and has content
-    references_dir = skill_path / "references"
-    has_references_dir = references_dir.exists() and any(references_dir.iterdir()) if references_dir.exists() else False
-
-    uses_references = has_references_mention or has_references_dir
+    # References count as used if mentioned in body or references/ has content
+    uses_references = 'references/' in doc.body or doc.has_references_content
 
     if body_line_count > 150 and not uses_references:
         issues.append(ValidationIssue(
@@ -434,7 +929,10 @@ def validate_no_xml_tags(
     return issues
 
 
-def validate_script_paths_use_skill_dir(body: str, file_path: str) -> list[ValidationIssue]:
+def validate_script_paths_use_skill_dir(
+    tokens: list[MarkdownToken],
+    file_path: str
+) -> list[ValidationIssue]:
     """
     Validate that script invocations in bash code blocks use {SKILL_DIR} prefix.
 
@@ -445,14 +943,11 @@ def validate_script_paths_use_skill_dir(body: str, file_path: str) -> list[Valid
     """
     issues = []
 
-    if not body.strip():
-        return issues
-
-    # Extract bash code blocks
-    code_blocks = re.findall(r'```(?:bash|sh)?\s*\n(.*?)```', body, re.DOTALL)
+    # Only bash code blocks (or untagged ones) contain shell invocations
+    code_blocks = [t for t in tokens if t.kind == "code" and t.info in ("bash", "sh", "")]
 
     for block in code_blocks:
-        for line in block.strip().split('\n'):
+        for offset, line in enumerate(block.text.split('\n')):
             line = line.strip()
             if not line:
                 continue
@@ -487,13 +982,23 @@ def validate_script_paths_use_skill_dir(body: str, file_path: str) -> list[Valid
 
             issues.append(ValidationIssue(
                 Severity.WARNING, file_path, "body",
-                f"Script path '{script_path}' should use '{{SKILL_DIR}}/scripts/' prefix for portability"
+                f"Script path '{script_path}' should use '{{SKILL_DIR}}/scripts/' prefix "
+                "for portability",
+                block.line + offset
             ))
 
     return issues
 
 
-def validate_no_windows_paths(body: str, file_path: str) -> list[ValidationIssue]:
+# Windows drive paths (C:\, D:\, etc.) or path-like backslash usage (\Users\, \path\to)
+WINDOWS_PATH_PATTERN = re.compile(r'[A-Za-z]:\\|\\[A-Za-z][A-Za-z0-9_-]*\\')
+WINDOWS_TRAILING_PATH_PATTERN = re.compile(r'\\[A-Za-z][A-Za-z0-9_-]*$')
+
+
+def validate_no_windows_paths(
+    tokens: list[MarkdownToken],
+    file_path: str
+) -> list[ValidationIssue]:
     """
     Detect Windows-style paths in the body.
 
@@ -503,19 +1008,21 @@ def validate_no_windows_paths(body: str, file_path: str) -> list[ValidationIssue
     """
     issues = []
 
-    if not body.strip():
-        return issues
-
-    # Pattern for Windows drive paths (C:\, D:\, etc.)
-    drive_pattern = r'[A-Za-z]:\\'
-
-    # Pattern for path-like backslash usage (e.g., \Users, \path\to)
-    path_pattern = r'\\[A-Za-z][A-Za-z0-9_-]*(?:\\|$)'
-
-    if re.search(drive_pattern, body) or re.search(path_pattern, body):
+    line = _first_match_line(tokens, WINDOWS_PATH_PATTERN)
+    if line is None:
+        # A lone \word only counts as a path at the very end of the body,
+        # not at the end of every line (an escape like \n in prose)
+        last = next((t for t in reversed(tokens) if t.kind != "link"), None)
+        if last is not None:
+            match = WINDOWS_TRAILING_PATH_PATTERN.search(last.text)
+            if match:
+                line = last.line + last.text.count('\n', 0, match.start())
+    if line is not None:
         issues.append(ValidationIssue(
             Severity.WARNING, file_path, "body",
-            "Windows-style path detected. Use forward slashes '/' for cross-platform compatibility."
+            "Windows-style path detected. "
+            "Use forward slashes '/' for cross-platform compatibility.",
+            line
         ))
 
     return issues
@@ -562,8 +1069,9 @@ def validate_vague_names(name: str | None, file_path: str) -> list[ValidationIss
 
 def validate_referenced_files_exist(
     skill_path: Path,
-    body: str,
-    file_path: str
+    tokens: list[MarkdownToken],
+    file_path: str,
+    files: DirectorySnapshot | None = None
 ) -> list[ValidationIssue]:
     """
     Validate that files referenced in SKILL.md actually exist.
@@ -571,19 +1079,18 @@ def validate_referenced_files_exist(
     Rules:
     - Markdown links to local files should point to existing files
     - Includes: scripts/, references/, assets/ paths
-    - Skips placeholder text and non-file links
+    - Skips placeholder text, non-file links, and links inside code blocks
+
+    Existence is answered from files, so each linked directory is listed
+    once however many links point into it.
     """
     issues = []
+    files = files or DirectorySnapshot()
 
-    if not body.strip():
-        return issues
-
-    # Pattern for markdown links: [text](path) where path is relative
-    # Excludes http/https URLs and anchors (#)
-    link_pattern = r'\[([^\]]*)\]\(([^)]+)\)'
-
-    for match in re.finditer(link_pattern, body):
-        link_text, link_path = match.groups()
+    for token in tokens:
+        if token.kind != "link":
+            continue
+        link_path = token.info
 
         # Skip URLs and anchors
         if link_path.startswith(('http://', 'https://', '#', 'mailto:')):
@@ -605,10 +1112,11 @@ def validate_referenced_files_exist(
         # Resolve relative path from skill directory
         referenced_path = skill_path / link_path
 
-        if not referenced_path.exists():
+        if not files.exists(referenced_path):
             issues.append(ValidationIssue(
                 Severity.WARNING, file_path, "body",
-                f"Referenced file does not exist: '{link_path}'"
+                f"Referenced file does not exist: '{link_path}'",
+                token.line
             ))
 
     return issues
@@ -658,47 +1166,57 @@ def suggest_description_optimization(
     return issues
 
 
+OBVIOUS_OPERATION_PATTERNS = TokenPatterns([
+    r'use the read tool',
+    r'use the write tool',
+    r'use the edit tool',
+    r'make sure the (?:file|path) exists',
+    r'check if the file exists',
+], lowercase=True)
+
+
 def suggest_instruction_optimization(
-    body: str,
+    tokens: list[MarkdownToken],
     body_line_count: int,
     file_path: str
 ) -> list[ValidationIssue]:
     """Suggest improvements for the instruction body."""
     issues = []
 
-    if not body.strip():
+    if not tokens:
         return issues
 
-    body_lower = body.lower()
-
     # Check for numbered workflow steps
-    has_numbered_steps = bool(re.search(r'^\s*[1-9]\.\s+', body, re.MULTILINE))
-    has_workflow_section = '## workflow' in body_lower or '# workflow' in body_lower
-    if has_workflow_section and not has_numbered_steps:
+    has_numbered_steps = any(
+        t.kind == "prose" and re.match(r'\s*[1-9]\.\s+', t.text) for t in tokens
+    )
+    workflow_heading = next(
+        (t for t in tokens if t.kind == "heading" and t.text.lower().startswith('workflow')),
+        None
+    )
+    if workflow_heading and not has_numbered_steps:
         issues.append(ValidationIssue(
             Severity.SUGGESTION, file_path, "body",
-            "Workflow section found but no numbered steps. Number steps explicitly (1. 2. 3.) for clarity"
+            "Workflow section found but no numbered steps. "
+            "Number steps explicitly (1. 2. 3.) for clarity",
+            workflow_heading.line
         ))
 
     # Check for obvious operation explanations
-    obvious_patterns = [
-        r'use the read tool',
-        r'use the write tool',
-        r'use the edit tool',
-        r'make sure the (?:file|path) exists',
-        r'check if the file exists',
-    ]
-    for pattern in obvious_patterns:
-        if re.search(pattern, body_lower):
+    lines = OBVIOUS_OPERATION_PATTERNS.first_lines(tokens)
+    for pattern, line in zip(OBVIOUS_OPERATION_PATTERNS.patterns, lines):
+        if line is not None:
             issues.append(ValidationIssue(
                 Severity.SUGGESTION, file_path, "body",
-                f"Consider removing obvious operation explanations (found: '{pattern}'). Claude knows standard operations."
+                f"Consider removing obvious operation explanations "
+                f"(found: '{pattern.pattern}'). Claude knows standard operations.",
+                line
             ))
             break
 
     # Check for large body without references (lowered threshold for stricter limits)
     if body_line_count > 150:
-        has_reference = 'references/' in body
+        has_reference = any('references/' in t.text for t in tokens if t.kind != "link")
         if not has_reference:
             issues.append(ValidationIssue(
                 Severity.SUGGESTION, file_path, "body",
@@ -757,56 +1275,64 @@ def suggest_gerund_naming(name: str | None, file_path: str) -> list[ValidationIs
     return issues
 
 
-def suggest_time_sensitive_language(body: str, file_path: str) -> list[ValidationIssue]:
+# Patterns for time-sensitive language
+TIME_SENSITIVE_PATTERNS = [
+    (r'\bcurrently\b', "currently"),
+    (r'\brecently\b', "recently"),
+    (r'\bnow\b(?!\s+(?:you|we|it))', "now"),  # Avoid "now you can" false positives
+    (r'\bas of (?:version |v)?\d', "as of version X"),
+    (r'\bbefore \w+ \d{4}\b', "before [month] [year]"),
+    (r'\bafter \w+ \d{4}\b', "after [month] [year]"),
+    (r'\bin \d{4}\b', "in [year]"),
+    (r'\bsince \d{4}\b', "since [year]"),
+    (r'\bupcoming\b', "upcoming"),
+    (r'\bsoon\b', "soon"),
+    (r'\blatest\b', "latest"),
+    (r'\bnew(?:ly)?\b', "new/newly"),
+]
+TIME_SENSITIVE_MATCHER = TokenPatterns(
+    [pattern for pattern, _ in TIME_SENSITIVE_PATTERNS],
+    kinds=("heading", "prose"),
+    lowercase=True
+)
+
+
+def suggest_time_sensitive_language(
+    tokens: list[MarkdownToken],
+    file_path: str
+) -> list[ValidationIssue]:
     """
     Flag time-sensitive language that may become outdated.
 
     Rules:
     - Avoid "currently", "as of version X", "before August 2025", etc.
     - Skills should be timeless where possible
+    - Only prose and headings are checked; code blocks are not instructions
     """
     issues = []
 
-    if not body.strip():
-        return issues
-
-    # Patterns for time-sensitive language
-    patterns = [
-        (r'\bcurrently\b', "currently"),
-        (r'\brecently\b', "recently"),
-        (r'\bnow\b(?!\s+(?:you|we|it))', "now"),  # Avoid "now you can" false positives
-        (r'\bas of (?:version |v)?\d', "as of version X"),
-        (r'\bbefore \w+ \d{4}\b', "before [month] [year]"),
-        (r'\bafter \w+ \d{4}\b', "after [month] [year]"),
-        (r'\bin \d{4}\b', "in [year]"),
-        (r'\bsince \d{4}\b', "since [year]"),
-        (r'\bupcoming\b', "upcoming"),
-        (r'\bsoon\b', "soon"),
-        (r'\blatest\b', "latest"),
-        (r'\bnew(?:ly)?\b', "new/newly"),
-    ]
-
-    body_lower = body.lower()
     found_patterns = []
+    first_line = None
 
-    for pattern, description in patterns:
-        if re.search(pattern, body_lower):
+    lines = TIME_SENSITIVE_MATCHER.first_lines(tokens)
+    for (_, description), line in zip(TIME_SENSITIVE_PATTERNS, lines):
+        if line is not None:
             found_patterns.append(description)
+            first_line = line if first_line is None else min(first_line, line)
 
     if found_patterns:
         examples = ', '.join(found_patterns[:3])
         issues.append(ValidationIssue(
             Severity.SUGGESTION, file_path, "body",
-            f"Time-sensitive language detected ({examples}). Consider using timeless phrasing to avoid outdated instructions."
+            f"Time-sensitive language detected ({examples}). "
+            "Consider using timeless phrasing to avoid outdated instructions.",
+            first_line
         ))
 
     return issues
 
 
-def suggest_toc_for_long_references(
-    skill_path: Path,
-    file_path: str
-) -> list[ValidationIssue]:
+def suggest_toc_for_long_references(doc: SkillDocument, file_path: str) -> list[ValidationIssue]:
     """
     Suggest table of contents for long reference files.
 
@@ -816,38 +1342,32 @@ def suggest_toc_for_long_references(
     """
     issues = []
 
-    references_dir = skill_path / "references"
-    if not references_dir.exists():
-        return issues
-
-    for ref_file in references_dir.glob("*.md"):
-        try:
-            content = ref_file.read_text()
-            line_count = content.count('\n') + 1
-
-            if line_count > 100:
-                # Check for common TOC indicators
-                content_lower = content.lower()
-                has_toc = any(indicator in content_lower for indicator in [
-                    '## table of contents',
-                    '## contents',
-                    '## toc',
-                    '- [',  # Markdown link list (common TOC format)
-                ])
-
-                if not has_toc:
-                    rel_path = ref_file.relative_to(skill_path)
-                    issues.append(ValidationIssue(
-                        Severity.SUGGESTION, file_path, "references",
-                        f"Reference file '{rel_path}' has {line_count} lines. Consider adding a table of contents."
-                    ))
-        except Exception:
-            pass
+    for rel_path, ref in doc.reference_index.files.items():
+        if ref.line_count > 100 and not ref.has_toc:
+            issues.append(ValidationIssue(
+                Severity.SUGGESTION, file_path, "references",
+                f"Reference file '{rel_path}' has {ref.line_count} lines. "
+                "Consider adding a table of contents."
+            ))
 
     return issues
 
 
-def suggest_mcp_qualified_names(body: str, file_path: str) -> list[ValidationIssue]:
+# Common MCP tool patterns that might be unqualified
+# Look for tool-like references without mcp__ prefix
+UNQUALIFIED_MCP_PATTERNS = TokenPatterns([
+    r'\bchat\s*\(\s*prompt',  # chat(prompt...) without mcp__ prefix
+    r'`chat`\s*tool',
+    r'the\s+chat\s+tool',
+    r'generate_image\s*\(',
+    r'`generate_image`',
+], lowercase=True)
+
+
+def suggest_mcp_qualified_names(
+    tokens: list[MarkdownToken],
+    file_path: str
+) -> list[ValidationIssue]:
     """
     Suggest using qualified names for MCP tools.
 
@@ -857,38 +1377,30 @@ def suggest_mcp_qualified_names(body: str, file_path: str) -> list[ValidationIss
     """
     issues = []
 
-    if not body.strip():
-        return issues
-
-    # Common MCP tool patterns that might be unqualified
-    # Look for tool-like references without mcp__ prefix
-    unqualified_patterns = [
-        r'\bchat\s*\(\s*prompt',  # chat(prompt...) without mcp__ prefix
-        r'`chat`\s*tool',
-        r'the\s+chat\s+tool',
-        r'generate_image\s*\(',
-        r'`generate_image`',
-    ]
-
-    body_lower = body.lower()
-
     # Check if file mentions MCP but uses unqualified tool names
-    mentions_mcp = 'mcp' in body_lower or 'openrouter' in body_lower
+    mentions_mcp = any(
+        'mcp' in t.lower or 'openrouter' in t.lower
+        for t in tokens if t.kind != "link"
+    )
 
     if mentions_mcp:
-        for pattern in unqualified_patterns:
-            if re.search(pattern, body_lower):
-                issues.append(ValidationIssue(
-                    Severity.SUGGESTION, file_path, "body",
-                    "When referencing MCP tools, use qualified names (e.g., 'mcp__openrouter__chat') to avoid ambiguity."
-                ))
-                break
+        line = next(
+            (line for line in UNQUALIFIED_MCP_PATTERNS.first_lines(tokens) if line is not None),
+            None
+        )
+        if line is not None:
+            issues.append(ValidationIssue(
+                Severity.SUGGESTION, file_path, "body",
+                "When referencing MCP tools, use qualified names "
+                "(e.g., 'mcp__openrouter__chat') to avoid ambiguity.",
+                line
+            ))
 
     return issues
 
 
 def suggest_no_deeply_nested_references(
-    skill_path: Path,
+    doc: SkillDocument,
     file_path: str
 ) -> list[ValidationIssue]:
     """
@@ -899,38 +1411,19 @@ def suggest_no_deeply_nested_references(
     - Deeply nested links make navigation confusing
     """
     issues = []
-
-    references_dir = skill_path / "references"
-    if not references_dir.exists():
-        return issues
-
-    link_pattern = r'\[([^\]]*)\]\(([^)]+\.md)\)'
-
-    for ref_file in references_dir.glob("*.md"):
-        try:
-            content = ref_file.read_text()
-
-            for match in re.finditer(link_pattern, content):
-                link_text, link_path = match.groups()
-
-                # Skip external URLs
-                if link_path.startswith(('http://', 'https://')):
-                    continue
-
-                # Check if linking to another reference file
-                if 'references/' in link_path or link_path.endswith('.md'):
-                    # Resolve to check if it's in references/
-                    if not link_path.startswith('/'):
-                        resolved = (ref_file.parent / link_path).resolve()
-                        if references_dir in resolved.parents or resolved.parent == references_dir:
-                            rel_path = ref_file.relative_to(skill_path)
-                            issues.append(ValidationIssue(
-                                Severity.SUGGESTION, file_path, "references",
-                                f"Reference '{rel_path}' links to another reference file. Consider flattening documentation structure."
-                            ))
-                            break
-        except Exception:
-            pass
+    index = doc.reference_index
+
+    for rel_path in index.files:
+        # Check if linking to another Markdown file inside references/
+        if any(
+            target.startswith('references/') and target.endswith('.md')
+            for target in index.graph.get(rel_path, [])
+        ):
+            issues.append(ValidationIssue(
+                Severity.SUGGESTION, file_path, "references",
+                f"Reference '{rel_path}' links to another reference file. "
+                "Consider flattening documentation structure."
+            ))
 
     return issues
 
@@ -967,33 +1460,161 @@ def suggest_argument_hint(
     return issues
 
 
-def validate_plugin_json(plugin_json_path: Path) -> list[ValidationIssue]:
-    """
-    Validate plugin.json schema.
+def _stat_key(path: Path) -> tuple[int, int] | None:
+    """Cheap change detector for cached files: (mtime_ns, size), or None if missing."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
 
-    Required fields: name, description, version, author.name
-    """
-    issues = []
-    rel_path = str(plugin_json_path)
 
-    if not plugin_json_path.exists():
-        issues.append(ValidationIssue(
-            Severity.ERROR, rel_path, "file",
-            "plugin.json file is missing"
-        ))
-        return issues
+@dataclass
+class PluginManifest:
+    """A parsed plugin.json: data is None when the file is missing or invalid."""
+    path: Path
+    data: dict[str, Any] | None = None
+    error: str | None = None
+
+    @classmethod
+    def load(cls, path: Path) -> "PluginManifest":
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return cls(path)
+        except json.JSONDecodeError as e:
+            return cls(path, error=f"Invalid JSON: {e}")
+        except (IOError, UnicodeDecodeError) as e:
+            return cls(path, error=f"Cannot read file: {e}")
+        if not isinstance(data, dict):
+            return cls(path, error="Invalid JSON: top-level value must be an object")
+        return cls(path, data)
 
-    try:
-        with open(plugin_json_path) as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
-        issues.append(ValidationIssue(
-            Severity.ERROR, rel_path, "json",
-            f"Invalid JSON: {e}"
-        ))
-        return issues
+    @property
+    def exists(self) -> bool:
+        return self.data is not None or self.error is not None
 
-    required = ['name', 'description', 'version']
+    @property
+    def version(self) -> Any:
+        return self.data.get('version') if self.data else None
+
+
+@dataclass
+class MarketplaceIndex:
+    """
+    marketplace.json parsed once, with plugin entries keyed by name.
+
+    plugin.json files are parsed on first use and cached alongside, so the
+    plugin-json and version-sync rules share one parse per plugin. Use
+    get_marketplace_index() rather than constructing this directly.
+    """
+    path: Path | None
+    entries: dict[str, dict[str, Any]] = field(default_factory=dict)
+    _manifests: dict[Path, tuple[tuple[int, int] | None, PluginManifest]] = field(
+        default_factory=dict, repr=False
+    )
+
+    @classmethod
+    def load(cls, marketplace_path: Path | None) -> "MarketplaceIndex":
+        index = cls(marketplace_path)
+        if marketplace_path is None:
+            return index
+        try:
+            with open(marketplace_path) as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError, UnicodeDecodeError):
+            return index
+        return cls.from_data(marketplace_path, data)
+
+    @classmethod
+    def from_data(cls, marketplace_path: Path | None, data: Any) -> "MarketplaceIndex":
+        """Index already-parsed marketplace.json data."""
+        index = cls(marketplace_path)
+        plugins = data.get('plugins', []) if isinstance(data, dict) else []
+        for plugin in plugins:
+            # First entry wins, matching the linear scan this replaces
+            if isinstance(plugin, dict) and plugin.get('name') not in index.entries:
+                index.entries[plugin.get('name')] = plugin
+        return index
+
+    def version(self, plugin_name: str | None) -> Any:
+        """Version listed for plugin_name in marketplace.json (None if absent)."""
+        entry = self.entries.get(plugin_name)
+        return entry.get('version') if entry else None
+
+    def plugin_manifest(self, plugin_json_path: Path) -> PluginManifest:
+        """Parsed plugin.json, re-read only when the file changes on disk."""
+        key = _stat_key(plugin_json_path)
+        cached = self._manifests.get(plugin_json_path)
+        if cached is not None and cached[0] == key and key is not None:
+            return cached[1]
+        if key is None:
+            manifest = PluginManifest(plugin_json_path)
+        else:
+            manifest = PluginManifest.load(plugin_json_path)
+        self._manifests[plugin_json_path] = (key, manifest)
+        return manifest
+
+
+# Per-process index cache: marketplace path -> (stat key, index)
+_MARKETPLACE_INDEXES: dict[Path | None, tuple[tuple[int, int] | None, MarketplaceIndex]] = {}
+_MARKETPLACE_LOCK = threading.Lock()
+
+
+def get_marketplace_index(marketplace_path: Path | None) -> MarketplaceIndex:
+    """
+    Return the shared MarketplaceIndex for marketplace_path.
+
+    The index is built once per process and rebuilt only when the file's
+    mtime or size changes, so batch runs parse marketplace.json once per
+    worker while watch mode still sees edits.
+    """
+    key = _stat_key(marketplace_path) if marketplace_path else None
+    with _MARKETPLACE_LOCK:
+        cached = _MARKETPLACE_INDEXES.get(marketplace_path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        index = MarketplaceIndex.load(marketplace_path if key else None)
+        index.path = marketplace_path
+        _MARKETPLACE_INDEXES[marketplace_path] = (key, index)
+        return index
+
+
+def validate_plugin_json(
+    plugin_json_path: Path,
+    index: MarketplaceIndex | None = None
+) -> list[ValidationIssue]:
+    """
+    Validate plugin.json schema.
+
+    Required fields: name, description, version, author.name
+
+    Args:
+        plugin_json_path: Path to the plugin's plugin.json
+        index: Shared index to read the parsed file from (defaults to the
+            process-wide index with no marketplace)
+    """
+    issues = []
+    rel_path = str(plugin_json_path)
+    manifest = (index or get_marketplace_index(None)).plugin_manifest(plugin_json_path)
+
+    if not manifest.exists:
+        issues.append(ValidationIssue(
+            Severity.ERROR, rel_path, "file",
+            "plugin.json file is missing"
+        ))
+        return issues
+
+    if manifest.data is None:
+        issues.append(ValidationIssue(
+            Severity.ERROR, rel_path, "json",
+            manifest.error
+        ))
+        return issues
+
+    data = manifest.data
+    required = ['name', 'description', 'version']
     for field_name in required:
         if field_name not in data:
             issues.append(ValidationIssue(
@@ -1022,39 +1643,37 @@ def validate_plugin_json(plugin_json_path: Path) -> list[ValidationIssue]:
 
 
 def validate_version_sync(
+    frontmatter: dict[str, Any],
     skill_md_path: Path,
     plugin_json_path: Path,
     marketplace_path: Path | None,
-    plugin_name: str
+    plugin_name: str,
+    index: MarketplaceIndex | None = None
 ) -> list[ValidationIssue]:
-    """Validate versions are synchronized across files."""
+    """
+    Validate versions are synchronized across files.
+
+    marketplace.json and plugin.json are looked up in index (by default the
+    shared index for marketplace_path) instead of being parsed per skill.
+    """
     issues = []
     versions: dict[str, str | None] = {}
+    if index is None:
+        index = get_marketplace_index(marketplace_path)
+
+    metadata = frontmatter.get('metadata', {})
+    if isinstance(metadata, dict):
+        version = metadata.get('version')
+        if version is None or isinstance(version, str):
+            versions['SKILL.md'] = version
+        else:
+            issues.append(ValidationIssue(
+                Severity.ERROR, str(skill_md_path), "version",
+                f"'metadata.version' must be a string, got {type(version).__name__}"
+            ))
 
-    if skill_md_path.exists():
-        frontmatter, _, _ = parse_skill_md(skill_md_path)
-        metadata = frontmatter.get('metadata', {})
-        if isinstance(metadata, dict):
-            versions['SKILL.md'] = metadata.get('version')
-
-    if plugin_json_path.exists():
-        try:
-            with open(plugin_json_path) as f:
-                data = json.load(f)
-                versions['plugin.json'] = data.get('version')
-        except (json.JSONDecodeError, IOError):
-            pass
-
-    if marketplace_path and marketplace_path.exists():
-        try:
-            with open(marketplace_path) as f:
-                data = json.load(f)
-                for plugin in data.get('plugins', []):
-                    if plugin.get('name') == plugin_name:
-                        versions['marketplace.json'] = plugin.get('version')
-                        break
-        except (json.JSONDecodeError, IOError):
-            pass
+    versions['plugin.json'] = index.plugin_manifest(plugin_json_path).version
+    versions['marketplace.json'] = index.version(plugin_name)
 
     present_versions = {k: v for k, v in versions.items() if v is not None}
 
@@ -1074,10 +1693,219 @@ def validate_version_sync(
 # Internal Validation Hooks
 # =============================================================================
 
+# Hooks opt into warm execution explicitly with a module-level WARM_HOOK = True
+WARM_HOOK_PATTERN = re.compile(r'^WARM_HOOK\s*=\s*True\b', re.MULTILINE)
+
+
+class HookError(Exception):
+    """A warm hook raised instead of returning issues."""
+
+
+def hook_supports_warm(hook_path: Path) -> bool:
+    """
+    Check whether a hook opts into the in-process protocol.
+
+    Warm hooks set `WARM_HOOK = True` at module level and define
+    `validate(skill_path: Path, suggest: bool)` returning either a list of
+    issue dicts or {"issues": [...]}, the same shape the subprocess protocol
+    prints as JSON. A hook that merely defines validate() still runs as a
+    subprocess. The check is textual so hooks that don't opt in are never
+    imported.
+    """
+    try:
+        return bool(WARM_HOOK_PATTERN.search(hook_path.read_text()))
+    except (OSError, UnicodeDecodeError):
+        return False
+
+
+@contextlib.contextmanager
+def _hook_sys_path(hook_dir: str) -> Iterator[None]:
+    """Put a hook's directory first on sys.path, restoring sys.path afterwards."""
+    saved = list(sys.path)
+    sys.path.insert(0, hook_dir)
+    try:
+        yield
+    finally:
+        sys.path[:] = saved
+
+
+def _hook_worker_main(conn: Any) -> None:
+    """Warm hook worker loop: import each hook once, then call it per request."""
+    modules: dict[tuple[str, int], Any] = {}
+
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, OSError):
+            return
+        if request is None:
+            return
+
+        hook_path, skill_path, suggest = request
+        try:
+            key = (hook_path, os.stat(hook_path).st_mtime_ns)
+            module = modules.get(key)
+            # Only this hook's directory is importable while it runs, so one
+            # skill's helper modules cannot shadow another's
+            with _hook_sys_path(os.path.dirname(hook_path)):
+                if module is None:
+                    spec = importlib.util.spec_from_file_location(
+                        f"_validate_hook_{len(modules)}", hook_path
+                    )
+                    module = importlib.util.module_from_spec(spec)
+                    spec.loader.exec_module(module)
+                    if getattr(module, "WARM_HOOK", False) is not True:
+                        raise HookError("hook does not set WARM_HOOK = True")
+                    modules[key] = module
+
+                data = module.validate(Path(skill_path), suggest)
+            if isinstance(data, dict):
+                data = data.get("issues", [])
+            conn.send(("ok", [dict(issue) for issue in data]))
+        except (Exception, SystemExit) as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+
+
+class _HookWorker:
+    """One persistent warm hook process and its pipe."""
+
+    def __init__(self, ctx: Any):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_hook_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def call(self, request: tuple[str, str, bool], timeout: float) -> tuple[str, Any]:
+        self.conn.send(request)
+        if not self.conn.poll(timeout):
+            raise TimeoutError
+        return self.conn.recv()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def close(self) -> None:
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.kill()
+        else:
+            self.conn.close()
+
+
+class HookPool:
+    """
+    Persistent worker processes for warm validation hooks.
+
+    Workers import each hook module once and call its validate() function for
+    every request, avoiding interpreter startup per skill. A worker that hits
+    the timeout or dies is killed and replaced on the next call. Safe to share
+    between threads; at most `size` hooks run at once.
+
+    Warm hooks share their worker's sys.modules, so helper modules imported
+    from a hook's scripts/ directory should have skill-unique names.
+    """
+
+    def __init__(self, size: int = 1):
+        self.size = max(1, size)
+        self._ctx = multiprocessing.get_context()
+        self._idle: list[_HookWorker] = []
+        self._spawned = 0
+        self._lock = threading.Condition()
+
+    def _acquire(self) -> _HookWorker:
+        with self._lock:
+            while not self._idle and self._spawned >= self.size:
+                self._lock.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._spawned += 1
+        try:
+            return _HookWorker(self._ctx)
+        except Exception:
+            self._release(None)
+            raise
+
+    def _release(self, worker: _HookWorker | None) -> None:
+        with self._lock:
+            if worker is None:
+                self._spawned -= 1
+            else:
+                self._idle.append(worker)
+            self._lock.notify()
+
+    def run(
+        self,
+        hook_path: Path,
+        skill_path: Path,
+        suggest: bool,
+        timeout: float
+    ) -> list[dict[str, Any]]:
+        """
+        Call a warm hook's validate() in a worker.
+
+        Raises:
+            TimeoutError: The hook did not return within timeout seconds
+            HookError: The hook raised or its worker died
+        """
+        worker: _HookWorker | None = self._acquire()
+        try:
+            status, payload = worker.call((str(hook_path), str(skill_path), suggest), timeout)
+        except TimeoutError:
+            worker.kill()
+            worker = None
+            raise
+        except (EOFError, OSError) as e:
+            worker.kill()
+            worker = None
+            raise HookError(f"hook worker exited unexpectedly ({type(e).__name__})")
+        finally:
+            self._release(worker)
+
+        if status != "ok":
+            raise HookError(payload)
+        return payload
+
+    def close(self) -> None:
+        """Stop all idle workers."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+            self._spawned -= len(idle)
+        for worker in idle:
+            worker.close()
+
+    def __enter__(self) -> "HookPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _parse_hook_issues(data: Any, hook_rel: str) -> list[ValidationIssue]:
+    """Convert hook output (subprocess JSON or warm return value) to issues."""
+    try:
+        if isinstance(data, dict):
+            data = data.get("issues", [])
+        return [ValidationIssue.from_dict(issue) for issue in data]
+    except (KeyError, ValueError, TypeError, AttributeError) as e:
+        return [ValidationIssue(
+            Severity.ERROR,
+            hook_rel,
+            "hook",
+            f"Invalid hook output: {e}"
+        )]
+
+
 def run_validation_hook(
     skill_path: Path,
     suggest: bool = False,
-    timeout: int = 30
+    timeout: int = 30,
+    hook_pool: HookPool | None = None
 ) -> list[ValidationIssue]:
     """
     Execute skill's internal validation hook if present.
@@ -1089,6 +1917,8 @@ def run_validation_hook(
         skill_path: Path to the skill directory
         suggest: Whether to include optimization suggestions
         timeout: Maximum execution time in seconds
+        hook_pool: Warm worker pool; hooks setting WARM_HOOK = True run there
+            instead of in a fresh subprocess
 
     Returns:
         List of ValidationIssues from the hook (empty if no hook exists)
@@ -1098,55 +1928,168 @@ def run_validation_hook(
     if not hook_path.exists():
         return []
 
-    # Build command
-    cmd = [sys.executable, str(hook_path), str(skill_path)]
-    if suggest:
-        cmd.append("--suggest")
+    hook_rel = str(hook_path.relative_to(skill_path))
+
+    if hook_pool is not None and hook_supports_warm(hook_path):
+        try:
+            data = hook_pool.run(hook_path, skill_path, suggest, timeout)
+        except TimeoutError:
+            return [_hook_timeout_issue(hook_rel, timeout)]
+        except HookError as e:
+            return [ValidationIssue(
+                Severity.ERROR,
+                hook_rel,
+                "hook",
+                f"Hook failed: {e}"
+            )]
+        return _parse_hook_issues(data, hook_rel)
 
-    # Execute with timeout
     try:
         result = subprocess.run(
-            cmd,
+            _hook_command(hook_path, skill_path, suggest),
             capture_output=True,
             text=True,
             timeout=timeout
         )
     except subprocess.TimeoutExpired:
-        return [ValidationIssue(
-            Severity.WARNING,
-            str(hook_path.relative_to(skill_path)),
-            "hook",
-            f"Validation hook timed out after {timeout}s"
-        )]
+        return [_hook_timeout_issue(hook_rel, timeout)]
+
+    return _hook_output_issues(result.returncode, result.stdout, result.stderr, hook_rel)
+
+
+def _hook_command(hook_path: Path, skill_path: Path, suggest: bool) -> list[str]:
+    """Build the subprocess command line for a hook."""
+    cmd = [sys.executable, str(hook_path), str(skill_path)]
+    if suggest:
+        cmd.append("--suggest")
+    return cmd
 
-    if result.returncode != 0:
-        stderr_msg = result.stderr.strip() if result.stderr else "no error message"
+
+def _hook_timeout_issue(hook_rel: str, timeout: float) -> ValidationIssue:
+    return ValidationIssue(
+        Severity.WARNING,
+        hook_rel,
+        "hook",
+        f"Validation hook timed out after {timeout}s"
+    )
+
+
+def _hook_output_issues(
+    returncode: int,
+    stdout: str,
+    stderr: str,
+    hook_rel: str
+) -> list[ValidationIssue]:
+    """Interpret a finished hook subprocess's exit code and JSON output."""
+    if returncode != 0:
+        stderr_msg = stderr.strip() if stderr else "no error message"
         return [ValidationIssue(
             Severity.ERROR,
-            str(hook_path.relative_to(skill_path)),
+            hook_rel,
             "hook",
-            f"Hook failed (exit {result.returncode}): {stderr_msg}"
+            f"Hook failed (exit {returncode}): {stderr_msg}"
         )]
 
     # Parse JSON output
     try:
-        data = json.loads(result.stdout)
-        return [
-            ValidationIssue(
-                Severity[issue["severity"]],
-                issue["file_path"],
-                issue["field"],
-                issue["message"]
-            )
-            for issue in data.get("issues", [])
-        ]
-    except (json.JSONDecodeError, KeyError, ValueError) as e:
+        data = json.loads(stdout)
+    except json.JSONDecodeError as e:
         return [ValidationIssue(
             Severity.ERROR,
-            str(hook_path.relative_to(skill_path)),
+            hook_rel,
             "hook",
             f"Invalid hook output: {e}"
         )]
+    return _parse_hook_issues(data, hook_rel)
+
+
+async def run_validation_hook_async(
+    skill_path: Path,
+    suggest: bool = False,
+    timeout: int = 30,
+    hook_pool: HookPool | None = None,
+    semaphore: asyncio.Semaphore | None = None,
+    profile: "RuleProfile | None" = None
+) -> list[ValidationIssue]:
+    """
+    Asyncio counterpart of run_validation_hook().
+
+    Subprocess hooks run via asyncio.create_subprocess_exec and are killed on
+    timeout or cancellation. Warm hooks are dispatched to hook_pool from a
+    thread. The semaphore, if given, bounds how many hooks run at once.
+    """
+    hook_path = skill_path / "scripts" / "validate_hook.py"
+
+    if not hook_path.exists():
+        return []
+
+    async with semaphore or contextlib.nullcontext():
+        start = time.perf_counter()
+        try:
+            return await _run_hook_process_async(hook_path, skill_path, suggest, timeout, hook_pool)
+        finally:
+            if profile is not None:
+                profile.record("hook", time.perf_counter() - start)
+
+
+async def _run_hook_process_async(
+    hook_path: Path,
+    skill_path: Path,
+    suggest: bool,
+    timeout: int,
+    hook_pool: HookPool | None
+) -> list[ValidationIssue]:
+    hook_rel = str(hook_path.relative_to(skill_path))
+
+    if hook_pool is not None and hook_supports_warm(hook_path):
+        return await asyncio.to_thread(
+            run_validation_hook, skill_path, suggest, timeout, hook_pool
+        )
+
+    proc = await asyncio.create_subprocess_exec(
+        *_hook_command(hook_path, skill_path, suggest),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return [_hook_timeout_issue(hook_rel, timeout)]
+    except asyncio.CancelledError:
+        proc.kill()
+        await proc.wait()
+        raise
+
+    return _hook_output_issues(
+        proc.returncode,
+        stdout.decode(errors="replace"),
+        stderr.decode(errors="replace"),
+        hook_rel
+    )
+
+
+async def run_validation_hooks(
+    skill_paths: list[Path],
+    suggest: bool = False,
+    timeout: int = 30,
+    concurrency: int = 8,
+    hook_pool: HookPool | None = None,
+    profiles: "list[RuleProfile | None] | None" = None
+) -> list[list[ValidationIssue]]:
+    """
+    Run many skills' hooks concurrently, at most `concurrency` at a time.
+
+    Returns:
+        One issue list per skill, in the same order as skill_paths
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    profiles = profiles or [None] * len(skill_paths)
+    return await asyncio.gather(*(
+        run_validation_hook_async(path, suggest, timeout, hook_pool, semaphore, profile)
+        for path, profile in zip(skill_paths, profiles)
+    ))
 
 
 # =============================================================================
@@ -1190,23 +2133,268 @@ def detect_skill_type(skill_path: Path) -> tuple[str, Path | None, Path | None]:
     return "unknown", None, None
 
 
+# =============================================================================
+# Rule Registry
+# =============================================================================
+
+@dataclass
+class RuleContext:
+    """Everything a rule may read, assembled once per skill."""
+    skill_path: Path
+    rel_path: str
+    doc: SkillDocument
+    suggest: bool = False
+    skill_md_path: Path | None = None
+    plugin_json_path: Path | None = None
+    marketplace_path: Path | None = None
+    hook_pool: HookPool | None = None
+    files: DirectorySnapshot = field(default_factory=DirectorySnapshot)
+    budget: TokenBudget = DEFAULT_TOKEN_BUDGET
+    disabled: frozenset[str] = frozenset()
+
+    @property
+    def frontmatter(self) -> dict[str, Any]:
+        return self.doc.frontmatter
+
+    def text_field(self, key: str) -> str | None:
+        """A frontmatter field if it is a string; the name/description rules flag other types."""
+        value = self.frontmatter.get(key)
+        return value if isinstance(value, str) else None
+
+    @property
+    def plugin_name(self) -> str | None:
+        return self.plugin_json_path.parent.parent.name if self.plugin_json_path else None
+
+    @property
+    def marketplace(self) -> MarketplaceIndex:
+        return get_marketplace_index(self.marketplace_path)
+
+
+@dataclass(frozen=True)
+class Rule:
+    """
+    A registered validator or suggester.
+
+    inputs names the parts of a skill the rule reads, so callers can tell
+    which rules a change affects:
+    - "frontmatter": SKILL.md frontmatter
+    - "body": SKILL.md body (and its character count)
+    - "references": references/ file contents
+    - "skill_dir": which files exist in the skill directory
+    - "plugin_json": the plugin's .claude-plugin/plugin.json
+    - "marketplace": the repo's .claude-plugin/marketplace.json
+    - "hook": scripts/validate_hook.py
+
+    severity is the most severe level the rule can report. SUGGESTION rules
+    only run with --suggest; plugin rules only run for plugin-bundled skills.
+    """
+    name: str
+    severity: Severity
+    inputs: tuple[str, ...]
+    check: Callable[[RuleContext], list[ValidationIssue]]
+    plugin_only: bool = False
+
+    @property
+    def is_suggestion(self) -> bool:
+        return self.severity == Severity.SUGGESTION
+
+
+RULES: list[Rule] = [
+    # Frontmatter
+    Rule("name", Severity.ERROR, ("frontmatter", "skill_dir"),
+         lambda ctx: validate_name(
+             ctx.frontmatter.get('name'), ctx.skill_path.name, ctx.rel_path
+         )),
+    Rule("description", Severity.ERROR, ("frontmatter",),
+         lambda ctx: validate_description(ctx.frontmatter.get('description'), ctx.rel_path)),
+    Rule("optional-fields", Severity.ERROR, ("frontmatter",),
+         lambda ctx: validate_optional_fields(ctx.frontmatter, ctx.rel_path)),
+    Rule("xml-tags", Severity.ERROR, ("frontmatter",),
+         lambda ctx: validate_no_xml_tags(
+             ctx.text_field('name'), ctx.text_field('description'), ctx.rel_path
+         )),
+    Rule("vague-name", Severity.WARNING, ("frontmatter",),
+         lambda ctx: validate_vague_names(ctx.text_field('name'), ctx.rel_path)),
+    # Body
+    Rule("body-length", Severity.ERROR, ("body",),
+         lambda ctx: validate_body(ctx.doc.body_line_count, ctx.rel_path)),
+    Rule("script-paths", Severity.WARNING, ("body",),
+         lambda ctx: validate_script_paths_use_skill_dir(ctx.doc.tokens, ctx.rel_path)),
+    Rule("windows-paths", Severity.WARNING, ("body",),
+         lambda ctx: validate_no_windows_paths(ctx.doc.tokens, ctx.rel_path)),
+    Rule("referenced-files", Severity.WARNING, ("body", "skill_dir"),
+         lambda ctx: validate_referenced_files_exist(
+             ctx.skill_path, ctx.doc.tokens, ctx.rel_path, ctx.files
+         )),
+    Rule("character-budget", Severity.ERROR, ("frontmatter", "body"),
+         lambda ctx: validate_character_budget(ctx.doc.char_count, ctx.rel_path)),
+    Rule("token-budget", Severity.ERROR, ("frontmatter", "body", "references"),
+         lambda ctx: validate_token_budget(
+             ctx.doc.token_counts, ctx.rel_path, ctx.budget,
+             None if "character-budget" in ctx.disabled else ctx.doc.char_count
+         )),
+    Rule("references-usage", Severity.WARNING, ("frontmatter", "body", "references"),
+         lambda ctx: validate_references_usage(ctx.doc, ctx.rel_path)),
+    # Plugin-bundled skills
+    Rule("plugin-json", Severity.ERROR, ("plugin_json",),
+         lambda ctx: validate_plugin_json(ctx.plugin_json_path, ctx.marketplace),
+         plugin_only=True),
+    Rule("version-sync", Severity.ERROR, ("frontmatter", "plugin_json", "marketplace"),
+         lambda ctx: validate_version_sync(
+             ctx.frontmatter, ctx.skill_md_path, ctx.plugin_json_path,
+             ctx.marketplace_path, ctx.plugin_name, ctx.marketplace
+         ), plugin_only=True),
+    # Skill-defined hook
+    Rule("hook", Severity.ERROR, ("hook", "skill_dir"),
+         lambda ctx: run_validation_hook(ctx.skill_path, ctx.suggest, hook_pool=ctx.hook_pool)),
+    # Optimization suggestions
+    Rule("description-style", Severity.SUGGESTION, ("frontmatter",),
+         lambda ctx: suggest_description_optimization(
+             ctx.text_field('description'), ctx.rel_path
+         )),
+    Rule("instructions", Severity.SUGGESTION, ("body",),
+         lambda ctx: suggest_instruction_optimization(
+             ctx.doc.tokens, ctx.doc.body_line_count, ctx.rel_path
+         )),
+    Rule("gerund-name", Severity.SUGGESTION, ("frontmatter",),
+         lambda ctx: suggest_gerund_naming(ctx.text_field('name'), ctx.rel_path)),
+    Rule("time-sensitive", Severity.SUGGESTION, ("body",),
+         lambda ctx: suggest_time_sensitive_language(ctx.doc.tokens, ctx.rel_path)),
+    Rule("reference-toc", Severity.SUGGESTION, ("references",),
+         lambda ctx: suggest_toc_for_long_references(ctx.doc, ctx.rel_path)),
+    Rule("mcp-names", Severity.SUGGESTION, ("body",),
+         lambda ctx: suggest_mcp_qualified_names(ctx.doc.tokens, ctx.rel_path)),
+    Rule("nested-references", Severity.SUGGESTION, ("references",),
+         lambda ctx: suggest_no_deeply_nested_references(ctx.doc, ctx.rel_path)),
+    Rule("argument-hint", Severity.SUGGESTION, ("frontmatter",),
+         lambda ctx: suggest_argument_hint(ctx.frontmatter, ctx.rel_path)),
+]
+
+RULES_BY_NAME: dict[str, Rule] = {rule.name: rule for rule in RULES}
+
+
+def select_rules(
+    suggest: bool = False,
+    plugin: bool = True,
+    disabled: frozenset[str] = frozenset(),
+    inputs: set[str] | None = None
+) -> list[Rule]:
+    """
+    Return the registered rules that apply, in registry order.
+
+    Args:
+        suggest: Include SUGGESTION rules
+        plugin: Include plugin-only rules
+        disabled: Rule names to skip
+        inputs: If given, only rules reading at least one of these inputs
+    """
+    return [
+        rule for rule in RULES
+        if rule.name not in disabled
+        and (suggest or not rule.is_suggestion)
+        and (plugin or not rule.plugin_only)
+        and (inputs is None or inputs.intersection(rule.inputs))
+    ]
+
+
+@dataclass
+class RuleProfile:
+    """Wall time and call counts per rule, mergeable across skills and processes."""
+    calls: dict[str, int] = field(default_factory=dict)
+    seconds: dict[str, float] = field(default_factory=dict)
+
+    def record(self, name: str, elapsed: float) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
+        self.seconds[name] = self.seconds.get(name, 0.0) + elapsed
+
+    def merge(self, other: "RuleProfile") -> None:
+        for name, count in other.calls.items():
+            self.calls[name] = self.calls.get(name, 0) + count
+            self.seconds[name] = self.seconds.get(name, 0.0) + other.seconds.get(name, 0.0)
+
+    def format(self) -> str:
+        """Render a table sorted by total time, slowest first."""
+        total = sum(self.seconds.values()) or 1.0
+        lines = [f"{'Rule':<22} {'Calls':>7} {'Total ms':>10} {'Mean ms':>9} {'Share':>6}"]
+        for name in sorted(self.seconds, key=self.seconds.get, reverse=True):
+            seconds = self.seconds[name]
+            calls = self.calls[name]
+            lines.append(
+                f"{name:<22} {calls:>7} {seconds * 1000:>10.2f} "
+                f"{seconds * 1000 / calls:>9.3f} {seconds / total:>6.1%}"
+            )
+        return '\n'.join(lines)
+
+
+def run_rule(
+    rule: Rule,
+    ctx: RuleContext,
+    profile: RuleProfile | None = None
+) -> list[ValidationIssue]:
+    """Run one rule, attributing its issues to it and recording wall time when profiling."""
+    start = time.perf_counter()
+    issues = rule.check(ctx)
+    if profile is not None:
+        profile.record(rule.name, time.perf_counter() - start)
+    if "frontmatter" in rule.inputs:
+        _locate_frontmatter_issues(issues, ctx)
+    return _attribute_issues(issues, rule.name)
+
+
+def _locate_frontmatter_issues(issues: list[ValidationIssue], ctx: RuleContext) -> None:
+    """Point SKILL.md issues without a line at the frontmatter key they name."""
+    skill_md = {ctx.rel_path, str(ctx.skill_md_path)}
+    for issue in issues:
+        if issue.line is None and issue.file_path in skill_md:
+            issue.line = ctx.doc.key_line(issue.field)
+
+
+def _attribute_issues(issues: list[ValidationIssue], rule_name: str) -> list[ValidationIssue]:
+    for issue in issues:
+        if issue.rule is None:
+            issue.rule = rule_name
+    return issues
+
+
 # =============================================================================
 # Main Validation Logic
 # =============================================================================
 
-def validate_skill(skill_path: Path, suggest: bool = False) -> ValidationResult:
-    """Validate a single skill at the given path."""
+def validate_skill(
+    skill_path: Path,
+    suggest: bool = False,
+    hook_pool: HookPool | None = None,
+    run_hooks: bool = True,
+    disabled: frozenset[str] = frozenset(),
+    profile: bool = False,
+    inputs: set[str] | None = None,
+    doc: SkillDocument | None = None,
+    budget: TokenBudget = DEFAULT_TOKEN_BUDGET
+) -> ValidationResult:
+    """
+    Validate a single skill at the given path.
+
+    Runs every applicable rule in RULES. With run_hooks=False the skill's
+    validation hook is not executed and result.hooks_deferred tells the
+    caller whether it still needs to run. With profile=True, per-rule
+    timings are attached as result.profile. With inputs, only rules reading
+    one of those inputs run (see select_rules()). With doc, that document
+    is validated instead of reading SKILL.md, e.g. an unsaved editor buffer.
+    budget sets the token-budget thresholds; the estimated counts it
+    checked are attached as result.token_counts.
+    """
     skill_path = skill_path.resolve()
     skill_md_path = skill_path / "SKILL.md"
     skill_name = skill_path.name
 
     result = ValidationResult(
         skill_path=skill_path,
-        skill_name=skill_name
+        skill_name=skill_name,
+        profile=RuleProfile() if profile else None
     )
 
     # Check SKILL.md exists
-    if not skill_md_path.exists():
+    if doc is None and not skill_md_path.exists():
         result.issues.append(ValidationIssue(
             Severity.ERROR, str(skill_path), "SKILL.md",
             "SKILL.md file not found in skill directory"
@@ -1215,123 +2403,491 @@ def validate_skill(skill_path: Path, suggest: bool = False) -> ValidationResult:
 
     rel_path = f"{skill_name}/SKILL.md"
 
-    # Parse SKILL.md
+    # Read SKILL.md and references/ once; every rule works from this
+    start = time.perf_counter()
     try:
-        frontmatter, body, body_line_count = parse_skill_md(skill_md_path)
+        doc = doc or load_skill_document(skill_path)
     except Exception as e:
         result.issues.append(ValidationIssue(
             Severity.ERROR, rel_path, "parse",
             f"Failed to parse SKILL.md: {e}"
         ))
         return result
+    if result.profile is not None:
+        # Charge lexing to loading rather than the first rule that needs it
+        doc.tokens
+        doc.reference_index
+        result.profile.record("(load)", time.perf_counter() - start)
 
-    # Validate frontmatter
-    result.issues.extend(validate_name(
-        frontmatter.get('name'),
-        skill_name,
-        rel_path
-    ))
+    # Detect skill type to locate plugin-specific files
+    skill_type, plugin_json_path, marketplace_path = detect_skill_type(skill_path)
+    if skill_type != "plugin":
+        plugin_json_path = marketplace_path = None
 
-    result.issues.extend(validate_description(
-        frontmatter.get('description'),
-        rel_path
-    ))
+    ctx = RuleContext(
+        skill_path=skill_path,
+        rel_path=rel_path,
+        doc=doc,
+        suggest=suggest,
+        skill_md_path=skill_md_path,
+        plugin_json_path=plugin_json_path,
+        marketplace_path=marketplace_path,
+        hook_pool=hook_pool,
+        budget=budget,
+        disabled=disabled,
+    )
 
-    result.issues.extend(validate_optional_fields(frontmatter, rel_path))
+    for rule in select_rules(suggest, plugin_json_path is not None, disabled, inputs):
+        if rule.name == "hook" and not run_hooks:
+            result.hooks_deferred = (skill_path / "scripts" / "validate_hook.py").exists()
+            result.hook_position = len(result.issues)
+            continue
+        result.issues.extend(run_rule(rule, ctx, result.profile))
+        if rule.name == "token-budget":
+            result.token_counts = dict(doc.token_counts)
 
-    # Validate no XML tags in name/description
-    result.issues.extend(validate_no_xml_tags(
-        frontmatter.get('name'),
-        frontmatter.get('description'),
-        rel_path
-    ))
+    return result
 
-    # Validate vague names (WARNING level)
-    result.issues.extend(validate_vague_names(
-        frontmatter.get('name'),
-        rel_path
-    ))
 
-    # Validate body
-    result.issues.extend(validate_body(body_line_count, rel_path))
+# =============================================================================
+# Incremental Validation Cache
+# =============================================================================
 
-    # Validate script paths use {SKILL_DIR} (WARNING level)
-    result.issues.extend(validate_script_paths_use_skill_dir(body, rel_path))
+DEFAULT_CACHE_DIR = Path(".cache") / "validate_skill"
 
-    # Validate no Windows-style paths (WARNING level)
-    result.issues.extend(validate_no_windows_paths(body, rel_path))
 
-    # Validate referenced files exist (WARNING level)
-    result.issues.extend(validate_referenced_files_exist(skill_path, body, rel_path))
+def _external_link_paths(skill_path: Path, skill_md_text: str) -> list[Path]:
+    """Local link targets in SKILL.md that resolve outside the skill directory."""
+    paths = []
+    for token in lex_markdown(skill_md_text):
+        if token.kind != "link" or token.info.startswith(
+                ('http://', 'https://', '#', 'mailto:', '/')):
+            continue
+        path = Path(os.path.normpath(skill_path / token.info))
+        if path != skill_path and skill_path not in path.parents:
+            paths.append(path)
+    return paths
 
-    # Validate character budget
-    result.issues.extend(validate_character_budget(skill_md_path, rel_path))
 
-    # Validate references usage for large skills
-    try:
-        char_count = len(skill_md_path.read_text())
-    except Exception:
-        char_count = 0
-    result.issues.extend(validate_references_usage(
-        skill_path, body, body_line_count, char_count, rel_path
-    ))
+def compute_skill_hash(
+    skill_path: Path,
+    suggest: bool = False,
+    run_hooks: bool = True,
+    disabled: frozenset[str] = frozenset(),
+    budget: TokenBudget = DEFAULT_TOKEN_BUDGET
+) -> str:
+    """
+    Hash everything that can influence a skill's validation result.
 
-    # Detect skill type and validate plugin-specific files
-    skill_type, plugin_json_path, marketplace_path = detect_skill_type(skill_path)
+    Covers every file in the skill directory (including scripts/validate_hook.py),
+    whether each SKILL.md link target outside the directory exists, the
+    plugin's plugin.json and the repo's marketplace.json, the validator
+    version, the suggest/run_hooks flags, the disabled rules and the token budget.
+    """
+    skill_path = skill_path.resolve()
+    digest = hashlib.sha256()
+    digest.update(
+        f"v{VALIDATOR_VERSION}\0suggest={suggest}\0hooks={run_hooks}\0"
+        f"disabled={','.join(sorted(disabled))}\0{budget}\0{skill_path}\0".encode()
+    )
 
-    if skill_type == "plugin" and plugin_json_path:
-        result.issues.extend(validate_plugin_json(plugin_json_path))
+    files = sorted(
+        p for p in skill_path.rglob("*")
+        if p.is_file() and "__pycache__" not in p.parts
+    )
+    _, plugin_json_path, marketplace_path = detect_skill_type(skill_path)
+    for extra in (plugin_json_path, marketplace_path):
+        if extra and extra.is_file():
+            files.append(extra)
+
+    skill_md = skill_path / "SKILL.md"
+    skill_md_text = ""
+    for file in files:
+        digest.update(str(file).encode())
+        digest.update(b"\0")
+        try:
+            content = file.read_bytes()
+        except OSError:
+            digest.update(b"<unreadable>")
+        else:
+            digest.update(content)
+            if file == skill_md:
+                skill_md_text = content.decode("utf-8", errors="replace")
+        digest.update(b"\0")
 
-        plugin_name = plugin_json_path.parent.parent.name
-        result.issues.extend(validate_version_sync(
-            skill_md_path,
-            plugin_json_path,
-            marketplace_path,
-            plugin_name
-        ))
+    # The referenced-files rule checks these, but they live outside the skill
+    for path in _external_link_paths(skill_path, skill_md_text):
+        digest.update(f"{path}\0{path.exists()}\0".encode())
 
-    # Run internal validation hook if present
-    result.issues.extend(run_validation_hook(skill_path, suggest))
+    return digest.hexdigest()
 
-    # Add optimization suggestions if requested
-    if suggest:
-        result.issues.extend(suggest_description_optimization(
-            frontmatter.get('description'),
-            rel_path
-        ))
-        result.issues.extend(suggest_instruction_optimization(
-            body,
-            body_line_count,
-            rel_path
-        ))
-        result.issues.extend(suggest_gerund_naming(
-            frontmatter.get('name'),
-            rel_path
-        ))
-        result.issues.extend(suggest_time_sensitive_language(
-            body,
-            rel_path
-        ))
-        result.issues.extend(suggest_toc_for_long_references(
-            skill_path,
-            rel_path
-        ))
-        result.issues.extend(suggest_mcp_qualified_names(
-            body,
-            rel_path
-        ))
-        result.issues.extend(suggest_no_deeply_nested_references(
-            skill_path,
-            rel_path
-        ))
-        result.issues.extend(suggest_argument_hint(
-            frontmatter,
-            rel_path
-        ))
 
+def validate_skill_cached(
+    skill_path: Path,
+    suggest: bool = False,
+    cache_dir: Path = DEFAULT_CACHE_DIR,
+    hook_pool: HookPool | None = None,
+    run_hooks: bool = True,
+    disabled: frozenset[str] = frozenset(),
+    budget: TokenBudget = DEFAULT_TOKEN_BUDGET
+) -> ValidationResult:
+    """
+    Validate a skill, reusing the stored result if its content hash is unchanged.
+
+    Cache entries live at {cache_dir}/{hash}.json. Unreadable or corrupt
+    entries are treated as misses and rewritten. Only the built-in
+    validators' output is cached: hooks can depend on state outside the
+    skill, so with run_hooks they run on every call, and with
+    run_hooks=False they are left deferred.
+    """
+    skill_path = skill_path.resolve()
+    cache_key = compute_skill_hash(skill_path, suggest, False, disabled, budget)
+    cache_file = Path(cache_dir) / f"{cache_key}.json"
+
+    try:
+        data = json.loads(cache_file.read_text())
+        result = ValidationResult(
+            skill_path=skill_path,
+            skill_name=skill_path.name,
+            issues=[ValidationIssue.from_dict(issue) for issue in data["issues"]],
+            hooks_deferred=data.get("hooks_deferred", False),
+            hook_position=data.get("hook_position", 0),
+            token_counts=data.get("token_counts", {})
+        )
+    except (OSError, json.JSONDecodeError, KeyError, ValueError):
+        result = validate_skill(
+            skill_path, suggest=suggest, run_hooks=False, disabled=disabled, budget=budget
+        )
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp_file.write_text(json.dumps({
+                "issues": [i.to_dict() for i in result.issues],
+                "hooks_deferred": result.hooks_deferred,
+                "hook_position": result.hook_position,
+                "token_counts": result.token_counts,
+            }))
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass  # Caching is best-effort
+
+    if run_hooks and result.hooks_deferred:
+        position = result.hook_position
+        result.issues[position:position] = _attribute_issues(
+            run_validation_hook(skill_path, suggest, hook_pool=hook_pool), "hook"
+        )
+        result.hooks_deferred = False
     return result
 
 
+# =============================================================================
+# Batch Validation
+# =============================================================================
+
+def discover_skills(root: Path) -> list[Path]:
+    """
+    Find every skill directory under a repository root.
+
+    Looks for plugin-bundled skills (plugins/*/skills/*/SKILL.md) and
+    project-level skills (.claude/skills/*/SKILL.md).
+
+    Returns:
+        Sorted list of skill directory paths
+    """
+    root = Path(root).resolve()
+    skill_mds = list(root.glob("plugins/*/skills/*/SKILL.md"))
+    skill_mds.extend(root.glob(".claude/skills/*/SKILL.md"))
+    return sorted(skill_md.parent for skill_md in skill_mds)
+
+
+MARKETPLACE_REL = ".claude-plugin/marketplace.json"
+
+
+class GitError(Exception):
+    """A git command needed for --changed-since failed."""
+
+
+def _git(root: Path, *args: str) -> subprocess.CompletedProcess:
+    try:
+        return subprocess.run(["git", "-C", str(root), *args], capture_output=True, check=False)
+    except OSError as e:
+        raise GitError(f"Cannot run git: {e}") from e
+
+
+def git_changed_paths(root: Path, ref: str) -> list[str]:
+    """
+    Files that differ between ref and the working tree, relative to root.
+
+    Runs a single `git diff --name-only`. --relative limits the output to
+    root's subtree, and --no-renames lists a rename as its old and new path
+    so both sides map to skills. Untracked files are not included.
+    """
+    if ref.startswith('-'):
+        raise GitError(f"Invalid ref: {ref}")
+    proc = _git(root, "diff", "--name-only", "-z", "--no-renames", "--relative", ref, "--")
+    if proc.returncode != 0:
+        stderr = proc.stderr.decode(errors="replace").strip()
+        raise GitError(stderr or f"git diff exited with status {proc.returncode}")
+    return [path for path in os.fsdecode(proc.stdout).split('\0') if path]
+
+
+def changed_marketplace_plugins(root: Path, ref: str) -> set[str] | None:
+    """
+    Names of plugins whose marketplace.json entry differs from ref.
+
+    Returns:
+        Plugin names, or None if the file at ref cannot be compared (every
+        plugin skill should then be revalidated)
+    """
+    proc = _git(root, "show", f"{ref}:./{MARKETPLACE_REL}")
+    if proc.returncode != 0:
+        # Not present at ref: every entry is new
+        old = MarketplaceIndex(None)
+    else:
+        try:
+            old = MarketplaceIndex.from_data(None, json.loads(proc.stdout))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return None
+    new = MarketplaceIndex.load(root / MARKETPLACE_REL)
+    names = old.entries.keys() | new.entries.keys()
+    return {
+        name for name in names
+        if isinstance(name, str) and old.entries.get(name) != new.entries.get(name)
+    }
+
+
+def skills_for_paths(
+    root: Path,
+    paths: list[str],
+    marketplace_plugins: Callable[[], set[str] | None] = lambda: None
+) -> list[Path]:
+    """
+    Map changed files (relative to root) to the skills they affect.
+
+    A file inside a skill directory affects that skill, a plugin.json
+    affects every skill in its plugin, and marketplace.json affects the
+    skills of the plugins marketplace_plugins() names (all plugin skills if
+    it returns None). It is only called when marketplace.json changed.
+    Skills whose SKILL.md no longer exists are dropped.
+
+    Returns:
+        Sorted list of skill directory paths, as discover_skills() returns
+    """
+    root = Path(root).resolve()
+    candidates: set[Path] = set()
+    plugins: set[str] = set()
+    for path in paths:
+        parts = path.split('/')
+        if path == MARKETPLACE_REL:
+            names = marketplace_plugins()
+            # '*' globs every plugin when the entries could not be compared
+            plugins.update(['*'] if names is None else names)
+        elif len(parts) >= 4 and parts[0] == 'plugins' and parts[2] == 'skills':
+            candidates.add(root.joinpath(*parts[:4]))
+        elif parts[0] == 'plugins' and parts[2:] == ['.claude-plugin', 'plugin.json']:
+            plugins.add(parts[1])
+        elif len(parts) >= 3 and parts[:2] == ['.claude', 'skills']:
+            candidates.add(root.joinpath(*parts[:3]))
+    for plugin in plugins:
+        if plugin == '*' or (plugin and not glob.has_magic(plugin) and '/' not in plugin):
+            skill_mds = root.glob(f"plugins/{plugin}/skills/*/SKILL.md")
+            candidates.update(skill_md.parent for skill_md in skill_mds)
+    return sorted(skill for skill in candidates if (skill / "SKILL.md").is_file())
+
+
+def changed_skills(root: Path, ref: str) -> list[Path]:
+    """
+    Skills under root affected by changes since ref (see skills_for_paths()).
+
+    One git diff lists the changed files; marketplace.json is read back
+    from ref only when it is among them, to revalidate just the plugins
+    whose entries changed.
+
+    Raises:
+        GitError: If git is unavailable or ref cannot be diffed
+    """
+    root = Path(root).resolve()
+    return skills_for_paths(
+        root, git_changed_paths(root, ref), lambda: changed_marketplace_plugins(root, ref)
+    )
+
+
+def _validate_skill_worker(
+    skill_path: Path,
+    suggest: bool = False,
+    cache_dir: Path | None = None,
+    disabled: frozenset[str] = frozenset(),
+    profile: bool = False,
+    budget: TokenBudget = DEFAULT_TOKEN_BUDGET
+) -> ValidationResult:
+    """Process pool entry point (must be a picklable top-level function)."""
+    if cache_dir is not None and not profile:
+        return validate_skill_cached(
+            skill_path, suggest=suggest, cache_dir=cache_dir, run_hooks=False, disabled=disabled,
+            budget=budget
+        )
+    return validate_skill(
+        skill_path, suggest=suggest, run_hooks=False, disabled=disabled, profile=profile,
+        budget=budget
+    )
+
+
+def iter_validate_skills(
+    skill_paths: list[Path],
+    suggest: bool = False,
+    jobs: int | None = None,
+    cache_dir: Path | None = None,
+    warm_hooks: bool = False,
+    hook_jobs: int | None = None,
+    disabled: frozenset[str] = frozenset(),
+    profile: bool = False,
+    budget: TokenBudget = DEFAULT_TOKEN_BUDGET
+) -> Iterator[tuple[int, ValidationResult]]:
+    """
+    Validate several skills, yielding each result as soon as it is complete.
+
+    Built-in validators run in a process pool (or in-process when jobs is 1).
+    A skill with a validation hook is handed to an asyncio hook runner on a
+    background thread as soon as its built-in checks finish, so hooks overlap
+    with the remaining static validation. Arguments match validate_skills().
+
+    Yields:
+        (index into skill_paths, ValidationResult) in completion order
+    """
+    skill_paths = list(skill_paths)
+    if not skill_paths:
+        return
+    jobs = jobs or os.cpu_count() or 1
+    hook_jobs = hook_jobs or jobs
+    jobs = min(jobs, len(skill_paths))
+
+    worker = functools.partial(
+        _validate_skill_worker,
+        suggest=suggest,
+        cache_dir=cache_dir,
+        disabled=disabled,
+        profile=profile,
+        budget=budget
+    )
+
+    hook_pool = HookPool(hook_jobs) if warm_hooks else None
+    hook_loop: asyncio.AbstractEventLoop | None = None
+    hook_thread: threading.Thread | None = None
+    hook_semaphore: asyncio.Semaphore | None = None
+    hook_futures: dict[concurrent.futures.Future, tuple[int, ValidationResult]] = {}
+
+    def defer_hook(index: int, result: ValidationResult) -> None:
+        nonlocal hook_loop, hook_thread, hook_semaphore
+        if hook_loop is None:
+            hook_loop = asyncio.new_event_loop()
+            hook_thread = threading.Thread(target=hook_loop.run_forever, daemon=True)
+            hook_thread.start()
+            hook_semaphore = asyncio.Semaphore(hook_jobs)
+        future = asyncio.run_coroutine_threadsafe(
+            run_validation_hook_async(
+                result.skill_path, suggest, hook_pool=hook_pool,
+                semaphore=hook_semaphore, profile=result.profile
+            ),
+            hook_loop
+        )
+        hook_futures[future] = (index, result)
+
+    def finish_hook(future: concurrent.futures.Future) -> tuple[int, ValidationResult]:
+        index, result = hook_futures.pop(future)
+        position = result.hook_position
+        result.issues[position:position] = _attribute_issues(future.result(), "hook")
+        result.hooks_deferred = False
+        return index, result
+
+    def finished_hooks() -> list[concurrent.futures.Future]:
+        return [future for future in hook_futures if future.done()]
+
+    try:
+        if jobs <= 1:
+            for index, path in enumerate(skill_paths):
+                result = worker(path)
+                if result.hooks_deferred:
+                    defer_hook(index, result)
+                else:
+                    yield index, result
+                for future in finished_hooks():
+                    yield finish_hook(future)
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                futures = {
+                    executor.submit(worker, path): index for index, path in enumerate(skill_paths)
+                }
+                for future in concurrent.futures.as_completed(futures):
+                    result = future.result()
+                    if result.hooks_deferred:
+                        defer_hook(futures[future], result)
+                    else:
+                        yield futures[future], result
+                    for hook_future in finished_hooks():
+                        yield finish_hook(hook_future)
+
+        for future in concurrent.futures.as_completed(list(hook_futures)):
+            yield finish_hook(future)
+    finally:
+        if hook_loop is not None:
+            asyncio.run_coroutine_threadsafe(_cancel_pending_tasks(), hook_loop).result()
+            hook_loop.call_soon_threadsafe(hook_loop.stop)
+            hook_thread.join()
+            hook_loop.close()
+        if hook_pool is not None:
+            hook_pool.close()
+
+
+async def _cancel_pending_tasks() -> None:
+    """Cancel outstanding hook tasks (killing their processes) before loop shutdown."""
+    tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def validate_skills(
+    skill_paths: list[Path],
+    suggest: bool = False,
+    jobs: int | None = None,
+    cache_dir: Path | None = None,
+    warm_hooks: bool = False,
+    hook_jobs: int | None = None,
+    disabled: frozenset[str] = frozenset(),
+    profile: bool = False,
+    budget: TokenBudget = DEFAULT_TOKEN_BUDGET
+) -> list[ValidationResult]:
+    """
+    Validate several skills, fanning out across a process pool.
+
+    Built-in validators run in worker processes; validation hooks run
+    concurrently from this process via run_validation_hook_async().
+
+    Args:
+        skill_paths: Skill directories to validate
+        suggest: Whether to include optimization suggestions
+        jobs: Number of worker processes (default: CPU count, 1 = in-process)
+        cache_dir: Incremental cache directory (None disables caching)
+        warm_hooks: Run hooks that set WARM_HOOK = True in persistent workers
+        hook_jobs: Maximum hooks running at once (default: same as jobs)
+        disabled: Rule names to skip
+        profile: Attach per-rule timings to each result (bypasses the cache)
+        budget: Token-budget thresholds
+
+    Returns:
+        One ValidationResult per skill, in the same order as skill_paths
+    """
+    skill_paths = list(skill_paths)
+    results: list[ValidationResult | None] = [None] * len(skill_paths)
+    for index, result in iter_validate_skills(
+        skill_paths, suggest=suggest, jobs=jobs, cache_dir=cache_dir,
+        warm_hooks=warm_hooks, hook_jobs=hook_jobs, disabled=disabled, profile=profile,
+        budget=budget
+    ):
+        results[index] = result
+    return results
+
+
 def print_result(result: ValidationResult, verbose: bool = False, suggest: bool = False) -> None:
     """Print validation result to stdout."""
     for issue in result.issues:
@@ -1350,6 +2906,14 @@ def print_result(result: ValidationResult, verbose: bool = False, suggest: bool
     print(f"  Warnings: {warning_count}")
     if suggest:
         print(f"  Suggestions: {suggestion_count}")
+    if result.token_counts:
+        reference_tokens = sum(result.token_counts.values()) - result.token_counts["SKILL.md"]
+        print(f"  Tokens: ~{result.token_counts['SKILL.md']:,} SKILL.md, "
+              f"~{reference_tokens:,} references/")
+        if verbose:
+            for rel_path, tokens in result.token_counts.items():
+                if rel_path != "SKILL.md":
+                    print(f"    {rel_path}: ~{tokens:,}")
     print()
 
     if result.passed:
@@ -1358,19 +2922,500 @@ def print_result(result: ValidationResult, verbose: bool = False, suggest: bool
         print("Validation FAILED")
 
 
+@dataclass
+class RunSummary:
+    """Running totals for a multi-skill run, updated as results stream in."""
+    skills: int = 0
+    errors: int = 0
+    warnings: int = 0
+    suggestions: int = 0
+    failed: list[tuple[str, Path]] = field(default_factory=list)
+
+    def add(self, result: ValidationResult) -> None:
+        self.skills += 1
+        for issue in result.issues:
+            if issue.severity == Severity.ERROR:
+                self.errors += 1
+            elif issue.severity == Severity.WARNING:
+                self.warnings += 1
+            else:
+                self.suggestions += 1
+        if not result.passed:
+            self.failed.append((result.skill_name, result.skill_path))
+
+    @property
+    def passed(self) -> bool:
+        return not self.failed
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "skills": self.skills,
+            "passed": self.skills - len(self.failed),
+            "failed": len(self.failed),
+            "errors": self.errors,
+            "warnings": self.warnings,
+            "suggestions": self.suggestions,
+        }
+
+
+def print_summary(summary: RunSummary) -> None:
+    """Print an aggregate summary for a multi-skill run."""
+    print("=" * 60)
+    print(f"Validated {summary.skills} skills: "
+          f"{summary.skills - len(summary.failed)} passed, {len(summary.failed)} failed")
+    print(f"  Errors: {summary.errors}")
+    print(f"  Warnings: {summary.warnings}")
+    for skill_name, skill_path in summary.failed:
+        print(f"  FAILED: {skill_name} ({skill_path})")
+    print("=" * 60)
+
+
+# =============================================================================
+# Machine-Readable Output
+# =============================================================================
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+SARIF_LEVELS = {Severity.ERROR: "error", Severity.WARNING: "warning", Severity.SUGGESTION: "note"}
+
+
+def result_to_dict(result: ValidationResult) -> dict[str, Any]:
+    """Serialize a ValidationResult for JSON output."""
+    return {
+        "skill": result.skill_name,
+        "skill_path": str(result.skill_path),
+        "passed": result.passed,
+        "issues": [issue.to_dict() for issue in result.issues],
+        "token_counts": result.token_counts,
+    }
+
+
+def issue_path(result: ValidationResult, issue: ValidationIssue) -> Path:
+    """Resolve an issue's file_path (skill-relative or absolute) to a real path."""
+    path = Path(issue.file_path)
+    if path.is_absolute():
+        return path
+    if path.parts and path.parts[0] == result.skill_name:
+        return result.skill_path.parent / path
+    return result.skill_path / path
+
+
+class OutputWriter(abc.ABC):
+    """
+    Streams results to a text stream as they complete.
+
+    Subclasses write one format and must implement write(); every write is flushed so consumers see
+    each skill's output as soon as it finishes. No results are retained.
+    """
+
+    def __init__(self, stream: TextIO, verbose: bool = False, suggest: bool = False):
+        self.stream = stream
+        self.verbose = verbose
+        self.suggest = suggest
+
+    def start(self) -> None:
+        pass
+
+    @abc.abstractmethod
+    def write(self, result: ValidationResult) -> None:
+        """Write one skill's result."""
+
+    def finish(self, summary: RunSummary, single: bool = False) -> None:
+        pass
+
+    def _emit(self, text: str) -> None:
+        self.stream.write(text)
+        self.stream.flush()
+
+
+class TextWriter(OutputWriter):
+    """Human-readable report (the default)."""
+
+    def __init__(self, stream: TextIO, verbose: bool = False, suggest: bool = False):
+        super().__init__(stream, verbose, suggest)
+        self._first = True
+
+    def write(self, result: ValidationResult) -> None:
+        with contextlib.redirect_stdout(self.stream):
+            if not self._first:
+                print()
+            print_result(result, verbose=self.verbose, suggest=self.suggest)
+        self._first = False
+        self.stream.flush()
+
+    def finish(self, summary: RunSummary, single: bool = False) -> None:
+        if single:
+            return
+        with contextlib.redirect_stdout(self.stream):
+            print()
+            print_summary(summary)
+        self.stream.flush()
+
+
+class NdjsonWriter(OutputWriter):
+    """One JSON object per line: each issue, then a result line per skill, then a summary."""
+
+    def write(self, result: ValidationResult) -> None:
+        lines = [
+            json.dumps({"type": "issue", "skill": result.skill_name, **issue.to_dict()})
+            for issue in result.issues
+        ]
+        lines.append(json.dumps({
+            "type": "result",
+            "skill": result.skill_name,
+            "skill_path": str(result.skill_path),
+            "passed": result.passed,
+            "issues": len(result.issues),
+            "token_counts": result.token_counts,
+        }))
+        self._emit('\n'.join(lines) + '\n')
+
+    def finish(self, summary: RunSummary, single: bool = False) -> None:
+        self._emit(json.dumps({"type": "summary", **summary.to_dict()}) + '\n')
+
+
+class JsonWriter(OutputWriter):
+    """A single JSON document, written incrementally: {"results": [...], "summary": {...}}."""
+
+    def __init__(self, stream: TextIO, verbose: bool = False, suggest: bool = False):
+        super().__init__(stream, verbose, suggest)
+        self._count = 0
+
+    def start(self) -> None:
+        self._emit('{"results": [\n')
+
+    def write(self, result: ValidationResult) -> None:
+        separator = ',\n' if self._count else ''
+        self._emit(separator + json.dumps(result_to_dict(result)))
+        self._count += 1
+
+    def finish(self, summary: RunSummary, single: bool = False) -> None:
+        self._emit(f'\n], "summary": {json.dumps(summary.to_dict())}}}\n')
+
+
+class SarifWriter(OutputWriter):
+    """SARIF 2.1.0 log with one run; results are streamed into runs[0].results."""
+
+    def __init__(self, stream: TextIO, verbose: bool = False, suggest: bool = False):
+        super().__init__(stream, verbose, suggest)
+        self._count = 0
+        self._root = Path.cwd()
+
+    def start(self) -> None:
+        driver = {
+            "name": "validate_skill",
+            "version": VALIDATOR_VERSION,
+            "rules": [
+                {
+                    "id": rule.name,
+                    "defaultConfiguration": {"level": SARIF_LEVELS[rule.severity]},
+                    "properties": {"inputs": list(rule.inputs)},
+                }
+                for rule in RULES
+            ],
+        }
+        header = json.dumps({"$schema": SARIF_SCHEMA, "version": "2.1.0"})[:-1]
+        tool = json.dumps({"driver": driver})
+        self._emit(f'{header}, "runs": [{{"tool": {tool}, "results": [\n')
+
+    def _uri(self, path: Path) -> str:
+        try:
+            return path.relative_to(self._root).as_posix()
+        except ValueError:
+            return path.as_uri()
+
+    def write(self, result: ValidationResult) -> None:
+        for issue in result.issues:
+            location: dict[str, Any] = {
+                "artifactLocation": {"uri": self._uri(issue_path(result, issue))}
+            }
+            if issue.line:
+                location["region"] = {"startLine": issue.line}
+            sarif_result = {
+                "ruleId": issue.rule or issue.field,
+                "level": SARIF_LEVELS[issue.severity],
+                "message": {"text": issue.message},
+                "locations": [{"physicalLocation": location}],
+                "properties": {"skill": result.skill_name, "field": issue.field},
+            }
+            separator = ',\n' if self._count else ''
+            self._emit(separator + json.dumps(sarif_result))
+            self._count += 1
+
+    def finish(self, summary: RunSummary, single: bool = False) -> None:
+        self._emit('\n]}]}\n')
+
+
+OUTPUT_WRITERS: dict[str, type[OutputWriter]] = {
+    "text": TextWriter,
+    "ndjson": NdjsonWriter,
+    "json": JsonWriter,
+    "sarif": SarifWriter,
+}
+
+
+# =============================================================================
+# Watch Mode
+# =============================================================================
+
+RULE_ORDER: dict[str, int] = {rule.name: index for index, rule in enumerate(RULES)}
+
+
+def classify_change(
+    changed_path: Path,
+    skill_path: Path,
+    plugin_json_path: Path | None = None,
+    marketplace_path: Path | None = None
+) -> set[str]:
+    """
+    Map a changed file to the rule inputs it can affect.
+
+    Args:
+        changed_path: File reported by the watcher
+        skill_path: Skill directory
+        plugin_json_path: The skill's plugin.json, if plugin-bundled
+        marketplace_path: The repository's marketplace.json, if plugin-bundled
+
+    Returns:
+        Input names from the RULES vocabulary (empty if the file is unrelated)
+    """
+    if changed_path == plugin_json_path:
+        return {"plugin_json"}
+    if changed_path == marketplace_path:
+        return {"marketplace"}
+    try:
+        relative = changed_path.relative_to(skill_path)
+    except ValueError:
+        return set()
+    if relative == Path("SKILL.md"):
+        return {"frontmatter", "body"}
+    if relative == Path("scripts") / "validate_hook.py":
+        return {"hook", "skill_dir"}
+    if relative.parts and relative.parts[0] == "references":
+        # Adding or removing a reference also changes which links resolve
+        return {"references", "skill_dir"}
+    return {"skill_dir"}
+
+
+def merge_revalidation(
+    previous: ValidationResult,
+    partial: ValidationResult,
+    rerun: set[str]
+) -> ValidationResult:
+    """
+    Replace the issues of re-run rules in previous with those from partial.
+
+    Issues not attributed to a rule (a missing or unparseable SKILL.md) mean
+    partial is authoritative on its own.
+    """
+    if any(issue.rule is None for issue in partial.issues):
+        return partial
+    kept = [issue for issue in previous.issues if issue.rule not in rerun]
+    issues = sorted(kept + partial.issues, key=lambda issue: RULE_ORDER.get(issue.rule, -1))
+    return ValidationResult(
+        skill_path=partial.skill_path,
+        skill_name=partial.skill_name,
+        issues=issues,
+        profile=partial.profile,
+        token_counts=partial.token_counts or previous.token_counts
+    )
+
+
+def watch_skills(
+    skill_paths: list[Path],
+    writer: OutputWriter,
+    suggest: bool = False,
+    disabled: frozenset[str] = frozenset(),
+    hook_pool: HookPool | None = None,
+    debounce: float | None = None,
+    force_polling: bool = False,
+    max_batches: int | None = None,
+    budget: TokenBudget = DEFAULT_TOKEN_BUDGET
+) -> None:
+    """
+    Validate skill_paths, then re-validate whenever their files change.
+
+    Each debounced batch of changes is mapped to rule inputs per skill and
+    only the rules reading those inputs are re-run; their issues replace
+    the previous ones. Runs until interrupted or max_batches batches.
+    debounce is the quiet period that ends a burst of changes (default:
+    fs_watch.DEFAULT_DEBOUNCE).
+    """
+    # Imported here so validation alone never loads the inotify bindings
+    import fs_watch
+
+    if debounce is None:
+        debounce = fs_watch.DEFAULT_DEBOUNCE
+    skill_paths = [path.resolve() for path in skill_paths]
+    results: dict[Path, ValidationResult] = {}
+    related: dict[Path, tuple[Path | None, Path | None]] = {}
+    roots: dict[Path, None] = {}
+
+    for skill_path in skill_paths:
+        skill_type, plugin_json_path, marketplace_path = detect_skill_type(skill_path)
+        if skill_type != "plugin":
+            plugin_json_path = marketplace_path = None
+        related[skill_path] = (plugin_json_path, marketplace_path)
+        roots.update(dict.fromkeys(
+            p for p in (skill_path, plugin_json_path, marketplace_path) if p
+        ))
+        results[skill_path] = validate_skill(
+            skill_path, suggest, hook_pool, disabled=disabled, budget=budget
+        )
+        writer.write(results[skill_path])
+
+    batches = 0
+    with fs_watch.open_watcher(list(roots), force_polling) as watcher:
+        while max_batches is None or batches < max_batches:
+            changed = fs_watch.debounced(watcher, debounce)
+            if not changed:
+                continue
+            batches += 1
+            for skill_path in skill_paths:
+                plugin_json_path, marketplace_path = related[skill_path]
+                inputs: set[str] = set()
+                for path in changed:
+                    inputs |= classify_change(path, skill_path, plugin_json_path, marketplace_path)
+                if not inputs:
+                    continue
+
+                previous = results[skill_path]
+                if any(issue.rule is None for issue in previous.issues):
+                    inputs = None  # Last run never got as far as the rules
+                rerun = {rule.name for rule in select_rules(
+                    suggest, plugin_json_path is not None, disabled, inputs
+                )}
+                start = time.perf_counter()
+                partial = validate_skill(
+                    skill_path, suggest, hook_pool, disabled=disabled, inputs=inputs, budget=budget
+                )
+                results[skill_path] = merge_revalidation(previous, partial, rerun)
+                elapsed_ms = (time.perf_counter() - start) * 1000
+
+                if isinstance(writer, TextWriter):
+                    writer.stream.write(
+                        f"\n[{time.strftime('%H:%M:%S')}] {skill_path.name}: "
+                        f"re-ran {len(rerun)} rule(s) in {elapsed_ms:.1f} ms\n"
+                    )
+                writer.write(results[skill_path])
+
+
 # =============================================================================
 # CLI
 # =============================================================================
 
 def main() -> int:
     parser = argparse.ArgumentParser(
-        description="Validate a single skill against Agent Skills specification"
+        description="Validate skills against Agent Skills specification"
     )
     parser.add_argument(
-        "skill_path",
+        "skill_paths",
         type=str,
+        nargs="*",
+        metavar="skill_path",
         help="Path to skill directory (e.g., plugins/my-skill/skills/my-skill/)"
     )
+    parser.add_argument(
+        "--all", "-a",
+        action="store_true",
+        help="Discover and validate every skill under --root"
+    )
+    parser.add_argument(
+        "--root",
+        type=str,
+        default=".",
+        help="Repository root used by --all (default: current directory)"
+    )
+    parser.add_argument(
+        "--changed-since",
+        type=str,
+        default=None,
+        metavar="REF",
+        help="Validate only skills under --root affected by changes since a git ref"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=None,
+        help="Worker processes for multi-skill runs (default: CPU count)"
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=f"Reuse results for unchanged skills from <root>/{DEFAULT_CACHE_DIR} "
+             f"(hook output is never cached)"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        help="Cache directory; implies --cache"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the cache even when --cache or --cache-dir is given"
+    )
+    parser.add_argument(
+        "--hook-jobs",
+        type=int,
+        default=None,
+        help="Maximum validation hooks running concurrently (default: same as --jobs)"
+    )
+    parser.add_argument(
+        "--warm-hooks",
+        action="store_true",
+        help="Run hooks that set WARM_HOOK = True in persistent workers "
+             "instead of a subprocess per skill"
+    )
+    parser.add_argument(
+        "--disable",
+        action="append",
+        default=[],
+        metavar="RULE[,RULE]",
+        help="Skip the named rules (see --list-rules); may be repeated"
+    )
+    parser.add_argument(
+        "--token-budget",
+        type=str,
+        default=None,
+        metavar="WARN,ERROR",
+        help=f"SKILL.md token thresholds (default: {DEFAULT_TOKEN_BUDGET.skill_warn},"
+             f"{DEFAULT_TOKEN_BUDGET.skill_error})"
+    )
+    parser.add_argument(
+        "--reference-token-budget",
+        type=int,
+        default=DEFAULT_TOKEN_BUDGET.reference_warn,
+        metavar="WARN",
+        help=f"Per-reference token warning threshold "
+             f"(default: {DEFAULT_TOKEN_BUDGET.reference_warn})"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Report wall time and call counts per rule (bypasses the cache)"
+    )
+    parser.add_argument(
+        "--list-rules",
+        action="store_true",
+        help="List registered rules and exit"
+    )
+    parser.add_argument(
+        "--watch", "-w",
+        action="store_true",
+        help="Keep running and re-validate on file changes (inotify, or polling elsewhere)"
+    )
+    parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="With --watch, poll for changes instead of using inotify"
+    )
+    parser.add_argument(
+        "--format", "-f",
+        choices=sorted(OUTPUT_WRITERS),
+        default="text",
+        help="Output format; ndjson/json/sarif stream as each skill completes (default: text)"
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -1384,20 +3429,109 @@ def main() -> int:
 
     args = parser.parse_args()
 
-    skill_path = Path(args.skill_path).resolve()
-
-    if not skill_path.exists():
-        print(f"ERROR: Path does not exist: {skill_path}", file=sys.stderr)
-        return 1
+    if args.list_rules:
+        for rule in RULES:
+            scope = " (plugin only)" if rule.plugin_only else ""
+            inputs = ', '.join(rule.inputs)
+            print(f"{rule.name:<22} {rule.severity.value:<11} {inputs}{scope}")
+        return 0
 
-    if not skill_path.is_dir():
-        print(f"ERROR: Path is not a directory: {skill_path}", file=sys.stderr)
-        return 1
-
-    result = validate_skill(skill_path, suggest=args.suggest)
-    print_result(result, verbose=args.verbose, suggest=args.suggest)
+    disabled = frozenset(
+        name.strip() for value in args.disable for name in value.split(',') if name.strip()
+    )
+    unknown = sorted(disabled - RULES_BY_NAME.keys())
+    if unknown:
+        parser.error(f"unknown rule(s) for --disable: {', '.join(unknown)}")
 
-    return 0 if result.passed else 1
+    skill_warn, skill_error = DEFAULT_TOKEN_BUDGET.skill_warn, DEFAULT_TOKEN_BUDGET.skill_error
+    if args.token_budget:
+        try:
+            skill_warn, skill_error = (int(value) for value in args.token_budget.split(','))
+        except ValueError:
+            parser.error("--token-budget expects WARN,ERROR (e.g. 2500,3500)")
+        if not 0 < skill_warn <= skill_error:
+            parser.error("--token-budget needs 0 < WARN <= ERROR")
+    if args.reference_token_budget < 1:
+        parser.error("--reference-token-budget must be at least 1")
+    budget = TokenBudget(skill_warn, skill_error, args.reference_token_budget)
+
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.hook_jobs is not None and args.hook_jobs < 1:
+        parser.error("--hook-jobs must be at least 1")
+
+    skill_paths = [Path(p).resolve() for p in args.skill_paths]
+    if args.all and args.changed_since:
+        parser.error("--all and --changed-since are mutually exclusive")
+    if args.all:
+        skill_paths.extend(discover_skills(Path(args.root)))
+    if args.changed_since:
+        try:
+            skill_paths.extend(changed_skills(Path(args.root), args.changed_since))
+        except GitError as e:
+            print(f"ERROR: --changed-since {args.changed_since}: {e}", file=sys.stderr)
+            return 1
+
+    if not skill_paths and not args.changed_since:
+        parser.error("provide at least one skill_path, --all or --changed-since")
+
+    for skill_path in skill_paths:
+        if not skill_path.exists():
+            print(f"ERROR: Path does not exist: {skill_path}", file=sys.stderr)
+            return 1
+
+        if not skill_path.is_dir():
+            print(f"ERROR: Path is not a directory: {skill_path}", file=sys.stderr)
+            return 1
+
+    # Deduplicate while preserving order
+    skill_paths = list(dict.fromkeys(skill_paths))
+
+    cache_dir = None
+    if (args.cache or args.cache_dir) and not args.no_cache:
+        cache_dir = Path(args.cache_dir) if args.cache_dir else Path(args.root) / DEFAULT_CACHE_DIR
+        cache_dir = cache_dir.resolve()
+
+    single = len(skill_paths) == 1 and not (args.all or args.changed_since)
+    writer = OUTPUT_WRITERS[args.format](sys.stdout, verbose=args.verbose, suggest=args.suggest)
+    summary = RunSummary()
+    profile = RuleProfile()
+
+    if args.watch:
+        if args.format not in ("text", "ndjson"):
+            parser.error("--watch supports --format text or ndjson")
+        hook_pool = HookPool(args.hook_jobs or 1) if args.warm_hooks else None
+        try:
+            watch_skills(skill_paths, writer, args.suggest, disabled, hook_pool,
+                         force_polling=args.poll, budget=budget)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if hook_pool is not None:
+                hook_pool.close()
+        return 0
+
+    writer.start()
+    for _, result in iter_validate_skills(
+        skill_paths, suggest=args.suggest, jobs=1 if single else args.jobs, cache_dir=cache_dir,
+        warm_hooks=args.warm_hooks, hook_jobs=args.hook_jobs,
+        disabled=disabled, profile=args.profile, budget=budget
+    ):
+        writer.write(result)
+        summary.add(result)
+        if result.profile is not None:
+            profile.merge(result.profile)
+    writer.finish(summary, single=single)
+
+    if args.profile:
+        # Keep machine-readable stdout parseable
+        out = sys.stdout if args.format == "text" else sys.stderr
+        print(file=out)
+        plural = 's' if summary.skills != 1 else ''
+        print(f"Rule profile ({summary.skills} skill{plural}):", file=out)
+        print(profile.format(), file=out)
+
+    return 0 if summary.passed else 1
 
 
 if __name__ == "__main__":
@@ -0,0 +1,44 @@
+"""Tests for benchmarks/bench_validate_skill.py"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[2] / "benchmarks"))
+
+from bench_validate_skill import compare_to_baseline, generate_corpus  # noqa: E402
+from validate_skill import discover_skills, validate_skills  # noqa: E402
+
+
+def test_generate_corpus_is_valid(temp_dir):
+    """The synthetic corpus is discoverable and passes validation, hooks included."""
+    paths = generate_corpus(temp_dir, skills=4, references=2, reference_lines=60, hooks_every=2)
+    assert sorted(discover_skills(temp_dir)) == sorted(paths)
+    assert (paths[0] / "scripts" / "validate_hook.py").exists()
+    assert not (paths[1] / "scripts" / "validate_hook.py").exists()
+
+    results = validate_skills(paths, suggest=True, jobs=1)
+    assert all(result.passed for result in results)
+
+
+def _run(**metrics):
+    params = {"skills": 10, "references": 1, "reference_lines": 10, "hooks_every": 0}
+    return {"scenarios": {"small": {"params": params, **metrics}}}
+
+
+def test_compare_to_baseline_flags_regressions():
+    """Slowdowns past the threshold and above the noise floor are reported."""
+    baseline = _run(serial_s=1.0, skills_per_s=100.0, rules_ms={"name": 50.0, "tiny": 0.1})
+    current = _run(serial_s=1.5, skills_per_s=60.0, rules_ms={"name": 51.0, "tiny": 0.5})
+
+    regressions = compare_to_baseline(current, baseline, threshold=0.2)
+    assert len(regressions) == 2
+    assert regressions[0].startswith("small: serial_s")
+    assert regressions[1].startswith("small: skills_per_s")
+    assert compare_to_baseline(current, baseline, threshold=0.6) == []
+
+
+def test_compare_to_baseline_params_mismatch():
+    """A baseline recorded on a different corpus is not compared metric by metric."""
+    baseline = _run(serial_s=1.0)
+    baseline["scenarios"]["small"]["params"]["skills"] = 20
+    [regression] = compare_to_baseline(_run(serial_s=9.0), baseline)
+    assert "parameters differ" in regression
@@ -33,3 +33,34 @@ def mock_readme(mock_repo):
     readme = mock_repo / "README.md"
     readme.write_text("# Test Project\n\nA simple test project for testing.")
     return readme
+
+
+@pytest.fixture
+def make_skill(temp_dir):
+    """Factory that creates plugin-bundled skills under a mock marketplace repo."""
+    import json
+
+    marketplace = temp_dir / ".claude-plugin" / "marketplace.json"
+    marketplace.parent.mkdir()
+    marketplace.write_text(json.dumps({"name": "test", "plugins": []}))
+
+    def _make_skill(name, body="# Skill\n\nDoes things.\n", version="1.0.0", description=None):
+        description = description or f"Generates {name} output. Use when asked to test {name}."
+        plugin_dir = temp_dir / "plugins" / name
+        skill_dir = plugin_dir / "skills" / name
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            f"---\nname: {name}\ndescription: {description}\n"
+            f"metadata:\n  version: \"{version}\"\n---\n\n{body}"
+        )
+        (plugin_dir / ".claude-plugin").mkdir()
+        (plugin_dir / ".claude-plugin" / "plugin.json").write_text(json.dumps({
+            "name": name, "description": description,
+            "version": version, "author": {"name": "tester"},
+        }))
+        data = json.loads(marketplace.read_text())
+        data["plugins"].append({"name": name, "source": f"./plugins/{name}", "version": version})
+        marketplace.write_text(json.dumps(data))
+        return skill_dir
+
+    return _make_skill
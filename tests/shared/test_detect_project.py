@@ -1,7 +1,27 @@
 """Tests for shared/detect_project.py"""
+import json
+import os
+import random
+import re
+import subprocess
+import sys
 from pathlib import Path
 
-from detect_project import detect_project, glob_match
+from detect_project import (
+    DETECTION_INDEX,
+    DETECTION_RULES,
+    SNIFF_BYTES,
+    SNIFF_PATTERNS,
+    SNIFF_RULES,
+    RuleIndex,
+    _rules_key,
+    detect_project,
+    detect_project_cached,
+    detect_projects,
+    detect_workspace,
+    glob_match,
+)
+from fs_snapshot import DirectorySnapshot
 
 
 def test_detect_nodejs(temp_dir):
@@ -85,3 +105,264 @@ def test_glob_match_extension():
     """Matches *.ext patterns."""
     files = ["app.csproj", "lib.csproj", "README.md"]
     assert glob_match("*.csproj", files) == ["app.csproj", "lib.csproj"]
+
+
+def test_detect_reuses_snapshot(temp_dir):
+    """A shared snapshot lists the directory only once across calls."""
+    (temp_dir / "go.mod").touch()
+    snapshot = DirectorySnapshot()
+    assert detect_project(temp_dir, snapshot)["type"] == "go"
+    assert detect_project(temp_dir, snapshot)["type"] == "go"
+    assert snapshot.scans == 1
+
+
+def _detect_linear(files):
+    """The rules-times-files scan that RuleIndex replaces."""
+    detected, detected_type, confidence = [], "unknown", "none"
+    for patterns, proj_type, conf in DETECTION_RULES:
+        for pattern in patterns:
+            matches = glob_match(pattern, files)
+            if matches:
+                detected.extend(matches)
+                if detected_type == "unknown":
+                    detected_type, confidence = proj_type, conf
+                break
+    return detected_type, confidence, list(dict.fromkeys(detected))
+
+
+def test_rule_index_matches_linear_scan():
+    """The compiled index gives the same first-match results as scanning every rule."""
+    pool = ["Makefile", "setup.py", "app.csproj", "lib.csproj", "x.sln", ".csproj",
+            "a.b.fsproj", "Cargo.toml", "package.json", "README.md", "csproj", "go.mod"]
+    rng = random.Random(0)
+    for _ in range(200):
+        files = rng.sample(pool, rng.randint(0, len(pool)))
+        assert DETECTION_INDEX.classify(files) == _detect_linear(files), files
+
+
+def test_rule_index_multi_pattern_rule():
+    """Within one rule only the first matching pattern contributes files."""
+    index = RuleIndex([
+        (["*.cabal", "stack.yaml"], "haskell", "high"),
+        (["stack.yaml"], "stack", "low"),
+    ])
+    expected = ("haskell", "high", ["a.cabal", "stack.yaml"])
+    assert index.classify(["stack.yaml", "a.cabal"]) == expected
+    assert index.classify(["stack.yaml"], is_file=lambda name: False) == ("unknown", "none", [])
+
+
+def _make_monorepo(root):
+    for rel in ["package.json", "packages/web/package.json", "packages/api/package.json",
+                "services/worker/pyproject.toml", "services/worker/deep/a/b/go.mod",
+                "node_modules/left-pad/package.json", ".venv/lib/setup.py",
+                "packages/web/node_modules/react/package.json", "docs/README.md"]:
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).touch()
+
+
+def test_detect_projects_monorepo(temp_dir):
+    """Finds one project per sub-directory, pruning dependency and hidden directories."""
+    _make_monorepo(temp_dir)
+    results = detect_projects(temp_dir)
+    assert [(r["path"], r["type"]) for r in results] == [
+        (".", "nodejs"),
+        ("packages/api", "nodejs"),
+        ("packages/web", "nodejs"),
+        ("services/worker", "python"),
+    ]
+    assert results[1]["files"] == ["package.json"]
+
+
+def test_detect_projects_depth_and_jobs(temp_dir):
+    """max_depth bounds the walk, and parallel walks return the same results."""
+    _make_monorepo(temp_dir)
+    assert [r["path"] for r in detect_projects(temp_dir, max_depth=0)] == ["."]
+    deep = detect_projects(temp_dir, max_depth=5)
+    assert deep[-1]["path"] == "services/worker/deep/a/b"
+    assert detect_projects(temp_dir, max_depth=5, jobs=4) == deep
+
+
+def test_detect_projects_respects_gitignore(temp_dir):
+    """Directories ignored by .gitignore files are not searched."""
+    _make_monorepo(temp_dir)
+    (temp_dir / ".gitignore").write_text("/services/\n")
+    (temp_dir / "packages" / ".gitignore").write_text("api/\n")
+    assert [r["path"] for r in detect_projects(temp_dir)] == [".", "packages/web"]
+    paths = [r["path"] for r in detect_projects(temp_dir, gitignore=False)]
+    assert paths == [".", "packages/api", "packages/web", "services/worker"]
+
+
+def test_detect_projects_error():
+    """An unreadable root yields a single error result."""
+    results = detect_projects(Path("/nonexistent/path"))
+    assert len(results) == 1 and "error" in results[0]
+
+
+def test_detect_workspace(temp_dir):
+    """Classifies every repository in a workspace, one result per repo."""
+    for name, manifest in [("web", "package.json"), ("api", "go.mod"), ("notes", None)]:
+        (temp_dir / name / ".git").mkdir(parents=True)
+        if manifest:
+            (temp_dir / name / manifest).touch()
+    (temp_dir / "not-a-repo").mkdir()
+
+    results = {r["repo"]: r for r in detect_workspace(temp_dir, jobs=2)}
+    assert {name: r["type"] for name, r in results.items()} == {
+        "web": "nodejs", "api": "go", "notes": "unknown"
+    }
+    assert results["web"]["path"] == str(temp_dir / "web")
+
+    (temp_dir / "web" / "packages" / "ui").mkdir(parents=True)
+    (temp_dir / "web" / "packages" / "ui" / "package.json").touch()
+    results = {r["repo"]: r for r in detect_workspace(temp_dir, recursive=True)}
+    assert [p["path"] for p in results["web"]["projects"]] == [".", "packages/ui"]
+    assert list(detect_workspace(temp_dir / "not-a-repo")) == []
+
+
+def _age(path, seconds=60):
+    """Backdate path's mtime out of the racy window."""
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 10**9))
+
+
+def test_detect_project_cached(temp_dir):
+    """Repeat calls are served from the cache until the directory changes."""
+    project, cache_dir = temp_dir / "project", temp_dir / "cache"
+    project.mkdir()
+    (project / "go.mod").touch()
+    _age(project)
+    assert detect_project_cached(project, cache_dir)["type"] == "go"
+
+    # A hit is returned as stored, without listing the directory
+    [cache_file] = cache_dir.iterdir()
+    data = json.loads(cache_file.read_text())
+    data["result"]["type"] = "from-cache"
+    cache_file.write_text(json.dumps(data))
+    assert detect_project_cached(project, cache_dir)["type"] == "from-cache"
+
+    # Adding a file moves the directory's mtime and forces a rescan
+    (project / "package.json").touch()
+    result = detect_project_cached(project, cache_dir)
+    assert (result["type"], result["files"]) == ("nodejs", ["package.json", "go.mod"])
+
+
+
+def test_rules_key_covers_pattern_flags():
+    """The cache key changes with a pattern's flags, not just its source."""
+    key = _rules_key(DETECTION_RULES, SNIFF_RULES, SNIFF_BYTES, SNIFF_PATTERNS)
+    assert key == _rules_key(DETECTION_RULES, SNIFF_RULES, SNIFF_BYTES, SNIFF_PATTERNS)
+    patterns = dict(SNIFF_PATTERNS, python=re.compile(SNIFF_PATTERNS["python"].pattern))
+    assert key != _rules_key(DETECTION_RULES, SNIFF_RULES, SNIFF_BYTES, patterns)
+
+
+def test_cli_cache_is_opt_in(temp_dir):
+    """The CLI only writes the detection cache with --cache or --cache-dir."""
+    project = temp_dir / "project"
+    project.mkdir()
+    (project / "go.mod").touch()
+    _age(project)
+    script = Path(__file__).parents[2] / "shared" / "detect_project.py"
+    env = dict(os.environ, XDG_CACHE_HOME=str(temp_dir / "xdg"))
+
+    def run(*args):
+        subprocess.run([sys.executable, str(script), "--path", str(project), *args],
+                       env=env, check=True, capture_output=True)
+
+    run()
+    assert not (temp_dir / "xdg").exists()
+    run("--cache")
+    assert list((temp_dir / "xdg" / "claudeskillz" / "detect_project").iterdir())
+    run("--cache-dir", str(temp_dir / "explicit"), "--no-cache")
+    assert not (temp_dir / "explicit").exists()
+
+def test_detect_project_cached_skips_racy_and_errors(temp_dir):
+    """Freshly modified directories and error results are not stored."""
+    cache_dir = temp_dir / "cache"
+    (temp_dir / "Cargo.toml").touch()
+    assert detect_project_cached(temp_dir, cache_dir)["type"] == "rust"
+    assert "error" in detect_project_cached(temp_dir / "missing", cache_dir)
+    assert not cache_dir.exists()
+
+
+def test_sniff_nodejs(temp_dir):
+    """package.json yields framework, package manager, lockfile and Node version."""
+    (temp_dir / "package.json").write_text(json.dumps({
+        "name": "web", "packageManager": "pnpm@9.1.0", "engines": {"node": ">=20"},
+        "dependencies": {"react": "^18", "next": "^14"}, "devDependencies": {"@types/node": "^20"},
+    }))
+    (temp_dir / "pnpm-lock.yaml").touch()
+    assert detect_project(temp_dir)["details"] == {
+        "manifest": "package.json", "framework": "next", "package_manager": "pnpm",
+        "lockfile": "pnpm-lock.yaml", "runtime": "node", "runtime_version": ">=20",
+    }
+
+
+def test_sniff_python(temp_dir):
+    """pyproject.toml in PEP 621 and Poetry styles; lockfiles win over [tool.*] tables."""
+    (temp_dir / "pyproject.toml").write_text(
+        '[project]\nname = "api"\nrequires-python = ">=3.11"\n'
+        'dependencies = [\n  "fastapi>=0.110",\n  "starlette",\n]\n[tool.hatch.build]\n'
+    )
+    (temp_dir / "uv.lock").touch()
+    details = detect_project(temp_dir)["details"]
+    assert (details["framework"], details["package_manager"], details["lockfile"],
+            details["runtime_version"]) == ("fastapi", "uv", "uv.lock", ">=3.11")
+
+    (temp_dir / "uv.lock").unlink()
+    (temp_dir / "pyproject.toml").write_text(
+        '[tool.poetry]\nname = "site"\ndescription = "A Flask-free site"\n\n'
+        '[tool.poetry.dependencies]\npython = "^3.12"\nDjango = "^5.0"\n'
+    )
+    details = detect_project(temp_dir)["details"]
+    assert (details["framework"], details["package_manager"], details["lockfile"],
+            details["runtime_version"]) == ("django", "poetry", None, "^3.12")
+
+
+def test_sniff_ignores_framework_mentions(temp_dir):
+    """Only dependency declarations count, not descriptions, scripts or longer names."""
+    (temp_dir / "package.json").write_text(json.dumps({
+        "name": "react", "description": "Icons for react", "scripts": {"next": "next dev"},
+        "dependencies": {"react-icons": "^5", "vue-router": "^4"},
+    }))
+    assert detect_project(temp_dir)["details"]["framework"] is None
+
+    (temp_dir / "package.json").unlink()
+    (temp_dir / "pyproject.toml").write_text(
+        '[project]\nname = "flask-helpers"\ndescription = "Works with django or flask"\n'
+        'keywords = ["django", "flask"]\n'
+        'dependencies = ["django-environ>=0.11", "flask_login"]\n'
+        '[project.scripts]\nfastapi = "app:main"\n'
+        '[tool.poetry.scripts]\ndjango = "x:y"\n'
+    )
+    assert detect_project(temp_dir)["details"]["framework"] is None
+
+    (temp_dir / "pyproject.toml").write_text(
+        '[project]\nname = "api"\ndependencies = ["pydantic"]\n'
+        '[dependency-groups]\nweb = [\n  "Flask[async]>=3",  # ] in a comment\n]\n'
+    )
+    assert detect_project(temp_dir)["details"]["framework"] == "flask"
+
+
+def test_sniff_reads_bounded_prefix(temp_dir):
+    """Facts past SNIFF_BYTES are not read; other types get no details."""
+    padding = {f"k{i}": "x" * 100 for i in range(SNIFF_BYTES // 100)}
+    (temp_dir / "package.json").write_text(json.dumps({**padding, "dependencies": {"vue": "3"}}))
+    assert detect_project(temp_dir)["details"]["framework"] is None
+
+    (temp_dir / "package.json").unlink()
+    (temp_dir / "go.mod").touch()
+    assert "details" not in detect_project(temp_dir)
+
+
+def test_detect_project_cached_sees_manifest_edits(temp_dir):
+    """Editing the sniffed manifest in place invalidates the entry."""
+    project, cache_dir = temp_dir / "project", temp_dir / "cache"
+    project.mkdir()
+    manifest = project / "package.json"
+    manifest.write_text('{"dependencies": {"express": "4"}}')
+    _age(manifest)
+    _age(project)
+    assert detect_project_cached(project, cache_dir)["details"]["framework"] == "express"
+    manifest.write_text('{"dependencies": {"koa": "2"}}')
+    _age(project)
+    assert detect_project_cached(project, cache_dir)["details"]["framework"] == "koa"
@@ -0,0 +1,152 @@
+"""Tests for shared/frontmatter.py"""
+import io
+
+import pytest
+from frontmatter import (
+    YAMLError,
+    lookup,
+    parse_simple_yaml,
+    parse_yaml,
+    read_frontmatter,
+    read_frontmatter_stream,
+    read_version,
+)
+
+DOCUMENT = (
+    '---\nname: pdf-reader\ndescription: "Reads PDFs. Use for PDFs."\n'
+    'metadata:\n  version: "1.2.3"\n---\n\n# PDF Reader\n\nversion: 9.9.9\n'
+)
+
+
+def test_read_frontmatter_offsets(temp_dir):
+    """Offsets locate the YAML text and the body in the raw bytes."""
+    path = temp_dir / "SKILL.md"
+    path.write_text(DOCUMENT)
+    raw = path.read_bytes()
+
+    frontmatter = read_frontmatter(path)
+    assert frontmatter.data["name"] == "pdf-reader"
+    assert frontmatter.version == "1.2.3"
+    assert raw[frontmatter.start:frontmatter.end].decode() == frontmatter.text + "\n"
+    assert raw[frontmatter.end:frontmatter.body_start] == b"---\n"
+    assert raw[frontmatter.body_start:].startswith(b"\n# PDF Reader")
+
+
+def test_read_frontmatter_stops_at_delimiter():
+    """Nothing after the closing delimiter is consumed from the stream."""
+    stream = io.BytesIO(DOCUMENT.encode() + b"x" * 100_000)
+    frontmatter = read_frontmatter_stream(stream)
+    assert stream.tell() == frontmatter.body_start
+
+
+def test_read_frontmatter_multibyte_offsets():
+    """Offsets count bytes, not characters."""
+    data = "---\ndescription: café ☕\n---\nbody\n".encode()
+    frontmatter = read_frontmatter_stream(io.BytesIO(data))
+    assert frontmatter.data["description"] == "café ☕"
+    assert data[frontmatter.body_start:] == b"body\n"
+
+
+def test_read_frontmatter_missing_or_unterminated(temp_dir):
+    """No frontmatter, an unterminated block, or a missing file yield None."""
+    assert read_frontmatter_stream(io.BytesIO(b"# Title\n---\n")) is None
+    assert read_frontmatter_stream(io.BytesIO(b"---\nname: x\n")) is None
+    assert read_frontmatter_stream(io.BytesIO(b"---\n" + b"a: b\n" * 100), max_bytes=64) is None
+    assert read_frontmatter(temp_dir / "missing.md") is None
+    assert read_version(temp_dir / "missing.md") is None
+
+
+def test_version_falls_back_to_top_level():
+    """A top-level version is used when metadata.version is absent."""
+    frontmatter = read_frontmatter_stream(io.BytesIO(b"---\nversion: 2.0.0\n---\n"))
+    assert frontmatter.version == "2.0.0"
+
+
+def test_lookup():
+    """Dotted keys walk nested mappings."""
+    data = parse_simple_yaml('name: x\nmetadata:\n  version: "1.0.0"')
+    assert lookup(data, "metadata.version") == "1.0.0"
+    assert lookup(data, "name.version") is None
+    assert lookup(data, "missing") is None
+
+
+def test_parse_yaml_nested_maps_and_lines():
+    """Mappings nest to any depth and every key records its line."""
+    data, lines = parse_yaml(
+        "name: x\nmetadata:\n  author: me\n  owner:\n    team: core\nlicense: MIT", first_line=2
+    )
+    assert data == {
+        "name": "x", "metadata": {"author": "me", "owner": {"team": "core"}}, "license": "MIT"
+    }
+    assert lines == {
+        "name": 2, "metadata": 3, "metadata.author": 4, "metadata.owner": 5,
+        "metadata.owner.team": 6, "license": 7,
+    }
+
+
+def test_parse_yaml_lists():
+    """Block sequences of scalars and of mappings, indented or not."""
+    data, lines = parse_yaml(
+        "tools:\n  - Read\n  - Write\nsteps:\n- name: a\n  run: b\n- name: c\nend: yes"
+    )
+    assert data["tools"] == ["Read", "Write"]
+    assert data["steps"] == [{"name": "a", "run": "b"}, {"name": "c"}]
+    assert data["end"] == "yes"
+    assert lines["tools.1"] == 3
+    assert lines["steps.1.name"] == 7
+
+
+def test_parse_yaml_empty_list_item():
+    """An empty item is null and does not swallow the items after it."""
+    assert parse_simple_yaml("a:\n  - x\n  -\n  - y\n") == {"a": ["x", None, "y"]}
+    assert parse_simple_yaml("a:\n- x\n-\n- y\nb: z") == {"a": ["x", None, "y"], "b": "z"}
+
+
+def test_parse_yaml_key_without_space():
+    """"key:value" is still a mapping entry; list items split only at ': '."""
+    data = parse_simple_yaml("name:demo\nmetadata:\n  version:1.0\nurls:\n  - https://x.y\n")
+    assert data == {"name": "demo", "metadata": {"version": "1.0"}, "urls": ["https://x.y"]}
+
+
+def test_parse_yaml_rejects_tab_indentation(temp_dir):
+    """Tab-indented lines are an error rather than keys starting with a tab."""
+    with pytest.raises(YAMLError, match="line 3"):
+        parse_yaml("name: x\nmetadata:\n\tversion: 1.0.0\n")
+    assert parse_simple_yaml("a: b\n\t# comment\n") == {"a": "b"}
+    path = temp_dir / "SKILL.md"
+    path.write_text("---\nmetadata:\n\tversion: 1.0.0\n---\n")
+    assert read_frontmatter(path) is None
+
+
+def test_parse_yaml_block_scalars():
+    """Literal and folded scalars honour chomping indicators."""
+    text = (
+        "literal: |\n  one\n  two\n\n"
+        "folded: >\n  one\n  two\n\n  three\n"
+        "stripped: |-\n  keep\n"
+        "kept: >+\n  tail\n\n"
+        "after: done"
+    )
+    data = parse_simple_yaml(text)
+    assert data["literal"] == "one\ntwo\n"
+    assert data["folded"] == "one two\nthree\n"
+    assert data["stripped"] == "keep"
+    assert data["kept"] == "tail\n\n"
+    assert data["after"] == "done"
+
+
+def test_parse_yaml_scalars():
+    """Quotes, escapes, comments, multi-line plain scalars and empty values."""
+    data = parse_simple_yaml(
+        "a: \"say \\\"hi\\\"\"\n"
+        "b: 'it''s'\n"
+        "c: value # comment\n"
+        "d: http://example.com/x#y\n"
+        "e: first\n  second\n"
+        "f:\n"
+        "'quoted key': 1"
+    )
+    assert data == {
+        "a": 'say "hi"', "b": "it's", "c": "value", "d": "http://example.com/x#y",
+        "e": "first second", "f": None, "quoted key": "1",
+    }
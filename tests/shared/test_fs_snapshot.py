@@ -0,0 +1,56 @@
+"""Tests for shared/fs_snapshot.py"""
+import os
+
+import pytest
+from fs_snapshot import DirectorySnapshot
+
+
+def test_lookups_match_pathlib(temp_dir):
+    """exists/is_file/is_dir/size agree with the real filesystem."""
+    (temp_dir / "scripts").mkdir()
+    (temp_dir / "scripts" / "run.py").write_text("print()\n")
+    snapshot = DirectorySnapshot()
+
+    for path in [
+        temp_dir / "scripts",
+        temp_dir / "scripts" / "run.py",
+        temp_dir / "scripts" / ".." / "scripts" / "run.py",
+        temp_dir / "missing.md",
+        temp_dir / "missing" / "deeper.md",
+        temp_dir / "scripts" / "run.py" / "not-a-dir",
+    ]:
+        assert snapshot.exists(path) == path.exists(), path
+        assert snapshot.is_file(path) == path.is_file(), path
+        assert snapshot.is_dir(path) == path.is_dir(), path
+    assert snapshot.size(temp_dir / "scripts" / "run.py") == 8
+    assert snapshot.size(temp_dir / "missing.md") is None
+
+
+def test_each_directory_listed_once(temp_dir):
+    """Many lookups in one directory cost a single scandir."""
+    (temp_dir / "a.md").touch()
+    snapshot = DirectorySnapshot()
+    for name in ["a.md", "b.md", "c.md", "a.md"]:
+        snapshot.exists(temp_dir / name)
+    assert snapshot.scans == 1
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlinks unsupported")
+def test_broken_symlink_does_not_exist(temp_dir):
+    """A dangling symlink is listed but, like Path.exists(), does not exist."""
+    link = temp_dir / "dangling"
+    try:
+        link.symlink_to(temp_dir / "nowhere")
+    except OSError:
+        pytest.skip("cannot create symlinks")
+    assert not DirectorySnapshot().exists(link)
+
+
+def test_invalidate(temp_dir):
+    """Listings are stale until the changed path is invalidated."""
+    snapshot = DirectorySnapshot()
+    assert not snapshot.exists(temp_dir / "new.md")
+    (temp_dir / "new.md").touch()
+    assert not snapshot.exists(temp_dir / "new.md")
+    snapshot.invalidate(temp_dir / "new.md")
+    assert snapshot.exists(temp_dir / "new.md")
@@ -0,0 +1,103 @@
+"""Tests for shared/fs_watch.py"""
+import time
+
+import pytest
+from fs_watch import InotifyWatcher, PollingWatcher, _load_libc, debounced, is_ignored, open_watcher
+
+BACKENDS = [pytest.param(lambda roots: PollingWatcher(roots, interval=0.01), id="polling")]
+if _load_libc() is not None:
+    BACKENDS.append(pytest.param(InotifyWatcher, id="inotify"))
+
+
+def test_is_ignored(temp_dir):
+    """Editor scratch files and VCS directories are ignored."""
+    assert is_ignored(temp_dir / "SKILL.md.swp")
+    assert is_ignored(temp_dir / ".#SKILL.md")
+    assert is_ignored(temp_dir / ".git" / "index")
+    assert not is_ignored(temp_dir / "SKILL.md")
+
+
+@pytest.mark.parametrize("factory", BACKENDS)
+def test_watcher_reports_nested_changes(factory, temp_dir):
+    """Modified, created and deleted files under a directory root are reported."""
+    (temp_dir / "references").mkdir()
+    modified = temp_dir / "SKILL.md"
+    deleted = temp_dir / "references" / "old.md"
+    modified.write_text("one")
+    deleted.write_text("old")
+
+    with factory([temp_dir]) as watcher:
+        time.sleep(0.02)
+        modified.write_text("two!")
+        deleted.unlink()
+        created = temp_dir / "references" / "new.md"
+        created.write_text("new")
+        changed = debounced(watcher, 0.05, timeout=2)
+
+    assert changed == {modified, deleted, created}
+
+
+@pytest.mark.parametrize("factory", BACKENDS)
+def test_watcher_reports_directory_moves(factory, temp_dir):
+    """Moving a populated directory in or out reports paths under it."""
+    skill = temp_dir / "skill"
+    skill.mkdir()
+    outside = temp_dir / "references"
+    outside.mkdir()
+    (outside / "guide.md").write_text("guide")
+    inside = skill / "references"
+
+    with factory([skill]) as watcher:
+        time.sleep(0.02)
+        outside.rename(inside)
+        changed = debounced(watcher, 0.05, timeout=2)
+        assert inside / "guide.md" in changed
+        assert changed <= {inside, inside / "guide.md"}
+
+        inside.rename(outside)
+        changed = debounced(watcher, 0.05, timeout=2)
+        assert changed and changed <= {inside, inside / "guide.md"}
+
+        # The moved-out directory is no longer watched
+        (outside / "guide.md").write_text("edited")
+        assert debounced(watcher, 0.05, timeout=0.2) == set()
+
+        outside.rename(inside)
+        debounced(watcher, 0.05, timeout=2)
+        (inside / "guide.md").unlink()
+        inside.rmdir()
+        changed = debounced(watcher, 0.05, timeout=2)
+        assert changed and changed <= {inside, inside / "guide.md"}
+
+
+@pytest.mark.parametrize("factory", BACKENDS)
+def test_watcher_file_root_filters_siblings(factory, temp_dir):
+    """A file root only reports that file, not its neighbours."""
+    target = temp_dir / "plugin.json"
+    target.write_text("{}")
+    with factory([target]) as watcher:
+        time.sleep(0.02)
+        (temp_dir / "other.json").write_text("{}")
+        assert debounced(watcher, 0.05, timeout=0.2) == set()
+        target.write_text('{"name": "x"}')
+        assert debounced(watcher, 0.05, timeout=2) == {target}
+
+
+@pytest.mark.parametrize("factory", BACKENDS)
+def test_debounce_coalesces_burst(factory, temp_dir):
+    """Writes closer together than the debounce window arrive as one batch."""
+    target = temp_dir / "SKILL.md"
+    target.write_text("0")
+    with factory([temp_dir]) as watcher:
+        time.sleep(0.02)
+        for i in range(5):
+            target.write_text(str(i) * (i + 2))
+            time.sleep(0.01)
+        assert debounced(watcher, 0.1, timeout=2) == {target}
+        assert debounced(watcher, 0.05, timeout=0.1) == set()
+
+
+def test_open_watcher_force_polling(temp_dir):
+    """force_polling always selects the portable backend."""
+    with open_watcher([temp_dir], force_polling=True) as watcher:
+        assert isinstance(watcher, PollingWatcher)
@@ -0,0 +1,55 @@
+"""Tests for shared/language_stats.py"""
+import random
+
+from language_stats import classify_file, language_stats
+
+
+def _write(path, size):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+
+
+def test_classify_file():
+    """Known names and extensions map to languages; data and prose are not counted."""
+    assert classify_file("main.PY") == "Python"
+    assert classify_file("Makefile") == "Makefile"
+    assert classify_file("app.component.tsx") == "TSX"
+    assert classify_file("README.md") is None
+    assert classify_file(".bashrc") is None
+
+
+def test_exact_breakdown(temp_dir):
+    """Small trees are walked exactly, skipping hidden and dependency directories."""
+    _write(temp_dir / "src" / "app.py", 600)
+    _write(temp_dir / "src" / "util.py", 200)
+    _write(temp_dir / "web" / "index.ts", 200)
+    _write(temp_dir / "web" / "node_modules" / "dep" / "index.js", 5000)
+    _write(temp_dir / ".venv" / "lib" / "six.py", 5000)
+    _write(temp_dir / "data.json", 5000)
+
+    result = language_stats(temp_dir)
+    assert result["sampled"] is False
+    assert (result["files"], result["bytes"]) == (3, 1000)
+    assert result["languages"] == [
+        {"language": "Python", "files": 2, "bytes": 800, "percent": 80.0},
+        {"language": "TypeScript", "files": 1, "bytes": 200, "percent": 20.0},
+    ]
+
+
+def test_sampled_estimate_is_close(temp_dir):
+    """Past max_files the breakdown is estimated from random walks."""
+    rng = random.Random(7)
+    for a in range(12):
+        for b in range(rng.randint(1, 6)):
+            for c in range(rng.randint(0, 20)):
+                ext = rng.choice([".py", ".py", ".go"])
+                _write(temp_dir / f"a{a}" / f"b{b}" / f"f{c}{ext}", rng.randint(10, 500))
+
+    exact = language_stats(temp_dir)
+    sampled = language_stats(temp_dir, time_budget=0.3, max_files=0, seed=1)
+    assert sampled["sampled"] is True and sampled["samples"] >= 32
+    estimates = {lang["language"]: lang for lang in sampled["languages"]}
+    for lang in exact["languages"]:
+        estimate = estimates[lang["language"]]
+        assert abs(estimate["percent"] - lang["percent"]) < 5
+        assert abs(estimate["files"] - lang["files"]) < 0.15 * lang["files"]
@@ -1,7 +1,7 @@
 """Tests for shared/repo_utils.py"""
 from pathlib import Path
 
-from repo_utils import find_repos
+from repo_utils import find_repos, list_repo_files
 
 
 def test_find_repos_empty_dir(temp_dir):
@@ -56,3 +56,19 @@ def test_find_repos_multiple(temp_dir):
     assert len(repos) == 3
     names = [r.name for r in repos]
     assert names == ["repo-alpha", "repo-beta", "repo-gamma"]
+
+
+def test_list_repo_files_respects_gitignore(mock_repo):
+    """Lists files outside ignored paths, honouring nested .gitignore and info/exclude."""
+    (mock_repo / ".git" / "info").mkdir()
+    (mock_repo / ".git" / "info" / "exclude").write_text("*.local\n")
+    (mock_repo / ".gitignore").write_text("build/\n*.log\n")
+    for rel in ["src/main.py", "src/debug.log", "build/out.bin", "app.local", "docs/a.md"]:
+        (mock_repo / rel).parent.mkdir(parents=True, exist_ok=True)
+        (mock_repo / rel).write_text("x")
+    (mock_repo / "docs" / ".gitignore").write_text("*.md\n!keep.md\n")
+    (mock_repo / "docs" / "keep.md").write_text("x")
+
+    assert list_repo_files(mock_repo) == [
+        Path(".gitignore"), Path("docs/.gitignore"), Path("docs/keep.md"), Path("src/main.py")
+    ]
@@ -0,0 +1,171 @@
+"""Tests for shared/skill_lsp.py"""
+import io
+import time
+
+import skill_lsp
+from skill_lsp import (
+    SkillLanguageServer,
+    apply_change,
+    read_message,
+    serve,
+    write_message,
+)
+
+
+def _open(server, skill_dir):
+    uri = (skill_dir / "SKILL.md").as_uri()
+    text = (skill_dir / "SKILL.md").read_text()
+    replies = server.handle({"jsonrpc": "2.0", "method": "textDocument/didOpen", "params": {
+        "textDocument": {"uri": uri, "languageId": "markdown", "version": 1, "text": text}
+    }})
+    return uri, replies[0]["params"]["diagnostics"]
+
+
+def _edit(server, uri, line, start, end, text):
+    replies = server.handle({"jsonrpc": "2.0", "method": "textDocument/didChange", "params": {
+        "textDocument": {"uri": uri, "version": 2},
+        "contentChanges": [{
+            "range": {"start": {"line": line, "character": start},
+                      "end": {"line": line, "character": end}},
+            "text": text,
+        }],
+    }})
+    return replies[0]["params"]["diagnostics"]
+
+
+def test_message_framing_roundtrip():
+    """Messages survive Content-Length framing."""
+    stream = io.BytesIO()
+    write_message(stream, {"jsonrpc": "2.0", "id": 1, "result": "é"})
+    stream.seek(0)
+    assert read_message(stream) == {"jsonrpc": "2.0", "id": 1, "result": "é"}
+    assert read_message(stream) is None
+
+
+def test_apply_change_uses_utf16_offsets():
+    """Ranged edits count characters in UTF-16 code units."""
+    text = "a😀b\nsecond\n"
+    change = {"range": {"start": {"line": 0, "character": 3},
+                        "end": {"line": 1, "character": 3}}, "text": "X"}
+    assert apply_change(text, change) == "a😀Xond\n"
+    assert apply_change(text, {"text": "whole"}) == "whole"
+
+
+def test_unsaved_edit_publishes_diagnostics(make_skill):
+    """Edits are validated from the buffer, with issues located on their line."""
+    skill_dir = make_skill("demo")
+    server = SkillLanguageServer()
+    uri, diagnostics = _open(server, skill_dir)
+    assert not [d for d in diagnostics if d["severity"] == 1]
+
+    diagnostics = _edit(server, uri, 1, 6, 10, "Demo_Bad")
+    name_errors = [d for d in diagnostics if d.get("code") == "name"]
+    assert name_errors and name_errors[0]["range"]["start"]["line"] == 1
+    assert "Demo_Bad" not in (skill_dir / "SKILL.md").read_text()
+
+
+def test_body_edit_reruns_only_body_rules(make_skill, monkeypatch):
+    """A body-only edit re-runs body rules and keeps the rest of the result."""
+    skill_dir = make_skill("demo", body="# Skill\n\nSee [x](missing.md).\n")
+    server = SkillLanguageServer()
+    uri, diagnostics = _open(server, skill_dir)
+    assert [d["code"] for d in diagnostics if d["severity"] == 2] == ["referenced-files"]
+
+    calls = []
+    original = skill_lsp.validate_skill
+
+    def spy(*args, **kwargs):
+        calls.append(kwargs.get("inputs"))
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(skill_lsp, "validate_skill", spy)
+    lines = (skill_dir / "SKILL.md").read_text().split("\n")
+    line = lines.index("See [x](missing.md).")
+    diagnostics = _edit(server, uri, line, 8, 18, "SKILL.md")
+    assert calls == [{"body"}]
+    assert not [d for d in diagnostics if d.get("code") == "referenced-files"]
+
+
+def test_serve_session(make_skill):
+    """A stdio session initializes, publishes on open and exits cleanly."""
+    skill_dir = make_skill("demo")
+    uri = (skill_dir / "SKILL.md").as_uri()
+    requests = io.BytesIO()
+    for message in [
+        {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}},
+        {"jsonrpc": "2.0", "method": "initialized", "params": {}},
+        {"jsonrpc": "2.0", "method": "textDocument/didOpen", "params": {"textDocument": {
+            "uri": uri, "languageId": "markdown", "version": 1,
+            "text": (skill_dir / "SKILL.md").read_text(),
+        }}},
+        {"jsonrpc": "2.0", "id": 2, "method": "unknown/method"},
+        {"jsonrpc": "2.0", "id": 3, "method": "shutdown"},
+        {"jsonrpc": "2.0", "method": "exit"},
+    ]:
+        write_message(requests, message)
+    requests.seek(0)
+    responses = io.BytesIO()
+
+    assert serve(SkillLanguageServer(), requests, responses) == 0
+    responses.seek(0)
+    replies = []
+    while (reply := read_message(responses)) is not None:
+        replies.append(reply)
+    assert replies[0]["result"]["capabilities"]["textDocumentSync"]["change"] == 2
+    assert replies[1]["method"] == "textDocument/publishDiagnostics"
+    assert replies[2]["error"]["code"] == -32601
+    assert replies[3] == {"jsonrpc": "2.0", "id": 3, "result": None}
+
+
+def test_serve_survives_malformed_messages(make_skill):
+    """Bad messages get error replies or are logged, and the server keeps answering."""
+    uri = (make_skill("demo") / "SKILL.md").as_uri()
+    requests = io.BytesIO()
+    for message in [
+        {"jsonrpc": "2.0", "method": "textDocument/didOpen", "params": {
+            "textDocument": {"uri": uri, "languageId": "markdown", "version": 1}
+        }},
+        {"jsonrpc": "2.0", "id": 1, "method": "initialize",
+         "params": {"initializationOptions": {"disable": 5}}},
+        {"jsonrpc": "2.0", "id": 2, "method": "initialize", "params": {}},
+    ]:
+        write_message(requests, message)
+    requests.write(b"Content-Length: 5\r\n\r\n{oops")
+    write_message(requests, {"jsonrpc": "2.0", "id": 3, "method": "shutdown"})
+    requests.seek(0)
+    responses = io.BytesIO()
+
+    assert serve(SkillLanguageServer(), requests, responses) == 0
+    responses.seek(0)
+    replies = []
+    while (reply := read_message(responses)) is not None:
+        replies.append(reply)
+    assert replies[0]["error"]["code"] == -32602
+    assert "capabilities" in replies[1]["result"]
+    assert replies[2]["error"]["code"] == -32700
+    assert replies[3] == {"jsonrpc": "2.0", "id": 3, "result": None}
+
+
+def test_hooks_run_off_the_message_loop(make_skill):
+    """With a notify channel, a slow hook is published later instead of blocking didOpen."""
+    skill_dir = make_skill("demo")
+    (skill_dir / "scripts").mkdir()
+    (skill_dir / "scripts" / "validate_hook.py").write_text(
+        "import json, time\ntime.sleep(0.5)\n"
+        "print(json.dumps({'issues': [{'severity': 'WARNING', 'file_path': 'x',"
+        " 'field': 'hook', 'message': 'from hook'}]}))\n"
+    )
+    published = []
+    server = SkillLanguageServer(notify=published.append)
+
+    start = time.monotonic()
+    uri, diagnostics = _open(server, skill_dir)
+    assert time.monotonic() - start < 0.5
+    assert not any("from hook" in d["message"] for d in diagnostics)
+
+    deadline = time.monotonic() + 10
+    while not published and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert published[0]["params"]["uri"] == uri
+    hook = [d for d in published[0]["params"]["diagnostics"] if d.get("code") == "hook"]
+    assert [d["message"] for d in hook] == ["x: [hook] from hook"]
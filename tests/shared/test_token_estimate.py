@@ -0,0 +1,49 @@
+"""Tests for shared/token_estimate.py"""
+from token_estimate import TokenEstimator, estimate_tokens_uncached
+
+PROSE = (
+    "Use this skill when the user asks for a summary of a long document. "
+    "Read the file, find the main points and write them as a short list.\n"
+)
+
+
+def test_prose_is_about_four_characters_per_token():
+    """English prose estimates land near the usual BPE ratio."""
+    text = PROSE * 50
+    ratio = len(text) / estimate_tokens_uncached(text.encode())
+    assert 3.5 <= ratio <= 6
+
+
+def test_dense_text_costs_more():
+    """Code, digits and non-ASCII text get fewer characters per token than prose."""
+    prose_ratio = len(PROSE) / estimate_tokens_uncached(PROSE.encode())
+    for text in [
+        "def f(x):\n    return {'k': [x[0], x[1:]]}\n",
+        "2024-01-15 12:30:45 1234567890 3.14159\n",
+        "日本語のテキストを要約してください。\n",
+    ]:
+        assert len(text) / estimate_tokens_uncached(text.encode()) < prose_ratio, text
+
+
+def test_estimate_grows_with_content():
+    """Longer content never estimates fewer tokens."""
+    assert estimate_tokens_uncached(b"") == 0
+    assert estimate_tokens_uncached(b"word") == 1
+    assert estimate_tokens_uncached((PROSE * 2).encode()) > estimate_tokens_uncached(PROSE.encode())
+
+
+def test_estimator_caches_by_content():
+    """Equal content is estimated once, whether passed as str or bytes."""
+    estimator = TokenEstimator()
+    first = estimator.estimate(PROSE)
+    assert estimator.estimate(PROSE.encode()) == first
+    assert (estimator.hits, estimator.misses) == (1, 1)
+
+
+def test_estimator_cache_is_bounded():
+    """The oldest entries are evicted once the cache is full."""
+    estimator = TokenEstimator(max_entries=2)
+    for text in ["a", "b", "c"]:
+        estimator.estimate(text)
+    estimator.estimate("a")
+    assert estimator.misses == 4
@@ -0,0 +1,100 @@
+"""Tests for shared/tree_walk.py"""
+import os
+import shutil
+import subprocess
+
+import pytest
+from fs_snapshot import DirectorySnapshot
+from tree_walk import IgnoreRules, IgnoreStack, walk
+
+ROOT_GITIGNORE = """\
+# comment
+*.log
+!important.log
+/root_only.txt
+build/
+docs/**/*.tmp
+**/cache
+a/**/b
+foo?.py
+[abc]x.txt
+logs/*
+!logs/keep/
+\\#hash
+"""
+
+FILES = [
+    "app.log", "important.log", "src/deep/err.log", "root_only.txt", "src/root_only.txt",
+    "build/x.js", "src/build/y.js", "docs/x.tmp", "docs/a/b/x.tmp", "docs/x.md",
+    "cache/c1", "src/cache/c2", "a/b/f", "a/x/y/b/f", "a/c/f", "foo1.py", "foo10.py",
+    "ax.txt", "dx.txt", "logs/today.txt", "logs/keep/k.txt", "#hash", "src/main.py",
+    "pkg/.gitignore", "pkg/gen/out.py", "pkg/src/gen/kept.py", "pkg/dist.txt",
+]
+PKG_GITIGNORE = "/gen/\n*.txt\n!dist.txt\n"
+
+
+def _files(root, gitignore=True):
+    return sorted(
+        os.path.relpath(entry.path, root).replace(os.sep, "/")
+        for _, _, files, _ in walk(root, gitignore=gitignore)
+        for entry in files
+    )
+
+
+def _make_tree(root):
+    for rel in FILES:
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).write_text("x")
+    (root / ".gitignore").write_text(ROOT_GITIGNORE)
+    (root / "pkg" / ".gitignore").write_text(PKG_GITIGNORE)
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_walk_matches_git(temp_dir):
+    """The walk lists exactly what git reports as untracked and not ignored."""
+    _make_tree(temp_dir)
+    subprocess.run(["git", "init", "-q"], cwd=temp_dir, check=True)
+    out = subprocess.run(
+        ["git", "ls-files", "--others", "--exclude-standard", "-z"],
+        cwd=temp_dir, check=True, capture_output=True, text=True
+    ).stdout
+    assert _files(temp_dir) == sorted(path for path in out.split("\0") if path)
+
+
+def test_last_match_wins():
+    """Later patterns override earlier ones, including across negations."""
+    rules = IgnoreRules(["*.txt", "!keep*.txt", "keep-not.txt"])
+    assert rules.match("a.txt", "a.txt", False) is True
+    assert rules.match("keep.txt", "keep.txt", False) is False
+    assert rules.match("keep-not.txt", "keep-not.txt", False) is True
+    assert rules.match("a.py", "a.py", False) is None
+    assert len(rules.groups) == 3
+
+
+def test_stack_applies_ancestor_rules(temp_dir):
+    """Walking a subdirectory still applies the repository's outer .gitignore files."""
+    (temp_dir / ".git" / "info").mkdir(parents=True)
+    (temp_dir / ".git" / "info" / "exclude").write_text("*.secret\n")
+    (temp_dir / ".gitignore").write_text("*.tmp\n")
+    sub = temp_dir / "sub"
+    sub.mkdir()
+    for name in ["a.py", "b.tmp", "c.secret"]:
+        (sub / name).write_text("x")
+    assert len(IgnoreStack.for_directory(sub).levels) == 2
+    assert _files(sub) == ["a.py"]
+
+
+def test_ignored_directories_are_not_listed(temp_dir):
+    """Pruned subtrees are never scanned, and the caller can prune further."""
+    (temp_dir / ".gitignore").write_text("node_modules/\n")
+    for rel in ["node_modules/x/y/z.js", "src/a/b.py", "vendor/v.py"]:
+        (temp_dir / rel).parent.mkdir(parents=True, exist_ok=True)
+        (temp_dir / rel).write_text("x")
+    snapshot = DirectorySnapshot()
+    walked = []
+    for directory, dirs, _, _ in walk(temp_dir, snapshot):
+        walked.append(os.path.relpath(directory, temp_dir))
+        dirs[:] = [entry for entry in dirs if entry.name != "vendor"]
+    assert walked == [".", "src", os.path.join("src", "a")]
+    assert snapshot.scans == 3
+    assert "node_modules/x/y/z.js" in _files(temp_dir, gitignore=False)
@@ -0,0 +1,953 @@
+"""Tests for shared/validate_skill.py"""
+import asyncio
+import io
+import json
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from fs_snapshot import DirectorySnapshot
+from validate_skill import (
+    RULES,
+    GitError,
+    HookPool,
+    JsonWriter,
+    MarketplaceIndex,
+    NdjsonWriter,
+    OutputWriter,
+    ReferenceFile,
+    ReferenceIndex,
+    RunSummary,
+    SarifWriter,
+    Severity,
+    SkillDocument,
+    TokenBudget,
+    TokenPatterns,
+    ValidationIssue,
+    ValidationResult,
+    changed_skills,
+    classify_change,
+    compute_skill_hash,
+    discover_skills,
+    get_marketplace_index,
+    iter_validate_skills,
+    lex_markdown,
+    load_skill_document,
+    merge_revalidation,
+    resolve_link,
+    run_validation_hook,
+    run_validation_hook_async,
+    run_validation_hooks,
+    select_rules,
+    skills_for_paths,
+    suggest_instruction_optimization,
+    suggest_no_deeply_nested_references,
+    suggest_time_sensitive_language,
+    suggest_toc_for_long_references,
+    validate_no_windows_paths,
+    validate_plugin_json,
+    validate_referenced_files_exist,
+    validate_script_paths_use_skill_dir,
+    validate_skill,
+    validate_skill_cached,
+    validate_skills,
+    validate_token_budget,
+    validate_version_sync,
+    watch_skills,
+)
+
+
+def test_validate_skill_passes(make_skill):
+    """A well-formed plugin skill passes validation."""
+    result = validate_skill(make_skill("pdf-reader"))
+    assert result.passed
+    assert result.skill_name == "pdf-reader"
+
+
+def test_validate_skill_missing_skill_md(temp_dir):
+    """Missing SKILL.md is reported as an error."""
+    result = validate_skill(temp_dir)
+    assert not result.passed
+    assert result.issues[0].field == "SKILL.md"
+
+
+def test_validate_skill_version_mismatch(make_skill):
+    """Version drift between SKILL.md and plugin.json is an error."""
+    skill_dir = make_skill("pdf-reader")
+    skill_md = skill_dir / "SKILL.md"
+    skill_md.write_text(skill_md.read_text().replace('"1.0.0"', '"1.0.1"'))
+    result = validate_skill(skill_dir)
+    assert any(i.field == "version" and i.severity == Severity.ERROR for i in result.issues)
+
+
+def test_validate_skill_non_string_fields(make_skill):
+    """List or mapping values for string fields are errors, not crashes."""
+    skill_dir = make_skill("pdf-reader")
+    skill_md = skill_dir / "SKILL.md"
+    skill_md.write_text(
+        "---\nname:\n  - pdf-reader\ndescription:\n  text: Reads PDFs\n"
+        "compatibility:\n  - linux\nmetadata:\n  version:\n    - 1.0.0\n---\n# PDF\n"
+    )
+    result = validate_skill(skill_dir, suggest=True)
+    errors = {i.field: i.message for i in result.issues if i.severity == Severity.ERROR}
+    assert errors["name"] == "'name' must be a string, got list"
+    assert errors["description"] == "'description' must be a string, got dict"
+    assert errors["compatibility"] == "'compatibility' must be a string, got list"
+    assert errors["version"] == "'metadata.version' must be a string, got list"
+
+
+def test_discover_skills(make_skill, temp_dir):
+    """Discovers plugin and project-level skills under a root."""
+    make_skill("pdf-reader")
+    make_skill("csv-reader")
+    project_skill = temp_dir / ".claude" / "skills" / "local-skill"
+    project_skill.mkdir(parents=True)
+    (project_skill / "SKILL.md").write_text("---\nname: local-skill\n---\n")
+
+    names = [p.name for p in discover_skills(temp_dir)]
+    assert sorted(names) == ["csv-reader", "local-skill", "pdf-reader"]
+
+
+def test_discover_skills_empty(temp_dir):
+    """Root without skills yields nothing."""
+    assert discover_skills(temp_dir) == []
+
+
+def test_skills_for_paths(make_skill, temp_dir):
+    """Changed files map to the skills, plugins and marketplace entries they affect."""
+    pdf = make_skill("pdf-reader").resolve()
+    csv = make_skill("csv-reader").resolve()
+    project = temp_dir / ".claude" / "skills" / "local"
+    project.mkdir(parents=True)
+    (project / "SKILL.md").write_text("---\nname: local\n---\n")
+    project = project.resolve()
+
+    reference = "plugins/pdf-reader/skills/pdf-reader/references/a.md"
+    assert skills_for_paths(temp_dir, [reference]) == [pdf]
+    assert skills_for_paths(temp_dir, ["plugins/csv-reader/.claude-plugin/plugin.json"]) == [csv]
+    assert skills_for_paths(temp_dir, [".claude/skills/local/SKILL.md", "README.md"]) == [project]
+    # Deleted skills are dropped
+    assert skills_for_paths(temp_dir, ["plugins/gone/skills/gone/SKILL.md"]) == []
+    # marketplace.json: only the plugins whose entries changed, or every plugin skill
+    marketplace = [".claude-plugin/marketplace.json"]
+    assert skills_for_paths(temp_dir, marketplace, lambda: {"csv-reader"}) == [csv]
+    assert skills_for_paths(temp_dir, marketplace) == sorted([pdf, csv])
+
+
+def _git(cwd, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=cwd, check=True, capture_output=True
+    )
+
+
+def test_changed_skills_git(make_skill, temp_dir):
+    """--changed-since diffs once against a ref and revalidates changed marketplace entries."""
+    pdf = make_skill("pdf-reader").resolve()
+    csv = make_skill("csv-reader").resolve()
+    _git(temp_dir, "init", "-q")
+    _git(temp_dir, "add", ".")
+    _git(temp_dir, "commit", "-q", "-m", "base")
+    assert changed_skills(temp_dir, "HEAD") == []
+
+    marketplace = temp_dir / ".claude-plugin" / "marketplace.json"
+    data = json.loads(marketplace.read_text())
+    data["plugins"][1]["version"] = "2.0.0"
+    marketplace.write_text(json.dumps(data))
+    assert changed_skills(temp_dir, "HEAD") == [csv]
+
+    (pdf / "SKILL.md").write_text((pdf / "SKILL.md").read_text() + "More.\n")
+    assert changed_skills(temp_dir, "HEAD") == sorted([pdf, csv])
+
+    with pytest.raises(GitError):
+        changed_skills(temp_dir, "no-such-ref")
+
+
+def test_validate_skills_parallel_matches_serial(make_skill):
+    """Process pool results match in-process results, in input order."""
+    paths = [make_skill(name) for name in ["alpha-reader", "beta-reader", "gamma-reader"]]
+    (paths[1] / "SKILL.md").write_text("no frontmatter")
+
+    serial = validate_skills(paths, jobs=1)
+    parallel = validate_skills(paths, jobs=3)
+
+    assert [r.skill_name for r in parallel] == ["alpha-reader", "beta-reader", "gamma-reader"]
+    assert [r.passed for r in parallel] == [True, False, True]
+    assert [r.issues for r in parallel] == [r.issues for r in serial]
+
+
+def test_compute_skill_hash_tracks_content(make_skill):
+    """Hash changes when skill files, references or the suggest flag change."""
+    skill_dir = make_skill("pdf-reader")
+    first = compute_skill_hash(skill_dir)
+    assert compute_skill_hash(skill_dir) == first
+    assert compute_skill_hash(skill_dir, suggest=True) != first
+
+    (skill_dir / "references").mkdir()
+    (skill_dir / "references" / "guide.md").write_text("# Guide\n")
+    assert compute_skill_hash(skill_dir) != first
+
+
+def test_compute_skill_hash_tracks_marketplace(make_skill, temp_dir):
+    """Hash changes when marketplace.json changes."""
+    skill_dir = make_skill("pdf-reader")
+    first = compute_skill_hash(skill_dir)
+    marketplace = temp_dir / ".claude-plugin" / "marketplace.json"
+    marketplace.write_text(marketplace.read_text().replace("1.0.0", "2.0.0"))
+    assert compute_skill_hash(skill_dir) != first
+
+
+def test_validate_skill_cached_roundtrip(make_skill, temp_dir):
+    """Cached results are reused until the skill changes."""
+    skill_dir = make_skill("pdf-reader")
+    cache_dir = temp_dir / "cache"
+    skill_md = skill_dir / "SKILL.md"
+    skill_md.write_text(skill_md.read_text().replace('"1.0.0"', '"1.0.1"'))
+
+    first = validate_skill_cached(skill_dir, cache_dir=cache_dir)
+    assert not first.passed
+    assert len(list(cache_dir.glob("*.json"))) == 1
+
+    second = validate_skill_cached(skill_dir, cache_dir=cache_dir)
+    assert second.issues == first.issues
+    assert second.token_counts == first.token_counts != {}
+
+    skill_md.write_text(skill_md.read_text().replace('"1.0.1"', '"1.0.0"'))
+    third = validate_skill_cached(skill_dir, cache_dir=cache_dir)
+    assert third.passed
+    assert len(list(cache_dir.glob("*.json"))) == 2
+
+
+def test_validate_skill_cached_tracks_external_links(make_skill, temp_dir):
+    """A link target outside the skill invalidates the entry when it appears."""
+    skill_dir = make_skill("pdf-reader", body="See [shared](../../shared.md).\n")
+    cache_dir = temp_dir / "cache"
+
+    def broken_links():
+        result = validate_skill_cached(skill_dir, cache_dir=cache_dir)
+        return [i.message for i in result.issues if i.rule == "referenced-files"]
+
+    assert broken_links() == ["Referenced file does not exist: '../../shared.md'"]
+    (skill_dir.parent.parent / "shared.md").write_text("# Shared\n")
+    assert broken_links() == []
+
+
+def test_validate_skill_cached_reruns_hooks(make_skill, temp_dir):
+    """Hook output is never served from the cache."""
+    skill_dir = _write_hook(make_skill("pdf-reader"), """
+import json, pathlib, sys
+message = (pathlib.Path(sys.argv[1]).parent / "state.txt").read_text()
+print(json.dumps({"issues": [
+    {"severity": "WARNING", "file_path": "x", "field": "x", "message": message}
+]}))
+""")
+    state = skill_dir.parent / "state.txt"
+    cache_dir = temp_dir / "cache"
+    for message in ("first", "second"):
+        state.write_text(message)
+        result = validate_skill_cached(skill_dir, cache_dir=cache_dir)
+        assert [i.message for i in result.issues if i.rule == "hook"] == [message]
+    assert len(list(cache_dir.glob("*.json"))) == 1
+    assert "first" not in next(cache_dir.glob("*.json")).read_text()
+
+
+def test_validate_token_budget():
+    """SKILL.md and each reference are checked against token thresholds."""
+    budget = TokenBudget(skill_warn=100, skill_error=200, reference_warn=50)
+    assert validate_token_budget({"SKILL.md": 100, "references/a.md": 50}, "x", budget) == []
+
+    issues = validate_token_budget({"SKILL.md": 150, "references/a.md": 51}, "x", budget)
+    assert [(i.severity, "references/a.md" in i.message) for i in issues] == [
+        (Severity.WARNING, False), (Severity.WARNING, True)
+    ]
+    issues = validate_token_budget({"SKILL.md": 201}, "x", budget)
+    assert [i.severity for i in issues] == [Severity.ERROR]
+
+
+def test_validate_token_budget_defers_to_character_budget(make_skill):
+    """An oversize SKILL.md gets one issue, not one per size rule."""
+    def severities(tokens, char_count):
+        issues = validate_token_budget({"SKILL.md": tokens}, "x", char_count=char_count)
+        return [i.severity for i in issues]
+
+    assert severities(4098, 12500) == []
+    assert severities(3000, 12500) == []
+    assert severities(3000, 9000) == []
+    assert severities(4098, 9000) == [Severity.ERROR]
+    assert severities(4098, 5000) == [Severity.ERROR]
+    assert severities(3000, 5000) == [Severity.WARNING]
+    assert severities(3000, None) == [Severity.WARNING]
+
+    skill_dir = make_skill("pdf-reader", body="Read the PDF and summarize it.\n" * 600)
+    result = validate_skill(skill_dir)
+    budget_issues = [
+        (i.rule, i.severity) for i in result.issues
+        if i.rule in ("character-budget", "token-budget")
+    ]
+    assert budget_issues == [("character-budget", Severity.ERROR)]
+
+    result = validate_skill(skill_dir, disabled=frozenset({"character-budget"}))
+    assert [i.severity for i in result.issues if i.rule == "token-budget"] == [Severity.ERROR]
+
+
+def test_validate_skill_reports_token_counts(make_skill):
+    """Results carry token estimates per file; the budget is configurable."""
+    skill_dir = make_skill("pdf-reader", body="Read the PDF and summarize it.\n" * 40)
+    (skill_dir / "references").mkdir()
+    (skill_dir / "references" / "guide.md").write_text("# Guide\n")
+
+    result = validate_skill(skill_dir)
+    assert set(result.token_counts) == {"SKILL.md", "references/guide.md"}
+    assert not [i for i in result.issues if i.rule == "token-budget"]
+
+    tight = TokenBudget(skill_warn=10, skill_error=20)
+    result = validate_skill(skill_dir, budget=tight)
+    assert [i.severity for i in result.issues if i.rule == "token-budget"] == [Severity.ERROR]
+
+
+def test_validate_skill_cached_ignores_corrupt_entry(make_skill, temp_dir):
+    """Corrupt cache entries are treated as misses."""
+    skill_dir = make_skill("pdf-reader")
+    cache_dir = temp_dir / "cache"
+    cache_dir.mkdir()
+    (cache_dir / f"{compute_skill_hash(skill_dir)}.json").write_text("{not json")
+
+    assert validate_skill_cached(skill_dir, cache_dir=cache_dir).passed
+
+
+def test_load_skill_document(make_skill):
+    """SkillDocument exposes frontmatter, body position and references."""
+    skill_dir = make_skill("pdf-reader", body="# Title\n\nText.\n")
+    (skill_dir / "references").mkdir()
+    (skill_dir / "references" / "guide.md").write_text("# Guide\n")
+    (skill_dir / "references" / "data.csv").write_text("a,b\n")
+
+    doc = load_skill_document(skill_dir)
+    assert doc.frontmatter["name"] == "pdf-reader"
+    assert doc.body.startswith("# Title")
+    assert doc.text.splitlines()[doc.body_start_line - 1] == "# Title"
+    assert doc.char_count == len(doc.raw.decode())
+    assert list(doc.references) == ["references/guide.md"]
+    assert doc.has_references_content
+
+
+def test_skill_document_line_at():
+    """Character offsets map to 1-based line numbers."""
+    doc = SkillDocument.from_text(Path("/nonexistent"), "---\nname: x\n---\nbody\n")
+    assert doc.line_at(0) == 1
+    assert doc.line_at(doc.text.index("body")) == 4
+    assert doc.body_start_line == 4
+
+
+def test_suggest_toc_for_long_references(temp_dir):
+    """Long reference files without a TOC get a suggestion."""
+    doc = SkillDocument.from_text(temp_dir, "---\nname: x\n---\n", read_references=False)
+    doc.references = {"references/long.md": "line\n" * 150, "references/short.md": "x\n"}
+    issues = suggest_toc_for_long_references(doc, "x/SKILL.md")
+    assert len(issues) == 1
+    assert "references/long.md" in issues[0].message
+
+
+def test_suggest_no_deeply_nested_references(temp_dir):
+    """Links between reference files are flagged; links out of references/ are not."""
+    doc = SkillDocument.from_text(temp_dir, "---\nname: x\n---\n", read_references=False)
+    doc.references = {
+        "references/a.md": "See [b](b.md).",
+        "references/c.md": "See [skill](../SKILL.md).",
+    }
+    issues = suggest_no_deeply_nested_references(doc, "x/SKILL.md")
+    assert len(issues) == 1
+    assert "references/a.md" in issues[0].message
+
+
+LEXER_BODY = """# Title
+
+Intro with a [guide](references/guide.md).
+
+```bash
+uv run scripts/run.py
+```
+
+## Workflow
+1. Step one
+"""
+
+
+def test_lex_markdown_tokens():
+    """Lexer yields headings, prose, links and code with line numbers."""
+    tokens = lex_markdown(LEXER_BODY, start_line=5)
+    kinds = [(t.kind, t.line) for t in tokens]
+    assert kinds == [
+        ("heading", 5), ("prose", 7), ("link", 7), ("code", 10), ("heading", 13), ("prose", 14),
+    ]
+    code = tokens[3]
+    assert code.info == "bash"
+    assert code.text == "uv run scripts/run.py"
+    assert tokens[2].info == "references/guide.md"
+    assert tokens[4].level == 2
+
+
+def test_lex_markdown_unterminated_fence():
+    """An unclosed fence swallows the rest of the body as code."""
+    tokens = lex_markdown("```\n[x](y.md)\n# not a heading")
+    assert [t.kind for t in tokens] == ["code"]
+
+
+def test_validate_script_paths_reports_line():
+    """Bare script paths in bash blocks are flagged with their line."""
+    issues = validate_script_paths_use_skill_dir(lex_markdown(LEXER_BODY, 5), "x/SKILL.md")
+    assert len(issues) == 1
+    assert issues[0].line == 10
+    assert str(issues[0]).startswith("WARNING: x/SKILL.md:10 [body]")
+
+
+def test_validate_no_windows_paths_reports_line():
+    """Windows paths are flagged at the line they appear on."""
+    issues = validate_no_windows_paths(lex_markdown("ok\n\nsee C:\\Users\\me\n"), "x")
+    assert [i.line for i in issues] == [3]
+
+
+def test_validate_no_windows_paths_line_end_escapes():
+    """A trailing \\word is a path only at the end of the body, not of every line."""
+    assert validate_no_windows_paths(lex_markdown("Escape \\n\nthen \\t\nok\n"), "x") == []
+    issues = validate_no_windows_paths(lex_markdown("ok\n\ncopy it to \\Temp\n"), "x")
+    assert [i.line for i in issues] == [3]
+
+
+def test_token_patterns_match_single_searches():
+    """The combined screen finds each pattern's first line like a search per pattern."""
+    tokens = lex_markdown("# Latest\nnothing\nsoon, currently\n```\nnow\n```\nnew soon\n")
+    patterns = [r'\bsoon\b', r'\bnow\b', r'\bcurrently\b', r'\blatest\b', r'\bnever\b']
+    matcher = TokenPatterns(patterns, kinds=("heading", "prose"), lowercase=True)
+    assert matcher.first_lines(tokens) == [3, None, 3, 1, None]
+
+
+def test_validate_referenced_files_exist_skips_code(temp_dir):
+    """Links are checked in prose only, not inside code blocks."""
+    body = "[a](missing.md)\n```\n[b](also-missing.md)\n```\n"
+    issues = validate_referenced_files_exist(temp_dir, lex_markdown(body), "x")
+    assert [i.line for i in issues] == [1]
+    assert "missing.md" in issues[0].message
+
+
+def test_validate_referenced_files_exist_lists_each_directory_once(temp_dir):
+    """Links into the same directory are answered from one listing."""
+    (temp_dir / "scripts").mkdir()
+    (temp_dir / "scripts" / "a.py").touch()
+    body = "[a](scripts/a.py) [b](scripts/b.py) [c](scripts/c.py) [d](README.md)\n"
+    files = DirectorySnapshot()
+    issues = validate_referenced_files_exist(temp_dir, lex_markdown(body), "x", files)
+    assert [i.message.split("'")[1] for i in issues] == [
+        "scripts/b.py", "scripts/c.py", "README.md"
+    ]
+    assert files.scans == 2
+
+
+def test_suggest_time_sensitive_language_ignores_code():
+    """Time-sensitive words in code blocks are not flagged."""
+    assert suggest_time_sensitive_language(lex_markdown("```\nnpm i pkg@latest\n```\n"), "x") == []
+    issues = suggest_time_sensitive_language(lex_markdown("text\nThis is currently true\n"), "x")
+    assert issues[0].line == 2
+
+
+def test_suggest_instruction_optimization_workflow_steps():
+    """Workflow headings and numbered steps are read from tokens, not raw text."""
+    def workflow_lines(body):
+        issues = suggest_instruction_optimization(lex_markdown(body), 10, "x")
+        return [i.line for i in issues if i.message.startswith("Workflow section")]
+
+    # Headings of any level starting with "workflow"; steps on prose lines
+    assert workflow_lines("intro\n### Workflow\n  1. Do it\n") == []
+    assert workflow_lines("intro\n#### Workflow steps\n- a\n") == [2]
+    # Changed from the substring checks: "# workflow" in code is not a section...
+    assert workflow_lines("Run:\n```bash\n# workflow setup\nmake\n```\n") == []
+    # ...and numbered lines in code are not steps
+    assert workflow_lines("## Workflow\n```\n1. step\n```\n") == [1]
+
+
+SUBPROCESS_HOOK = """
+import json, sys
+print(json.dumps({"issues": [
+    {"severity": "WARNING", "file_path": "config.json", "field": "x", "message": "from subprocess"}
+]}))
+"""
+
+WARM_HOOK = """
+import os
+WARM_HOOK = True
+CALLS = 0
+
+def validate(skill_path, suggest):
+    global CALLS
+    CALLS += 1
+    if (skill_path / "boom").exists():
+        raise RuntimeError("bad config")
+    if (skill_path / "slow").exists():
+        import time
+        time.sleep(10)
+    return [{"severity": "ERROR", "file_path": "config.json", "field": "calls",
+             "message": f"{CALLS} {os.getpid()} {suggest}"}]
+
+if __name__ == "__main__":
+    raise SystemExit("subprocess path should not be used")
+"""
+
+
+def _write_hook(skill_dir, source):
+    (skill_dir / "scripts").mkdir(parents=True, exist_ok=True)
+    (skill_dir / "scripts" / "validate_hook.py").write_text(source)
+    return skill_dir
+
+
+def test_run_validation_hook_subprocess(temp_dir):
+    """Hooks without validate() run as a subprocess, even with a pool."""
+    skill_dir = _write_hook(temp_dir, SUBPROCESS_HOOK)
+    with HookPool() as pool:
+        issues = run_validation_hook(skill_dir, hook_pool=pool)
+    assert [i.message for i in issues] == ["from subprocess"]
+
+
+def test_run_validation_hook_validate_without_marker_uses_subprocess(temp_dir):
+    """Defining validate() alone does not opt a hook into warm execution."""
+    skill_dir = _write_hook(temp_dir, SUBPROCESS_HOOK + "\ndef validate(skill_path, suggest):\n"
+                                      "    raise AssertionError('imported')\n")
+    with HookPool() as pool:
+        issues = run_validation_hook(skill_dir, hook_pool=pool)
+    assert [i.message for i in issues] == ["from subprocess"]
+
+
+def test_run_validation_hook_warm_restores_sys_path(temp_dir):
+    """A warm hook's directory is on sys.path only while that hook runs."""
+    source = (
+        "import sys\nWARM_HOOK = True\n\n"
+        "def validate(skill_path, suggest):\n"
+        "    return [{'severity': 'WARNING', 'file_path': 'x', 'field': 'path',\n"
+        "             'message': str([p for p in sys.path if 'skill-' in p])}]\n"
+    )
+    first = _write_hook(temp_dir / "skill-a", source)
+    second = _write_hook(temp_dir / "skill-b", source)
+    with HookPool() as pool:
+        run_validation_hook(first, hook_pool=pool)
+        issues = run_validation_hook(second, hook_pool=pool)
+    assert issues[0].message == str([str(second / "scripts")])
+
+
+def test_run_validation_hook_warm_reuses_worker(temp_dir):
+    """Warm hooks are imported once and called repeatedly in the same worker."""
+    skill_dir = _write_hook(temp_dir, WARM_HOOK)
+    with HookPool() as pool:
+        first = run_validation_hook(skill_dir, suggest=True, hook_pool=pool)
+        second = run_validation_hook(skill_dir, hook_pool=pool)
+
+    calls1, pid1, suggest1 = first[0].message.split()
+    calls2, pid2, suggest2 = second[0].message.split()
+    assert (calls1, calls2) == ("1", "2")
+    assert pid1 == pid2
+    assert (suggest1, suggest2) == ("True", "False")
+    assert first[0].severity == Severity.ERROR
+
+
+def test_run_validation_hook_warm_exception(temp_dir):
+    """Exceptions raised by warm hooks become hook errors."""
+    skill_dir = _write_hook(temp_dir, WARM_HOOK)
+    (skill_dir / "boom").touch()
+    with HookPool() as pool:
+        issues = run_validation_hook(skill_dir, hook_pool=pool)
+    assert issues[0].field == "hook"
+    assert "RuntimeError: bad config" in issues[0].message
+
+
+def test_run_validation_hook_warm_timeout_replaces_worker(temp_dir):
+    """A timed-out warm worker is killed and a fresh one serves the next call."""
+    skill_dir = _write_hook(temp_dir, WARM_HOOK)
+    (skill_dir / "slow").touch()
+    with HookPool() as pool:
+        issues = run_validation_hook(skill_dir, timeout=0.5, hook_pool=pool)
+        assert issues[0].severity == Severity.WARNING
+        assert "timed out" in issues[0].message
+
+        (skill_dir / "slow").unlink()
+        issues = run_validation_hook(skill_dir, hook_pool=pool)
+        assert issues[0].message.startswith("1 ")
+
+
+SLEEP_HOOK = """
+import json, time
+time.sleep(0.5)
+print(json.dumps({"issues": []}))
+"""
+
+
+def test_run_validation_hooks_concurrent(temp_dir):
+    """Hooks overlap up to the concurrency limit and keep input order."""
+    skills = [
+        _write_hook(temp_dir / name, SUBPROCESS_HOOK if name == "c" else SLEEP_HOOK)
+        for name in ["a", "b", "c", "d"]
+    ]
+    (temp_dir / "no-hook").mkdir()
+    skills.append(temp_dir / "no-hook")
+
+    start = time.monotonic()
+    results = asyncio.run(run_validation_hooks(skills, concurrency=4))
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 1.4
+    assert [len(r) for r in results] == [0, 0, 1, 0, 0]
+    assert results[2][0].message == "from subprocess"
+
+
+def test_run_validation_hook_async_timeout(temp_dir):
+    """Async hooks past their timeout are killed and reported."""
+    skill_dir = _write_hook(temp_dir, "import time\ntime.sleep(10)\n")
+    start = time.monotonic()
+    issues = asyncio.run(run_validation_hook_async(skill_dir, timeout=0.3))
+    assert time.monotonic() - start < 5
+    assert "timed out" in issues[0].message
+
+
+def test_run_validation_hook_async_cancel(temp_dir):
+    """Cancelling a running hook kills its subprocess."""
+    skill_dir = _write_hook(temp_dir, "import time\ntime.sleep(10)\n")
+
+    async def cancel_soon():
+        task = asyncio.create_task(run_validation_hook_async(skill_dir))
+        await asyncio.sleep(0.3)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            return True
+        return False
+
+    start = time.monotonic()
+    assert asyncio.run(cancel_soon())
+    assert time.monotonic() - start < 5
+
+
+def test_validate_skills_runs_deferred_hooks(make_skill):
+    """Batch validation merges hook issues into each skill's result."""
+    with_hook = _write_hook(make_skill("alpha-reader"), SUBPROCESS_HOOK)
+    without_hook = make_skill("beta-reader")
+
+    for jobs in (1, 2):
+        results = validate_skills([with_hook, without_hook], jobs=jobs)
+        assert [i.message for i in results[0].issues] == ["from subprocess"]
+        assert results[1].issues == []
+        assert not any(r.hooks_deferred for r in results)
+
+
+def test_validate_skills_keeps_hook_issue_order(make_skill, temp_dir):
+    """Deferred hook issues land after the validators and before the suggestions."""
+    skill_dir = _write_hook(make_skill("alpha-reader"), SUBPROCESS_HOOK)
+    skill_md = skill_dir / "SKILL.md"
+    skill_md.write_text(skill_md.read_text() + "\nThis is currently true.\n")
+    expected = [i.message for i in validate_skill(skill_dir, suggest=True).issues]
+    assert expected.index("from subprocess") < len(expected) - 1
+
+    for cache_dir in (None, temp_dir / "cache", temp_dir / "cache"):
+        results = validate_skills([skill_dir], suggest=True, jobs=1, cache_dir=cache_dir)
+        assert [i.message for i in results[0].issues] == expected
+
+
+def test_rule_registry_names_unique():
+    """Every registered rule has a distinct name."""
+    names = [rule.name for rule in RULES]
+    assert len(names) == len(set(names))
+
+
+def test_select_rules_filters():
+    """Suggestion, plugin-only, disabled and input filters apply."""
+    base = {rule.name for rule in select_rules()}
+    assert "argument-hint" not in base
+    assert "version-sync" in base
+    assert "argument-hint" in {rule.name for rule in select_rules(suggest=True)}
+    assert "version-sync" not in {rule.name for rule in select_rules(plugin=False)}
+    assert "name" not in {rule.name for rule in select_rules(disabled=frozenset({"name"}))}
+    plugin_rules = {rule.name for rule in select_rules(inputs={"plugin_json"})}
+    assert plugin_rules == {"plugin-json", "version-sync"}
+
+
+def test_validate_skill_disabled_rule(make_skill):
+    """Disabled rules report nothing."""
+    skill_dir = make_skill("pdf-reader")
+    skill_md = skill_dir / "SKILL.md"
+    skill_md.write_text(skill_md.read_text().replace('"1.0.0"', '"1.0.1"'))
+    assert not validate_skill(skill_dir).passed
+    assert validate_skill(skill_dir, disabled=frozenset({"version-sync"})).passed
+
+
+def test_validate_skills_profile(make_skill):
+    """Profiling records one call per applicable rule per skill, hooks included."""
+    paths = [make_skill("alpha-reader"), _write_hook(make_skill("beta-reader"), SUBPROCESS_HOOK)]
+    results = validate_skills(paths, jobs=2, profile=True)
+
+    assert results[0].profile.calls["name"] == 1
+    assert results[0].profile.calls["version-sync"] == 1
+    assert "hook" not in results[0].profile.calls
+    assert results[1].profile.calls["hook"] == 1
+    assert "argument-hint" not in results[0].profile.calls
+    assert "Rule" in results[0].profile.format()
+
+
+def _mismatched_skills(make_skill):
+    good = make_skill("alpha-reader")
+    bad = make_skill("beta-reader")
+    skill_md = bad / "SKILL.md"
+    skill_md.write_text(skill_md.read_text().replace('"1.0.0"', '"1.0.1"'))
+    return [good, bad]
+
+
+def test_iter_validate_skills_yields_every_index(make_skill):
+    """Streaming yields each input exactly once, tagged with its input position."""
+    paths = _mismatched_skills(make_skill)
+    seen = dict(iter_validate_skills(paths, jobs=2))
+    assert sorted(seen) == [0, 1]
+    assert seen[0].passed and not seen[1].passed
+    assert seen[1].issues[0].rule == "version-sync"
+
+
+def _write_all(writer_cls, results):
+    stream = io.StringIO()
+    writer = writer_cls(stream)
+    summary = RunSummary()
+    writer.start()
+    for result in results:
+        writer.write(result)
+        summary.add(result)
+    writer.finish(summary)
+    return stream.getvalue()
+
+
+def test_output_writer_requires_write():
+    """A writer that does not implement write() fails when constructed."""
+    class Incomplete(OutputWriter):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete(io.StringIO())
+
+
+def test_ndjson_writer(make_skill):
+    """Every line is standalone JSON; the last line summarizes the run."""
+    results = validate_skills(_mismatched_skills(make_skill))
+    lines = [json.loads(line) for line in _write_all(NdjsonWriter, results).splitlines()]
+    assert [line["type"] for line in lines] == ["result", "issue", "result", "summary"]
+    assert lines[1]["rule"] == "version-sync"
+    assert lines[-1]["failed"] == 1
+
+
+def test_json_writer(make_skill):
+    """Streamed JSON parses as one document."""
+    results = validate_skills(_mismatched_skills(make_skill))
+    data = json.loads(_write_all(JsonWriter, results))
+    assert [r["passed"] for r in data["results"]] == [True, False]
+    assert data["summary"]["errors"] == 1
+    assert json.loads(_write_all(JsonWriter, []))["results"] == []
+
+
+def test_sarif_writer(make_skill):
+    """SARIF output references registered rules and points at SKILL.md."""
+    results = validate_skills(_mismatched_skills(make_skill))
+    run = json.loads(_write_all(SarifWriter, results))["runs"][0]
+    assert {rule["id"] for rule in run["tool"]["driver"]["rules"]} == {r.name for r in RULES}
+    [sarif_result] = run["results"]
+    assert sarif_result["ruleId"] == "version-sync"
+    assert sarif_result["level"] == "error"
+    uri = sarif_result["locations"][0]["physicalLocation"]["artifactLocation"]["uri"]
+    assert uri.endswith("beta-reader/SKILL.md")
+
+
+def test_classify_change(temp_dir):
+    """Changed files map to the rule inputs they feed."""
+    skill = temp_dir / "pdf-reader"
+    plugin_json = temp_dir / "plugin.json"
+    assert classify_change(skill / "SKILL.md", skill, plugin_json) == {"frontmatter", "body"}
+    assert classify_change(skill / "references" / "api.md", skill) == {"references", "skill_dir"}
+    assert classify_change(skill / "scripts" / "run.py", skill) == {"skill_dir"}
+    assert classify_change(plugin_json, skill, plugin_json) == {"plugin_json"}
+    assert classify_change(temp_dir / "elsewhere.md", skill) == set()
+
+
+def test_merge_revalidation_replaces_rerun_rules(temp_dir):
+    """Only issues from re-run rules are replaced; registry order is kept."""
+    def issue(rule):
+        return ValidationIssue(Severity.WARNING, "x/SKILL.md", rule, rule, rule=rule)
+
+    previous = ValidationResult(temp_dir, "x", [issue("name"), issue("body-length")])
+    partial = ValidationResult(temp_dir, "x", [issue("script-paths")])
+    merged = merge_revalidation(previous, partial, {"body-length", "script-paths"})
+    assert [i.rule for i in merged.issues] == ["name", "script-paths"]
+
+
+def test_watch_skills_revalidates_on_change(make_skill):
+    """Fixing a version mismatch while watching produces a passing result."""
+    skill_dir = make_skill("pdf-reader")
+    skill_md = skill_dir / "SKILL.md"
+    good = skill_md.read_text()
+    skill_md.write_text(good.replace('"1.0.0"', '"1.0.1"'))
+
+    stream = io.StringIO()
+    watcher = threading.Thread(
+        target=watch_skills, args=([skill_dir], NdjsonWriter(stream)),
+        kwargs={"max_batches": 1, "debounce": 0.02}
+    )
+    watcher.start()
+    deadline = time.monotonic() + 5
+    while watcher.is_alive() and time.monotonic() < deadline:
+        time.sleep(0.1)
+        skill_md.write_text(good)
+    watcher.join(timeout=1)
+
+    results = [json.loads(line) for line in stream.getvalue().splitlines()]
+    results = [line for line in results if line["type"] == "result"]
+    assert [line["passed"] for line in results] == [False, True]
+
+
+def test_import_does_not_load_fs_watch():
+    """Only --watch needs the file watcher; importing the validator does not load it."""
+    shared = Path(__file__).resolve().parents[2] / "shared"
+    out = subprocess.run(
+        [sys.executable, "-c", "import sys, validate_skill; print('fs_watch' in sys.modules)"],
+        cwd=shared, capture_output=True, text=True, check=True
+    ).stdout
+    assert out.strip() == "False"
+
+
+def test_marketplace_index_shared_across_skills(make_skill, temp_dir, monkeypatch):
+    """A batch run parses marketplace.json once, and again only after it changes."""
+    paths = [make_skill("alpha-reader"), make_skill("beta-reader")]
+    loads = []
+    original = MarketplaceIndex.load.__func__
+    monkeypatch.setattr(MarketplaceIndex, "load", classmethod(
+        lambda cls, path: loads.append(path) or original(cls, path)
+    ))
+
+    assert all(result.passed for result in validate_skills(paths, jobs=1))
+    assert len(loads) == 1
+
+    marketplace = temp_dir / ".claude-plugin" / "marketplace.json"
+    data = json.loads(marketplace.read_text())
+    data["plugins"][1]["version"] = "2.0.0"
+    marketplace.write_text(json.dumps(data, indent=2))
+    results = validate_skills(paths, jobs=1)
+    assert len(loads) == 2
+    assert [result.passed for result in results] == [True, False]
+
+
+def test_marketplace_index_lookup(temp_dir):
+    """Entries are keyed by name; plugin.json is parsed once per change."""
+    marketplace = temp_dir / "marketplace.json"
+    marketplace.write_text(json.dumps({"plugins": [
+        {"name": "alpha", "version": "1.0.0"}, {"name": "beta", "version": "2.0.0"}
+    ]}))
+    plugin_json = temp_dir / "plugin.json"
+    plugin_json.write_text(json.dumps({"version": "2.0.0"}))
+
+    index = get_marketplace_index(marketplace)
+    assert index is get_marketplace_index(marketplace)
+    assert index.version("beta") == "2.0.0"
+    assert index.version("missing") is None
+    assert index.plugin_manifest(plugin_json) is index.plugin_manifest(plugin_json)
+
+    plugin_json.write_text("{not json")
+    assert index.plugin_manifest(plugin_json).error.startswith("Invalid JSON")
+
+
+def test_validate_plugin_json_invalid(temp_dir):
+    """Missing and malformed plugin.json files are reported."""
+    plugin_json = temp_dir / "plugin.json"
+    assert validate_plugin_json(plugin_json)[0].field == "file"
+    plugin_json.write_text("{not json")
+    assert validate_plugin_json(plugin_json)[0].field == "json"
+
+
+def test_validate_version_sync_uses_index(temp_dir):
+    """Version sync compares SKILL.md, plugin.json and the marketplace entry."""
+    marketplace = temp_dir / "marketplace.json"
+    marketplace.write_text(json.dumps({"plugins": [{"name": "alpha", "version": "1.0.0"}]}))
+    plugin_json = temp_dir / "plugin.json"
+    plugin_json.write_text(json.dumps({"version": "1.0.0"}))
+    index = MarketplaceIndex.load(marketplace)
+    frontmatter = {"metadata": {"version": "1.0.0"}}
+
+    args = (temp_dir / "SKILL.md", plugin_json, marketplace, "alpha", index)
+    assert validate_version_sync(frontmatter, *args) == []
+    [issue] = validate_version_sync({"metadata": {"version": "1.1.0"}}, *args)
+    assert "marketplace.json=1.0.0" in issue.message
+
+
+def test_frontmatter_issues_point_at_key_line(make_skill):
+    """Frontmatter rule issues carry the line of the key they are about."""
+    skill_dir = make_skill("pdf-reader", description="x" * 1100)
+    [issue] = [i for i in validate_skill(skill_dir).issues if i.field == "description"]
+    assert issue.line == 3
+    assert ":3 [description]" in str(issue)
+
+
+def test_block_scalar_description(make_skill):
+    """A `description: |` block is validated as its text, not as '|'."""
+    skill_dir = make_skill("pdf-reader")
+    skill_md = skill_dir / "SKILL.md"
+    skill_md.write_text(skill_md.read_text().replace(
+        "description: ", "description: |\n  " + "y" * 1100 + "\n  Use when: "
+    ))
+    doc = load_skill_document(skill_dir)
+    assert doc.frontmatter["description"].startswith("yyy")
+    assert not validate_skill(skill_dir).passed
+
+
+def test_reference_index_build():
+    """The index records sizes, lines, headings, links and the link graph."""
+    references = {
+        "references/api.md": "# API\n\nSee [guide](guide.md#setup) and [site](https://x.io).\n",
+        "references/guide.md": "# Guide\n## Setup\n\n```md\n[not a link](api.md)\n```\n",
+        "references/orphan.md": "# Orphan\n",
+    }
+    links = lex_markdown("Read [API](references/api.md).")
+    index = ReferenceIndex.build(references, [t for t in links if t.kind == "link"])
+
+    api = index.files["references/api.md"]
+    assert api.line_count == 4
+    assert api.size == len(references["references/api.md"])
+    assert [h.text for h in index.files["references/guide.md"].headings] == ["Guide", "Setup"]
+    assert index.graph["SKILL.md"] == ["references/api.md"]
+    assert index.graph["references/api.md"] == ["references/guide.md"]
+    assert index.graph["references/guide.md"] == []
+    assert index.inbound("references/guide.md") == ["references/api.md"]
+    assert index.reachable() == {"references/api.md", "references/guide.md"}
+
+
+def test_reference_file_outline_skips_code():
+    """Reference headings and links come from lex_markdown(), so fenced code is skipped."""
+    ref = ReferenceFile("references/a.md", (
+        "# Top\ntext [a](b.md)\n```\n# not\n[x](y.md)\n```\n"
+        "## Sub ##\n[c](d.md) [e](f.md)\n~~~\n[z](q.md)\n"
+    ))
+    assert [(t.text, t.line) for t in ref.headings] == [("Top", 1), ("Sub", 7)]
+    assert [t.info for t in ref.links] == ["b.md", "d.md", "f.md"]
+
+
+def test_resolve_link():
+    """Links resolve relative to their source file; external targets are skipped."""
+    assert resolve_link("references/a.md", "../scripts/run.py") == "scripts/run.py"
+    assert resolve_link("references/a.md", "b.md#part") == "references/b.md"
+    assert resolve_link("SKILL.md", "https://example.com") is None
+    assert resolve_link("SKILL.md", "#anchor") is None
+
+
+def test_reference_index_is_shared(temp_dir):
+    """Reference checks read one cached index per document."""
+    refs = temp_dir / "references"
+    refs.mkdir()
+    (refs / "long.md").write_text("\n".join(f"line {i}" for i in range(150)))
+    (refs / "nested.md").write_text("See [long](./long.md#top).\n")
+    doc = SkillDocument.from_text(temp_dir, "---\nname: x\n---\nBody\n")
+
+    assert doc.reference_index is doc.reference_index
+    toc = suggest_toc_for_long_references(doc, "x/SKILL.md")
+    nested = suggest_no_deeply_nested_references(doc, "x/SKILL.md")
+    assert ["long.md" in issue.message for issue in toc] == [True]
+    assert ["nested.md" in issue.message for issue in nested] == [True]